@@ -1,6 +1,7 @@
 # encoding: utf-8
 # isort:skip
 
+import importlib
 import os
 
 from sdsstools import get_config, get_package_version
@@ -16,5 +17,32 @@ config = get_config(
 
 OBSERVATORY = os.environ.get("OBSERVATORY", "UNKNOWN")
 
-from .camera import *
-from .lib import LibFLI
+
+# The camera and library classes are imported lazily (PEP 562), so that
+# importing the package or its command line interface does not load basecam
+# and astropy until they are needed.
+_LAZY_ATTRIBUTES = {
+    "FLICameraSystem": ".camera",
+    "FLICamera": ".camera",
+    "SessionMetadata": ".camera",
+    "DeviceHealth": ".camera",
+    "RecoveryStats": ".camera",
+    "SequenceResult": ".camera",
+    "FlushPolicy": ".camera",
+    "ExposureLatency": ".camera",
+    "LibFLI": ".lib",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
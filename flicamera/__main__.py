@@ -13,7 +13,7 @@ import logging
 import os
 import socket
 
-from typing import Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Union
 
 import click
 from click_default_group import DefaultGroup
@@ -23,9 +23,10 @@ from sdsstools._vendor.color_print import color_text
 from sdsstools.daemonizer import DaemonGroup, cli_coro
 
 from flicamera import NAME, __version__
-from flicamera.actor import FLIActor
-from flicamera.camera import FLICameraSystem
-from flicamera.mock import get_mock_camera_system
+
+
+if TYPE_CHECKING:
+    from flicamera.camera import FLICameraSystem
 
 
 log = get_logger(NAME)
@@ -40,12 +41,15 @@ class FLICameraWrapper(object):
 
         self.setup = setup
 
-        self.camera_system = None
+        self.camera_system: FLICameraSystem | None = None
 
     async def __aenter__(self):
         simulate_config = self.kwargs.pop("simulate_config", {})
+        hotplug = self.kwargs.pop("hotplug", False)
 
         if not simulate_config:
+            from flicamera.camera import FLICameraSystem
+
             config_path = self.kwargs.pop("config_path", None)
 
             self.camera_system = FLICameraSystem(*self.args, **self.kwargs)
@@ -58,11 +62,19 @@ class FLICameraWrapper(object):
                     f"Loading configuration file {config_path}"
                 )
 
-            await self.camera_system.start_camera_poller(interval=5)
+            if hotplug:
+                await self.camera_system.start_hotplug_monitor(fallback_interval=5)
+            else:
+                await self.camera_system.start_camera_poller(interval=5)
             await asyncio.sleep(0.1)  # Some time to allow camera to connect.
         else:
+            # The mock module imports the simulation stack (photutils and
+            # astropy.modeling), so it is only imported in simulation mode.
+            from flicamera.mock import get_mock_camera_system
+
             self.camera_system = await get_mock_camera_system(
                 camera_config=self.kwargs["camera_config"],
+                process_isolation=self.kwargs.get("process_isolation", False),
                 **simulate_config,
             )
 
@@ -112,6 +124,18 @@ class FLICameraWrapper(object):
     default="default",
     help="Profile to use for the simulation mode.",
 )
+@click.option(
+    "--hotplug",
+    is_flag=True,
+    show_envvar=True,
+    help="Detect cameras using USB hotplug events instead of polling.",
+)
+@click.option(
+    "--process-isolation",
+    is_flag=True,
+    show_envvar=True,
+    help="Run each camera device in its own process.",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -120,7 +144,16 @@ class FLICameraWrapper(object):
     help="Output extra information to stdout.",
 )
 @click.pass_context
-def flicamera(ctx, cameras, config_path, simulate, simulation_profile, verbose):
+def flicamera(
+    ctx,
+    cameras,
+    config_path,
+    simulate,
+    simulation_profile,
+    hotplug,
+    process_isolation,
+    verbose,
+):
     """Command Line Interface for Finger Lakes Instrumentation cameras."""
 
     if verbose:
@@ -173,6 +206,8 @@ def flicamera(ctx, cameras, config_path, simulate, simulation_profile, verbose):
         verbose=verbose,
         config_path=config_path,
         simulate_config=simulate_config,
+        hotplug=hotplug,
+        process_isolation=process_isolation,
         setup=True,
     )
 
@@ -231,6 +266,8 @@ async def actor(obj, host, port, actor_name):
     if obj["cameras"]:
         actor_params.update({"default_cameras": list(obj["cameras"])})
 
+    from flicamera.actor import FLIActor
+
     camera_system = obj["camera_system"]
 
     # For the actor we prefer setup be run in FLIActor.start(). That way some
@@ -271,12 +308,45 @@ async def status(obj):
 @click.argument("EXPTIME", default=1, type=float, required=False)
 @click.argument("OUTFILE", type=click.Path(dir_okay=False), required=False)
 @click.option("--overwrite", is_flag=True, help="Overwrite existing images.")
+@click.option(
+    "-c",
+    "--count",
+    type=int,
+    default=1,
+    help="Number of exposures to take as a sequence.",
+)
+@click.option(
+    "-i",
+    "--interval",
+    type=float,
+    default=0.0,
+    help="Minimum time between the start of exposures in a sequence.",
+)
 @click.pass_obj
 @cli_coro()
-async def expose(obj, exptime, outfile, overwrite):
+async def expose(obj, exptime, outfile, overwrite, count, interval):
     """Returns the status of the connected cameras."""
 
+    if count > 1 and outfile:
+        raise click.UsageError("OUTFILE cannot be used with --count.")
+
     async with obj["camera_system"] as fli:
+        if count > 1:
+            log.debug(f"starting sequence of {count} exposures ... ")
+            results = await asyncio.gather(
+                *[
+                    camera.expose_sequence(exptime, count, interval=interval)
+                    for camera in fli.cameras
+                ],
+                return_exceptions=False,
+            )
+            for camera, result in zip(fli.cameras, results):
+                print(
+                    f"{camera.name}: {result.count} exposures in {result.elapsed} s "
+                    f"(cadence {result.cadence} s, dead time {result.dead_time} s)."
+                )
+            return
+
         log.debug("starting camera exposure ... ")
         exposures = await asyncio.gather(
             *[camera.expose(exptime) for camera in fli.cameras],
@@ -18,6 +18,7 @@ from basecam.events import CameraEvent, CameraSystemEvent
 from clu import Command
 from clu.legacy import TronConnection
 
+import flicamera.commands  # noqa: F401  # Registers the actor commands.
 from flicamera import OBSERVATORY
 from flicamera.camera import FLICamera, FLICameraSystem
 from flicamera.lib import FLIWarning
@@ -140,3 +141,39 @@ class FLIActor(CameraActor):
         elif event == CameraEvent.CAMERA_DISCONNECTED:
             name = payload["name"]
             self.write("i", text=f"Camera disconnected: {name}")
+        elif event == CameraEvent.EXPOSURE_READ and "frame_ring" in payload:
+            self.write(
+                "i",
+                frame_slot=[
+                    payload["name"],
+                    payload["frame_ring"],
+                    payload["slot"],
+                    payload["sequence"],
+                ],
+            )
+        elif (
+            event == CameraEvent.EXPOSURE_POST_PROCESS_DONE and "frame_stats" in payload
+        ):
+            self.write(
+                "i",
+                frame_stats={
+                    "camera": payload["name"],
+                    **payload["frame_stats"],
+                },
+            )
+        elif event == CameraEvent.EXPOSURE_POST_PROCESS_DONE and "sources" in payload:
+            self.write(
+                "i",
+                sources={
+                    "camera": payload["name"],
+                    **payload["sources"],
+                },
+            )
+        elif event == CameraEvent.EXPOSURE_POST_PROCESS_DONE and "centroids" in payload:
+            self.write(
+                "i",
+                fvc_centroids={
+                    "camera": payload["name"],
+                    **payload["centroids"],
+                },
+            )
@@ -9,15 +9,35 @@
 from __future__ import annotations
 
 import asyncio
+import enum
+import errno
+import os
 import pathlib
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
-from dataclasses import dataclass
-
-from typing import Any, Dict, List, Optional, Tuple, Type
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from logging import INFO, WARNING
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import astropy.time
+import numpy
 from astropy.io import fits
 
 from basecam import BaseCamera, CameraEvent, CameraSystem, Exposure
@@ -27,11 +47,35 @@ from sdsstools.time import get_sjd
 
 from flicamera import OBSERVATORY, config
 from flicamera import __version__ as flicamera_version
+from flicamera.hotplug import HotplugEventSource, HotplugMonitor
 from flicamera.lib import FLIError, FLIWarning, LibFLI, LibFLIDevice
 from flicamera.model import flicamera_model
+from flicamera.process import LibFactory, ProcessDevice
+from flicamera.publisher import FramePublisher
+from flicamera.scheduler import DEFAULT_BUS, ReadoutScheduler, get_usb_bus
+from flicamera.stacking import REDUCERS, Stacker, get_reducer
+from flicamera.stats import FrameStats, get_frame_stats
+from flicamera.video import VideoStream
+from flicamera.worker import DeviceWorker, Priority
+
+
+if TYPE_CHECKING:
+    from flicamera.focus import FocusSweepResult
+
 
+T = TypeVar("T")
 
-__all__ = ["FLICameraSystem", "FLICamera", "SessionMetadata"]
+
+__all__ = [
+    "FLICameraSystem",
+    "FLICamera",
+    "SessionMetadata",
+    "DeviceHealth",
+    "RecoveryStats",
+    "SequenceResult",
+    "FlushPolicy",
+    "ExposureLatency",
+]
 
 
 @dataclass
@@ -43,11 +87,100 @@ class SessionMetadata:
     last_exposure: pathlib.Path | None = None
 
 
+class DeviceHealth(enum.Enum):
+    """The health state of the device handled by a `.FLICamera`.
+
+    A device starts ``OK``. A disconnect or transient error from libfli moves it to
+    ``RECOVERING`` while the device is reopened. If the device cannot be reopened
+    it ends ``DISCONNECTED`` and the camera is removed from the camera system.
+
+    """
+
+    OK = "ok"
+    RECOVERING = "recovering"
+    DISCONNECTED = "disconnected"
+
+
+@dataclass
+class RecoveryStats:
+    """Counters of device errors and recoveries for a camera."""
+
+    n_errors: int = 0
+    n_recoveries: int = 0
+    n_failed_recoveries: int = 0
+    n_exposure_retries: int = 0
+    last_error: str | None = None
+    last_recovery_time: float | None = None
+
+
+@dataclass
+class SequenceResult:
+    """The result of `.FLICamera.expose_sequence`.
+
+    ``cadence`` is the mean time between the start of consecutive exposures and
+    ``dead_time`` the part of it not spent integrating. Both are `None` for a
+    single exposure. ``exposures`` is only populated if the sequence was not
+    written to disk.
+
+    """
+
+    count: int
+    exptime: float
+    interval: float
+    elapsed: float = 0.0
+    cadence: float | None = None
+    dead_time: float | None = None
+    filenames: List[str] = field(default_factory=list)
+    exposures: List[Exposure] = field(default_factory=list)
+
+
+@dataclass
+class FlushPolicy:
+    """How the CCD is flushed before an exposure.
+
+    Read from the ``flush`` camera parameter. The defaults match libfli.
+    ``background`` controls whether the camera flushes the array while it is
+    idle. ``nflushes`` is the number of times the array is flushed before each
+    exposure, which delays its start. Exposures shorter than ``short_exptime``
+    (for example, guide frames) use ``short_nflushes`` instead.
+
+    """
+
+    background: bool = True
+    nflushes: int = 0
+    short_exptime: float = 0.0
+    short_nflushes: int = 0
+
+    def get_nflushes(self, exptime: float) -> int:
+        """Returns the number of flushes for an exposure."""
+
+        if exptime < self.short_exptime:
+            return self.short_nflushes
+
+        return self.nflushes
+
+
+@dataclass
+class ExposureLatency:
+    """Time, in seconds, from ``FLIExposeFrame`` to the start of the integration.
+
+    See `.FLICamera.measure_exposure_latency`.
+
+    """
+
+    policy: FlushPolicy
+    exptime: float
+    samples: List[float] = field(default_factory=list)
+    mean: float = 0.0
+    minimum: float = 0.0
+    maximum: float = 0.0
+
+
 class FLICamera(BaseCamera, ExposureTypeMixIn, CoolerMixIn, ImageAreaMixIn):
     """A FLI camera."""
 
     camera_system: FLICameraSystem
-    _device: LibFLIDevice
+    _device: LibFLIDevice | ProcessDevice
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -63,6 +196,32 @@ class FLICamera(BaseCamera, ExposureTypeMixIn, CoolerMixIn, ImageAreaMixIn):
 
         self.session_metadata: SessionMetadata | None = None
 
+        self.health = DeviceHealth.OK
+        self.recovery_stats = RecoveryStats()
+        self._recovery_task: asyncio.Task[bool] | None = None
+
+        # All the calls to the device go through the worker.
+        self.worker = DeviceWorker(self.name)
+
+        self._status_snapshot: Dict[str, Any] | None = None
+        self._status_task: asyncio.Task | None = None
+        self._probe_task: asyncio.Task | None = None
+
+        self.frame_publisher: FramePublisher | None = None
+
+        self.flush_policy = FlushPolicy(**self.camera_params.get("flush", {}))
+
+        # Bit depth of the frames. If the camera does not support 8-bit readout,
+        # the frames are read in 16 bits and shifted by bit_depth_shift.
+        self.bit_depth: int = self.camera_params.get("bit_depth", 16)
+        self.bit_depth_shift: int = self.camera_params.get("bit_depth_shift", 8)
+
+        #: The active video stream, if any.
+        self.video_stream: VideoStream | None = None
+
+        # The number of frames of the stack being exposed by a Stacker.
+        self._n_stack: int | None = None
+
         self.fits_model = flicamera_model
         if self.name.startswith("fvc"):
             self.fits_model[0].compressed = "RICE_1"
@@ -78,13 +237,19 @@ class FLICamera(BaseCamera, ExposureTypeMixIn, CoolerMixIn, ImageAreaMixIn):
         if serial is None:
             raise CameraConnectionError("unknown serial number.")
 
-        _device = self.camera_system.lib.get_camera(serial)
+        self.worker.start()
+
+        _device = await self.worker.call(self._open_device, serial)
 
         if _device is None:
+            await self.worker.stop()
             raise CameraConnectionError(f"cannot find camera with serial {serial}.")
 
         self._device = _device
 
+        await self._call(self._setup_flushing)
+        await self.update_status()
+
         temp_setpoint = self.camera_params.get("temperature_setpoint", False)
         if temp_setpoint:
             asyncio.create_task(self.set_temperature(temp_setpoint))
@@ -94,28 +259,91 @@ class FLICamera(BaseCamera, ExposureTypeMixIn, CoolerMixIn, ImageAreaMixIn):
             self.log(f"Setting image area to {area}")
             asyncio.create_task(self.set_image_area(area))
 
-    def _status_internal(self) -> Dict[str, Any] | None:
-        """Gets a dictionary with the status of the camera.
+        if self.bit_depth != 16:
+            await self.set_bit_depth(self.bit_depth)
+
+        readout_mode = self.camera_params.get("readout_mode", None)
+        if readout_mode is not None:
+            self.log(f"Setting readout mode to {readout_mode!r}")
+            try:
+                await self.set_readout_mode(readout_mode)
+            except (ValueError, FLIError) as err:
+                self.log(f"Failed setting readout mode: {err}", WARNING)
+
+        # The information that is not needed to expose is read once the camera
+        # has been reported as connected.
+        if not self._device.is_probed:
+            self._probe_task = asyncio.create_task(self._probe_device())
+
+    async def _probe_device(self):
+        """Reads the rest of the device information and updates the status."""
+
+        try:
+            await self._call(self._device.probe, priority=Priority.STATUS)
+            await self.update_status()
+        except FLIError as err:
+            self.log(f"Failed probing device: {err}", WARNING)
+
+    def _open_device(self, serial: str) -> LibFLIDevice | ProcessDevice | None:
+        """Opens the device. Runs in the device worker.
+
+        In process isolation mode the device is opened by a new device process.
+        The device is not probed (see `.LibFLIDevice.open`); that is done after
+        the camera is connected.
 
-        Returns
-        -------
-        status
-            A dictionary with status values from the camera (e.g.,
-            temperature, cooling status, firmware information, etc.)
         """
 
-        device = self._device
+        if not self.camera_system.process_isolation:
+            assert self.camera_system.lib
+            return self.camera_system.lib.get_camera(serial, probe=False)
+
+        assert self.camera_system.lib_factory
+
+        device = ProcessDevice(
+            serial,
+            self.camera_system.lib_factory,
+            timeout=self.camera_params.get("process_timeout", 60.0),
+        )
 
         try:
-            device._update_temperature()
+            device.open(probe=False)
         except FLIError as err:
-            if "No such device" in str(err):
-                warnings.warn("Camera disconnected", FLIWarning)
-                asyncio.create_task(self.camera_system.remove_camera(uid=self.uid))
-                return None
-            raise
-        except Exception:
-            raise
+            self.log(f"Failed opening device in device process: {err}", WARNING)
+            return None
+
+        return device
+
+    @property
+    def usb_bus(self) -> str:
+        """The USB bus of the device, used to schedule the readouts.
+
+        Can be set with the ``usb_bus`` camera parameter. Otherwise it is
+        determined from the device path.
+
+        """
+
+        bus = self.camera_params.get("usb_bus", None)
+        if bus is None and getattr(self, "_device", None) is not None:
+            bus = get_usb_bus(self._device.name)
+
+        return DEFAULT_BUS if bus is None else str(bus)
+
+    async def _call(
+        self,
+        func: Callable[..., T],
+        *args,
+        priority: Priority = Priority.CONTROL,
+        **kwargs,
+    ) -> T:
+        """Runs a blocking device call in the device worker."""
+
+        return await self.worker.call(func, *args, priority=priority, **kwargs)
+
+    def _read_status(self) -> Dict[str, Any]:
+        """Reads the status from the device. Runs in the device worker."""
+
+        device = self._device
+        device._update_temperature()
 
         return dict(
             model=device.model,
@@ -130,10 +358,292 @@ class FLICamera(BaseCamera, ExposureTypeMixIn, CoolerMixIn, ImageAreaMixIn):
             temperature_base=device._temperature["base"],
             exposure_time_left=device.get_exposure_time_left(),
             cooler_power=device.get_cooler_power(),
+            readout_mode=device.readout_mode_name,
+            usb_bus=self.usb_bus,
+        )
+
+    async def _refresh_status(self):
+        """Updates the status snapshot from the device."""
+
+        try:
+            self._status_snapshot = await self._call(
+                self._read_status,
+                priority=Priority.STATUS,
+            )
+        except FLIError as err:
+            self._status_snapshot = None
+            if err.is_disconnect or err.is_transient:
+                if err.is_disconnect:
+                    warnings.warn("Camera disconnected", FLIWarning)
+                await self._handle_device_error(err)
+                return
+            raise
+
+    def _compose_status(self) -> Dict[str, Any] | None:
+        """Returns the last status snapshot along with the device health."""
+
+        if self.health != DeviceHealth.OK:
+            return dict(health=self.health.value, **asdict(self.recovery_stats))
+
+        if self._status_snapshot is None:
+            return None
+
+        return dict(
+            **self._status_snapshot,
+            health=self.health.value,
+            n_recoveries=self.recovery_stats.n_recoveries,
+            n_exposure_retries=self.recovery_stats.n_exposure_retries,
+            last_recovery_time=self.recovery_stats.last_recovery_time,
+        )
+
+    async def update_status(self) -> Dict[str, Any] | None:
+        """Reads the status from the device and returns it.
+
+        This is the non-blocking equivalent of ``get_status(update=True)``.
+
+        """
+
+        await self._refresh_status()
+
+        self._status = self._compose_status() or {}
+
+        return self._compose_status()
+
+    def _status_internal(self) -> Dict[str, Any] | None:
+        """Gets a dictionary with the status of the camera.
+
+        Device calls cannot be made from the event loop, so this returns the
+        last status read by the device worker (see `.update_status`) and
+        schedules a new read.
+
+        Returns
+        -------
+        status
+            A dictionary with status values from the camera (e.g.,
+            temperature, cooling status, firmware information, etc.)
+        """
+
+        if self.health == DeviceHealth.OK and self.worker.running:
+            if self._status_task is None or self._status_task.done():
+                self._status_task = asyncio.create_task(self._refresh_status())
+
+        return self._compose_status()
+
+    def _get_trim_slice(self) -> Tuple[slice, slice] | None:
+        """Returns the slice of the image to keep, if ``trim`` is set."""
+
+        trim_region = self.camera_params.get("trim", None)
+        if trim_region is None:
+            return None
+
+        return (slice(*trim_region[0]), slice(*trim_region[1]))
+
+    async def publish_frame(self, exposure: Exposure):
+        """Publishes the frame and its header to a shared memory ring.
+
+        The ring is a `.FramePublisher` named ``flicamera-<camera name>`` with
+        ``publish_slots`` slots (camera parameter, defaults to 4). It is created
+        with the first frame and recreated if a larger frame is published. The
+        header is built and the frame copied to the ring in an executor. The
+        slot is announced with an ``EXPOSURE_READ`` event.
+
+        """
+
+        assert exposure.data is not None
+
+        loop = asyncio.get_running_loop()
+        slot, sequence = await loop.run_in_executor(
+            None,
+            self._publish_frame,
+            exposure,
+        )
+
+        assert self.frame_publisher is not None
+
+        self.notify(
+            CameraEvent.EXPOSURE_READ,
+            {
+                "frame_ring": self.frame_publisher.name,
+                "slot": slot,
+                "sequence": sequence,
+            },
+        )
+
+    def _publish_frame(self, exposure: Exposure) -> Tuple[int, int]:
+        """Copies the frame to the ring. Returns the slot and sequence number."""
+
+        assert exposure.data is not None
+
+        data = exposure.data
+        trim_slice = self._get_trim_slice()
+        if trim_slice is not None:
+            data = data[trim_slice]
+
+        publisher = self.frame_publisher
+        if publisher is None or data.nbytes > publisher.data_size:
+            if publisher is not None:
+                publisher.close()
+            publisher = self.frame_publisher = FramePublisher(
+                f"flicamera-{self.name}",
+                data.nbytes,
+                n_slots=self.camera_params.get("publish_slots", 4),
+            )
+
+        header: Dict[str, Any] = {}
+        if exposure.fits_model:
+            fits_model = exposure.fits_model
+            header_model = fits_model[0].header_model
+            fits_header = header_model.to_header(exposure, context=fits_model.context)
+            for card in fits_header.cards:
+                if card.keyword and card.keyword not in ["COMMENT", "HISTORY"]:
+                    header[card.keyword] = card.value
+
+        return publisher.publish(data, header)
+
+    async def compute_frame_stats(self, exposure: Exposure) -> FrameStats:
+        """Calculates the statistics of the frame of an exposure.
+
+        The statistics (see `.get_frame_stats`) are stored as
+        ``exposure.frame_stats``, from which the header cards are created, and
+        announced with an ``EXPOSURE_POST_PROCESS_DONE`` event. Pixels at or
+        above the ``saturation`` camera parameter are counted as saturated.
+
+        """
+
+        assert exposure.data is not None
+
+        stats = await asyncio.get_running_loop().run_in_executor(
+            None,
+            get_frame_stats,
+            exposure.data,
+            self.camera_params.get("saturation", None),
+        )
+
+        exposure.frame_stats = stats  # type: ignore
+
+        self.notify(
+            CameraEvent.EXPOSURE_POST_PROCESS_DONE,
+            {"frame_stats": asdict(stats)},
+        )
+
+        return stats
+
+    async def find_sources(self, exposure: Exposure) -> numpy.ndarray:
+        """Detects and centroids the sources in the frame of an exposure.
+
+        Uses `.extract_sources` with the options in the ``sources`` camera
+        parameter. The source table is stored as ``exposure.sources``, added to
+        the exposure as a ``SOURCES`` binary table HDU, and announced with an
+        ``EXPOSURE_POST_PROCESS_DONE`` event.
+
+        """
+
+        from flicamera.sources import extract_sources
+
+        assert exposure.data is not None
+
+        options: Dict[str, Any] = {"max_sources": 50}
+        options.update(self.camera_params.get("sources", {}))
+
+        sources = await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(extract_sources, exposure.data, **options),
+        )
+
+        exposure.sources = sources  # type: ignore
+
+        hdu = fits.BinTableHDU(sources, name="SOURCES")
+        hdu.header["COMMENT"] = "Zero-indexed centroids of the detected sources"
+        exposure.add_hdu(hdu)
+
+        self.notify(
+            CameraEvent.EXPOSURE_POST_PROCESS_DONE,
+            {
+                "sources": {
+                    "n_sources": len(sources),
+                    "x": [round(float(value), 2) for value in sources["x"]],
+                    "y": [round(float(value), 2) for value in sources["y"]],
+                    "flux": [round(float(value), 1) for value in sources["flux"]],
+                    "fwhm": [round(float(value), 2) for value in sources["fwhm"]],
+                }
+            },
+        )
+
+        return sources
+
+    async def find_centroids(self, exposure: Exposure) -> numpy.ndarray:
+        """Detects and centroids the fibres and fiducials in an FVC frame.
+
+        The frame is processed in parallel tiles with `.extract_sources_tiled`,
+        using the options in the ``centroids`` camera parameter. The catalogue
+        is stored as ``exposure.centroids`` and added to the exposure as a
+        ``CENTROIDS`` binary table HDU. It is also written, before the image,
+        to a ``-centroids.fits`` file next to it, which is announced with an
+        ``EXPOSURE_POST_PROCESS_DONE`` event.
+
+        """
+
+        from flicamera.sources import extract_sources_tiled
+
+        assert exposure.data is not None and exposure.filename is not None
+
+        options: Dict[str, Any] = {"threshold": 10.0, "smoothing": 1.0}
+        options.update(self.camera_params.get("centroids", {}))
+
+        loop = asyncio.get_running_loop()
+
+        centroids = await loop.run_in_executor(
+            None,
+            partial(extract_sources_tiled, exposure.data, **options),
+        )
+
+        exposure.centroids = centroids  # type: ignore
+
+        hdu = fits.BinTableHDU(centroids, name="CENTROIDS")
+        hdu.header["COMMENT"] = "Zero-indexed centroids of the fibres and fiducials"
+        exposure.add_hdu(hdu)
+
+        path = pathlib.Path(exposure.filename)
+        filename = str(path.parent / f"{path.name.split('.')[0]}-centroids.fits")
+
+        def write_centroids():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            hdu.writeto(filename, overwrite=True)
+
+        await loop.run_in_executor(None, write_centroids)
+
+        self.notify(
+            CameraEvent.EXPOSURE_POST_PROCESS_DONE,
+            {
+                "centroids": {
+                    "n_centroids": len(centroids),
+                    "filename": os.path.realpath(filename),
+                }
+            },
         )
 
+        return centroids
+
     async def _post_process_internal(self, exposure: Exposure, **kwargs) -> Exposure:
-        """Post-processes the image. Creates a snapshot image."""
+        """Post-processes the image. Creates a snapshot image.
+
+        If the ``publish_frames`` camera parameter is set, the frame is published
+        to shared memory (see `.publish_frame`) before anything else. The
+        statistics of the trimmed frame are calculated unless the ``frame_stats``
+        camera parameter is `False`. Sources are extracted if the
+        ``extract_sources`` camera parameter is set and centroids if
+        ``extract_centroids`` is set.
+
+        """
+
+        if (
+            self.camera_params.get("publish_frames", False)
+            and exposure.data is not None
+        ):
+            try:
+                await self.publish_frame(exposure)
+            except Exception as err:
+                warnings.warn(f"Failed publishing frame: {err}", FLIWarning)
 
         write_snapshot: bool = self.camera_params.get("write_snapshot", True)
 
@@ -152,13 +662,29 @@ class FLICamera(BaseCamera, ExposureTypeMixIn, CoolerMixIn, ImageAreaMixIn):
                 warnings.warn(f"Failed writing snapshot to disk: {err}", FLIWarning)
 
         # Trim image
-        if (
-            exposure.data is not None
-            and self.camera_params.get("trim", None) is not None
-        ):
-            trim_region = self.camera_params["trim"]
-            trim_slice = [slice(*trim_region[0]), slice(*trim_region[1])]
-            exposure.data = exposure.data[trim_slice[0], trim_slice[1]]
+        trim_slice = self._get_trim_slice()
+        if exposure.data is not None and trim_slice is not None:
+            exposure.data = exposure.data[trim_slice]
+
+        if exposure.data is not None and self.camera_params.get("frame_stats", True):
+            try:
+                await self.compute_frame_stats(exposure)
+            except Exception as err:
+                warnings.warn(f"Failed computing frame statistics: {err}", FLIWarning)
+
+        extract = self.camera_params.get("extract_sources", False)
+        if exposure.data is not None and extract:
+            try:
+                await self.find_sources(exposure)
+            except Exception as err:
+                warnings.warn(f"Failed extracting sources: {err}", FLIWarning)
+
+        centroids = self.camera_params.get("extract_centroids", False)
+        if exposure.data is not None and centroids:
+            try:
+                await self.find_centroids(exposure)
+            except Exception as err:
+                warnings.warn(f"Failed extracting centroids: {err}", FLIWarning)
 
         # Find calibration images
         current_mjd = get_sjd(self.observatory.upper())
@@ -203,110 +729,1046 @@ class FLICamera(BaseCamera, ExposureTypeMixIn, CoolerMixIn, ImageAreaMixIn):
 
         return exposure
 
-    async def _expose_internal(self, exposure: Exposure, **kwargs) -> Exposure:
-        """Internal method to handle camera exposures."""
+    async def _handle_device_error(self, err: FLIError) -> bool:
+        """Records a device error and tries to recover from it.
 
-        if exposure.exptime is None:
-            raise ExposureError("Exposure time not set.")
+        Returns `True` if the device was recovered. If the error indicates that
+        the device is gone and it cannot be reopened, the camera is removed.
 
-        TIMEOUT = 5
+        """
 
-        device = self._device
+        self.recovery_stats.n_errors += 1
+        self.recovery_stats.last_error = str(err)
 
-        device.cancel_exposure()
+        if not (err.is_disconnect or err.is_transient):
+            return False
 
-        device.set_exposure_time(exposure.exptime)
+        recovered = await self.recover()
 
-        image_type = exposure.image_type
-        frametype = "dark" if image_type in ["dark", "bias"] else "normal"
+        if not recovered and err.is_disconnect:
+            try:
+                await self.camera_system.remove_camera(uid=self.uid)
+            except ValueError:
+                pass  # Already removed.
 
-        device.start_exposure(frametype)
+        return recovered
 
-        exposure.obstime = astropy.time.Time.now()
+    async def recover(self) -> bool:
+        """Reopens the device after a disconnect or transient error.
 
-        start_time = time.time()
+        Uses the ``recovery_attempts`` (default 3) and ``recovery_delay`` (default
+        1 s) camera parameters. Binning and image area are restored after the
+        device is reopened. Concurrent calls wait for the same recovery.
 
-        time_left = exposure.exptime
+        Returns
+        -------
+        recovered
+            `True` if the device was reopened.
 
-        while True:
-            await asyncio.sleep(time_left)
+        """
 
-            time_left = device.get_exposure_time_left() / 1000.0
+        if self._recovery_task is None or self._recovery_task.done():
+            self._recovery_task = asyncio.create_task(self._recover())
 
-            if time_left == 0:
-                self.notify(CameraEvent.EXPOSURE_READING)
-                array = await self.loop.run_in_executor(None, device.read_frame)
-                exposure.data = array
-                return exposure
+        return await self._recovery_task
 
-            if time.time() - start_time > exposure.exptime + TIMEOUT:
-                raise ExposureError("timeout while waiting for exposure to finish.")
+    async def _recover(self) -> bool:
+        """Recovers the device. See `.recover`."""
 
-    async def _get_temperature_internal(self) -> float:
-        """Internal method to get the camera temperature."""
+        attempts: int = self.camera_params.get("recovery_attempts", 3)
+        delay: float = self.camera_params.get("recovery_delay", 1.0)
 
-        self._device._update_temperature()
-        return self._device._temperature["CCD"]
+        self.health = DeviceHealth.RECOVERING
 
-    async def _set_temperature_internal(self, temperature: float):
-        """Internal method to set the camera temperature."""
+        device = self._device
+        hbin, vbin, area = device.hbin, device.vbin, device.area
+        readout_mode = device.readout_mode
 
-        self._device.set_temperature(temperature)
+        start_time = time.time()
 
-    async def _get_image_area_internal(self) -> Tuple[int, int, int, int]:
-        """Internal method to return the image area."""
+        for attempt in range(1, attempts + 1):
+            try:
+                await self._call(
+                    self._reopen_device,
+                    hbin,
+                    vbin,
+                    area,
+                    readout_mode=readout_mode,
+                )
+                break
+            except FLIError as err:
+                self.log(
+                    f"Recovery attempt {attempt}/{attempts} failed: {err}",
+                    WARNING,
+                )
+                if attempt < attempts:
+                    await asyncio.sleep(delay)
+        else:
+            self.health = DeviceHealth.DISCONNECTED
+            self.recovery_stats.n_failed_recoveries += 1
+            self.log("Failed to recover device.", WARNING)
+            return False
 
-        area = self._device.area
+        recovery_time = round(time.time() - start_time, 3)
 
-        # Convert from (ul_x, ul_y, lr_x, lr_y) to (x0, x1, y0, y1)
-        area = (area[0], area[2], area[1], area[3])
+        self.health = DeviceHealth.OK
+        self.recovery_stats.n_recoveries += 1
+        self.recovery_stats.last_recovery_time = recovery_time
 
-        return area
+        self.log(
+            f"Device recovered in {recovery_time} s after {attempt} attempt(s).",
+            INFO,
+        )
 
-    async def _set_image_area_internal(
+        return True
+
+    def _reopen_device(
         self,
-        area: Optional[Tuple[int, int, int, int]] = None,
+        hbin: int,
+        vbin: int,
+        area: Tuple[int, int, int, int],
+        readout_mode: int | None = None,
     ):
-        """Internal method to set the image area."""
+        """Closes and reopens the device and restores binning, image area and
+        readout mode.
 
-        if area:
-            # Convert from (x0, x1, y0, y1) to (ul_x, ul_y, lr_x, lr_y)
-            area = (area[0], area[2], area[1], area[3])
+        If the device cannot be opened because it is no longer present in the
+        same device path (e.g., it was replugged), looks it up by serial. In
+        process isolation mode the device process is restarted. Runs in the
+        device worker.
 
-        self._device.set_image_area(area)
+        """
 
-    async def _get_binning_internal(self) -> Tuple[int, int]:
-        """Internal method to return the binning."""
+        assert self.camera_system.lib
 
-        return (self._device.hbin, self._device.vbin)
+        device = self._device
+        serial = device.serial
 
-    async def _set_binning_internal(self, hbin, vbin):
-        """Internal method to set the binning."""
+        try:
+            device.close()
+        except FLIError:
+            pass  # The handle may already be invalid.
 
-        self._device.set_binning(hbin, vbin)
+        try:
+            device.open()
+        except FLIError as err:
+            if not err.is_disconnect or isinstance(device, ProcessDevice):
+                raise
 
-    async def _disconnect_internal(self) -> bool:
-        """Disconnects the camera."""
+            new_device = self.camera_system.lib.get_camera(serial)
+            if new_device is None or new_device is device:
+                raise
 
-        self._device.disconnect()
+            device.is_open = False
+            LibFLIDevice._instances.pop(device.name, None)
 
-        return True
+            self._device = new_device
+
+        self._device.set_binning(hbin, vbin)
+        self._device.set_image_area(area)
+
+        self._setup_flushing()
+
+        if self.bit_depth == 8:
+            try:
+                self._device.set_bit_depth(8)
+            except FLIError:
+                pass
+
+        if readout_mode is not None and readout_mode != self._device.readout_mode:
+            self._device.set_readout_mode(readout_mode)
+
+    async def expose(
+        self,
+        exptime: float,
+        image_type: str = "object",
+        stack: int = 1,
+        stack_function: Callable[..., numpy.ndarray] | str = numpy.median,
+        **kwargs,
+    ) -> Exposure:
+        """Exposes the camera. See `~basecam.camera.BaseCamera.expose`.
+
+        If ``stack > 1`` and ``stack_function`` is the name of one of the
+        reducers of `.Stacker` (``mean``, ``sum``, ``median``, ``sigclip``),
+        each frame is added to the stack as soon as it is read, with bounded
+        memory, and only the stack is post-processed and written. Note that the
+        ``median`` reducer is approximate. Stack functions passed as callables,
+        including the default `numpy.median`, use the exact stacking of basecam.
+
+        """
+
+        if isinstance(stack_function, str):
+            reducer = get_reducer(stack_function)
+            assert reducer is not None
+            stack_function = REDUCERS[reducer]
+        else:
+            reducer = None
+
+        if stack <= 1 or reducer is None:
+            return await super().expose(
+                exptime,
+                image_type=image_type,
+                stack=stack,
+                stack_function=stack_function,
+                **kwargs,
+            )
+
+        write: bool = kwargs.pop("write", False)
+        postprocess: bool = kwargs.pop("postprocess", True)
+
+        stacker = Stacker(stack, reducer, **self.camera_params.get("stacking", {}))
+
+        # basecam exposes a single frame, so the stack size of its events is
+        # corrected in notify.
+        self._n_stack = stack
+        try:
+            exposure = await super().expose(
+                exptime,
+                image_type=image_type,
+                write=False,
+                postprocess=False,
+                stacker=stacker,
+                **kwargs,
+            )
+        finally:
+            self._n_stack = None
+
+        exposure.exptime_n = exposure.exptime * stack if exposure.exptime else 0.0
+        exposure.stack = stack
+        exposure.stack_function = stacker.function
+
+        # The rest is equivalent to BaseCamera.expose.
+        if postprocess:
+            try:
+                exposure = await self._post_process_internal(exposure, **kwargs)
+            except ExposureError:
+                self.notify(CameraEvent.EXPOSURE_POST_PROCESS_FAILED)
+                raise
+
+        if write:
+            filename = os.path.realpath(str(exposure.filename))
+            self.notify(CameraEvent.EXPOSURE_WRITING, {"filename": filename})
+
+            try:
+                await exposure.write()
+            except Exception as err:
+                raise ExposureError(f"Failed writing image to disk: {err}")
+
+            self.notify(CameraEvent.EXPOSURE_WRITTEN, {"filename": filename})
+
+        return exposure
+
+    def notify(self, event: CameraEvent, extra_payload: Dict[str, Any] | None = None):
+        """Notifies an event. See `~basecam.camera.BaseCamera.notify`."""
+
+        if (
+            self._n_stack is not None
+            and event == CameraEvent.EXPOSURE_INTEGRATING
+            and extra_payload is not None
+        ):
+            extra_payload = {**extra_payload, "n_stack": self._n_stack}
+
+        super().notify(event, extra_payload)
+
+    async def _expose_internal(
+        self,
+        exposure: Exposure,
+        stacker: Stacker | None = None,
+        **kwargs,
+    ) -> Exposure:
+        """Internal method to handle camera exposures.
+
+        If the exposure fails because the device disconnected or returned a
+        transient error, the device is recovered and the exposure retried up to
+        ``exposure_retries`` times (camera parameter, defaults to 0). If a
+        `.Stacker` is passed, its frames are exposed and stacked.
+
+        """
+
+        if exposure.exptime is None:
+            raise ExposureError("Exposure time not set.")
+
+        if stacker is not None:
+            return await self._expose_stack(exposure, stacker)
+
+        return await self._expose_with_retries(exposure)
+
+    async def _expose_with_retries(
+        self,
+        exposure: Exposure,
+        out: numpy.ndarray | None = None,
+    ) -> Exposure:
+        """Exposes, retrying after a recovery. See `._expose_internal`."""
+
+        retries: int = self.camera_params.get("exposure_retries", 0)
+        n_retry = 0
+
+        while True:
+            try:
+                return await self._expose_once(exposure, out=out)
+            except FLIError as err:
+                recovered = await self._handle_device_error(err)
+                if not recovered or n_retry >= retries:
+                    raise
+
+                n_retry += 1
+                self.recovery_stats.n_exposure_retries += 1
+                self.log(f"Retrying exposure ({n_retry}/{retries}).", WARNING)
+
+    async def _expose_stack(self, exposure: Exposure, stacker: Stacker) -> Exposure:
+        """Exposes the frames of a stack.
+
+        Frames are read into two alternating buffers, so that each frame is
+        added to the stack while the next one is exposed.
+
+        """
+
+        assert exposure.exptime is not None
+
+        loop = asyncio.get_running_loop()
+
+        buffers: List[numpy.ndarray | None] = [None, None]
+        pending: asyncio.Future | None = None
+        obstime: astropy.time.Time | None = None
+
+        dtype = self._device.get_frame_dtype()
+
+        try:
+            for idx in range(stacker.n_frames):
+                if idx > 0:
+                    self.notify(
+                        CameraEvent.EXPOSURE_INTEGRATING,
+                        {
+                            "exptime": exposure.exptime,
+                            "remaining_time": exposure.exptime,
+                            "image_type": exposure.image_type,
+                            "n_stack": stacker.n_frames,
+                            "current_stack": idx + 1,
+                        },
+                    )
+
+                buffer = buffers[idx % 2]
+                if buffer is not None and buffer.dtype != dtype:
+                    buffer = None
+
+                await self._expose_with_retries(exposure, out=buffer)
+                assert exposure.data is not None
+
+                if obstime is None:
+                    obstime = exposure.obstime
+
+                buffers[idx % 2] = exposure.data
+
+                if pending is not None:
+                    await pending
+                pending = loop.run_in_executor(None, stacker.add, exposure.data)
+
+            if pending is not None:
+                await pending
+
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+        exposure.obstime = obstime
+        exposure.data = await loop.run_in_executor(None, stacker.result)
+
+        return exposure
+
+    async def _expose_once(
+        self,
+        exposure: Exposure,
+        out: numpy.ndarray | None = None,
+    ) -> Exposure:
+        """Takes a single exposure, optionally reading into ``out``."""
+
+        assert exposure.exptime is not None
+
+        image_type = exposure.image_type
+        frametype = "dark" if image_type in ["dark", "bias"] else "normal"
+
+        await self._call(
+            self._start_exposure,
+            exposure.exptime,
+            frametype,
+            priority=Priority.EXPOSURE,
+        )
+
+        exposure.obstime = astropy.time.Time.now()
+        exposure.data = await self._wait_and_read(exposure.exptime, out)
+
+        return exposure
+
+    async def _wait_and_read(
+        self,
+        exptime: float,
+        out: numpy.ndarray | None = None,
+    ) -> numpy.ndarray:
+        """Waits until the exposure is done and reads the frame."""
+
+        TIMEOUT = 5
+
+        device = self._device
+
+        start_time = time.time()
+
+        time_left = exptime
+
+        while True:
+            await asyncio.sleep(time_left)
+
+            time_left = await self._call(
+                device.get_exposure_time_left,
+                priority=Priority.EXPOSURE,
+            )
+            time_left /= 1000.0
+
+            if time_left == 0:
+                self.notify(CameraEvent.EXPOSURE_READING)
+                args = () if out is None else (out,)
+                data = await self.camera_system.readout_scheduler.readout(
+                    self.usb_bus,
+                    partial(
+                        self._call,
+                        device.read_frame,
+                        *args,
+                        priority=Priority.READOUT,
+                    ),
+                )
+                return self._to_bit_depth(data)
+
+            if time.time() - start_time > exptime + TIMEOUT:
+                raise ExposureError("timeout while waiting for exposure to finish.")
+
+    async def set_bit_depth(self, bit_depth: int):
+        """Sets the bit depth of the frames (8 or 16).
+
+        In 8-bit mode frames are ``uint8``. If the camera supports it, the
+        readout itself is done in 8 bits, which halves the data transferred.
+        Otherwise the frames are read in 16 bits and shifted right by the
+        ``bit_depth_shift`` camera parameter (defaults to 8), saturating at 255.
+
+        """
+
+        if bit_depth not in (8, 16):
+            raise ValueError("bit_depth must be 8 or 16.")
+
+        device = self._device
+
+        if device.bit_depth != bit_depth:
+            try:
+                await self._call(device.set_bit_depth, bit_depth)
+            except FLIError as err:
+                if err.errno != errno.EINVAL:
+                    raise
+                if bit_depth == 8:
+                    self.log(
+                        "Camera does not support 8-bit readout. "
+                        "Frames will be converted after readout.",
+                        WARNING,
+                    )
+
+        self.bit_depth = bit_depth
+
+    def _to_bit_depth(self, data: numpy.ndarray) -> numpy.ndarray:
+        """Converts a frame to the bit depth of the camera, if needed."""
+
+        if self.bit_depth != 8 or data.dtype == numpy.uint8:
+            return data
+
+        shifted = numpy.right_shift(data, self.bit_depth_shift)
+
+        return numpy.minimum(shifted, 255).astype(numpy.uint8)
+
+    def _setup_flushing(self, policy: FlushPolicy | None = None):
+        """Sets the background flushing of the policy. Runs in the device worker."""
+
+        policy = policy or self.flush_policy
+
+        if self._device.background_flush != policy.background:
+            self._device.set_background_flush(policy.background)
+
+    def _set_nflushes(self, exptime: float, policy: FlushPolicy | None = None):
+        """Sets the flushes for an exposure. Runs in the device worker."""
+
+        nflushes = (policy or self.flush_policy).get_nflushes(exptime)
+
+        if self._device.nflushes != nflushes:
+            self._device.set_nflushes(nflushes)
+
+    def _start_exposure(self, exptime: float, frametype: str):
+        """Sets up the device and starts the exposure. Runs in the device worker."""
+
+        device = self._device
+
+        device.cancel_exposure()
+        device.set_exposure_time(exptime)
+        self._set_nflushes(exptime)
+        device.start_exposure(frametype)
+
+    def _setup_sequence(self, exptime: float, frametype: str):
+        """Sets up the device for a sequence. Runs in the device worker."""
+
+        device = self._device
+
+        device.cancel_exposure()
+        device.set_exposure_time(exptime)
+        self._set_nflushes(exptime)
+        device.set_frame_type(frametype)
+
+    def _measure_latency(self, exptime: float, policy: FlushPolicy) -> float:
+        """Takes an exposure and returns the exposure latency. Runs in the worker."""
+
+        device = self._device
+
+        device.cancel_exposure()
+        device.set_exposure_time(exptime)
+        self._setup_flushing(policy)
+        self._set_nflushes(exptime, policy)
+        device.set_frame_type("dark")
+
+        try:
+            return device.expose_frame_timed()
+        finally:
+            device.cancel_exposure()
+
+    async def measure_exposure_latency(
+        self,
+        policy: FlushPolicy | None = None,
+        exptime: float = 0.1,
+        n_samples: int = 5,
+    ) -> ExposureLatency:
+        """Measures the time from ``FLIExposeFrame`` to the start of the integration.
+
+        Takes ``n_samples`` dark exposures that are cancelled as soon as they
+        start. The camera flush policy is restored afterwards.
+
+        Parameters
+        ----------
+        policy
+            The `.FlushPolicy` to measure. Defaults to the policy of the camera.
+        exptime
+            The exposure time, used to select the number of flushes.
+        n_samples
+            The number of exposures to take.
+
+        """
+
+        policy = policy or self.flush_policy
+
+        samples: List[float] = []
+        try:
+            for _ in range(n_samples):
+                latency = await self._call(
+                    self._measure_latency,
+                    exptime,
+                    policy,
+                    priority=Priority.EXPOSURE,
+                )
+                samples.append(round(latency, 4))
+        finally:
+            await self._call(self._setup_flushing)
+
+        result = ExposureLatency(policy=policy, exptime=exptime, samples=samples)
+        if samples:
+            result.mean = round(sum(samples) / len(samples), 4)
+            result.minimum = min(samples)
+            result.maximum = max(samples)
+
+        self.log(f"Exposure latency with {policy}: {result.mean} s.")
+
+        return result
+
+    async def expose_sequence(
+        self,
+        exptime: float,
+        count: int,
+        interval: float = 0.0,
+        image_type: str = "object",
+        write: bool = True,
+        postprocess: bool = True,
+        n_buffers: int = 2,
+    ) -> SequenceResult:
+        """Takes a sequence of exposures setting up the device only once.
+
+        The exposure time and frame type are set before the first exposure and
+        each exposure only calls ``FLIExposeFrame``. Frames are read into
+        ``n_buffers`` buffers that are reused, and each frame is post-processed
+        and written while the next one is exposing. Since the buffers are reused,
+        the data is only returned if ``write=False``, in which case a new buffer
+        is allocated for each frame.
+
+        Parameters
+        ----------
+        exptime
+            The exposure time, in seconds.
+        count
+            The number of exposures.
+        interval
+            Minimum time, in seconds, between the start of consecutive exposures.
+            If zero, the exposures are taken back to back.
+        image_type
+            The type of image (``{'bias', 'dark', 'object', 'flat'}``).
+        write
+            Whether to write the exposures to disk.
+        postprocess
+            Whether to run the post-process stage on each exposure.
+        n_buffers
+            Number of frame buffers to use when writing the exposures.
+
+        Returns
+        -------
+        result
+            A `.SequenceResult` with the achieved cadence.
+
+        """
+
+        if count < 1:
+            raise ExposureError("count must be at least 1.")
+
+        if image_type == "bias":
+            exptime = 0.0
+
+        frametype = "dark" if image_type in ["dark", "bias"] else "normal"
+
+        result = SequenceResult(count=count, exptime=exptime, interval=interval)
+
+        buffers: List[numpy.ndarray] = []
+        if write:
+            shape = self._device.get_frame_shape()
+            dtype = self._device.get_frame_dtype()
+            buffers = [numpy.empty(shape, dtype=dtype) for _ in range(n_buffers)]
+
+        writers: List[asyncio.Task[str]] = []
+        start_times: List[float] = []
+
+        payload = {
+            "exptime": exptime,
+            "remaining_time": exptime,
+            "image_type": image_type,
+            "n_stack": 1,
+            "current_stack": 1,
+        }
+
+        try:
+            await self._call(
+                self._setup_sequence,
+                exptime,
+                frametype,
+                priority=Priority.EXPOSURE,
+            )
+
+            for idx in range(count):
+                if start_times and interval > 0:
+                    delay = start_times[-1] + interval - time.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                buffer = None
+                if write:
+                    # Waits until the frame that used this buffer has been written.
+                    if idx >= n_buffers:
+                        await writers[idx - n_buffers]
+                    buffer = buffers[idx % n_buffers]
+
+                exposure = Exposure(self, fits_model=self.fits_model)
+                exposure.image_type = image_type
+                exposure.exptime = exptime
+                exposure.exptime_n = exptime
+
+                self.notify(CameraEvent.EXPOSURE_INTEGRATING, payload)
+
+                start_times.append(time.time())
+                await self._call(self._device.expose_frame, priority=Priority.EXPOSURE)
+                exposure.obstime = astropy.time.Time.now()
+
+                exposure.data = await self._wait_and_read(exptime, buffer)
+                exposure.filename = str(self.image_namer(self))
+
+                self.notify(CameraEvent.EXPOSURE_DONE, {"image_type": image_type})
+
+                if write:
+                    writers.append(
+                        asyncio.create_task(
+                            self._write_sequence_exposure(exposure, postprocess)
+                        )
+                    )
+                else:
+                    if postprocess:
+                        exposure = await self._post_process_internal(exposure)
+                    result.exposures.append(exposure)
+
+            result.filenames = list(await asyncio.gather(*writers))
+
+        except Exception as err:
+            await asyncio.gather(*writers, return_exceptions=True)
+
+            self.notify(CameraEvent.EXPOSURE_FAILED, {"error": str(err)})
+            if isinstance(err, FLIError):
+                await self._handle_device_error(err)
+
+            raise ExposureError(
+                f"sequence failed after {len(start_times)} exposures: {err}"
+            )
+
+        result.elapsed = round(time.time() - start_times[0], 3)
+
+        if count > 1:
+            cadence = (start_times[-1] - start_times[0]) / (count - 1)
+            result.cadence = round(cadence, 3)
+            result.dead_time = round(cadence - exptime, 3)
+
+        self.log(
+            f"Sequence of {count} exposures done in {result.elapsed} s "
+            f"(cadence {result.cadence} s)."
+        )
+
+        return result
+
+    async def expose_windows(
+        self,
+        exptime: float,
+        windows: Sequence[Tuple[int, int, int, int]],
+        image_type: str = "object",
+    ) -> List[numpy.ndarray]:
+        """Exposes and reads only the detector rows that contain ``windows``.
+
+        The rows between windows are skipped using the vertical table of the
+        camera (see `.LibFLIDevice.set_windows`), which reduces the readout
+        time and the number of pixels transferred. The cutouts are not
+        post-processed or written to disk. The image area is restored after the
+        readout.
+
+        Parameters
+        ----------
+        exptime
+            The exposure time, in seconds.
+        windows
+            A list of windows in the format ``(ul_x, ul_y, lr_x, lr_y)``, in
+            unbinned pixels relative to the full image area.
+        image_type
+            The type of image (``{'bias', 'dark', 'object', 'flat'}``).
+
+        Returns
+        -------
+        cutouts
+            A list with the image of each window, in the same order as
+            ``windows``.
+
+        """
+
+        frametype = "dark" if image_type in ["dark", "bias"] else "normal"
+
+        device = self._device
+
+        try:
+            await self._call(device.set_windows, windows, priority=Priority.EXPOSURE)
+            await self._call(
+                self._start_exposure,
+                exptime,
+                frametype,
+                priority=Priority.EXPOSURE,
+            )
+
+            frame = await self._wait_and_read(exptime)
+
+            return device.extract_windows(frame)
+
+        except FLIError as err:
+            await self._handle_device_error(err)
+            raise ExposureError(f"windowed exposure failed: {err}")
+
+        finally:
+            if device.windows:
+                try:
+                    await self._call(device.clear_windows)
+                except FLIError:
+                    pass
+
+    async def focus_sweep(
+        self,
+        exptime: float,
+        offsets: Sequence[float],
+        set_focus: Callable[[float], Awaitable[Any]] | None = None,
+        binning: int = 2,
+        area: Tuple[int, int, int, int] | None = None,
+        metric: str = "hfd",
+        write: bool = False,
+    ) -> FocusSweepResult:
+        """Takes exposures at a list of focus offsets and finds the best focus.
+
+        For each offset, ``set_focus`` is awaited to move the focus, a binned
+        exposure is taken, and the focus metric (see `.get_focus_point`) is
+        calculated in memory. A parabola is then fitted to the metric (see
+        `.fit_focus`). The binning and image area are restored at the end.
+
+        Parameters
+        ----------
+        exptime
+            The exposure time, in seconds.
+        offsets
+            The focus offsets.
+        set_focus
+            A coroutine function that receives an offset and moves the focus.
+            If `None`, the focus must be moved externally, for example when
+            testing the sweep.
+        binning
+            The binning of the exposures.
+        area
+            The image area to read, as ``(ul_x, ul_y, lr_x, lr_y)`` in unbinned
+            pixels. If `None`, the current image area is used.
+        metric
+            The metric to fit, ``hfd`` or ``fwhm``.
+        write
+            Whether to post-process and write the exposures.
+
+        """
+
+        from flicamera.focus import fit_focus, get_focus_point
+
+        device = self._device
+        hbin, vbin, current_area = device.hbin, device.vbin, device.area
+
+        options = self.camera_params.get("sources", {}).copy()
+        options.pop("max_sources", None)
+
+        loop = asyncio.get_running_loop()
+        points = []
+
+        try:
+            await self.set_binning(binning, binning)
+            if area is not None:
+                await self._call(device.set_image_area, area)
+
+            for offset in offsets:
+                if set_focus is not None:
+                    await set_focus(offset)
+
+                exposure = await self.expose(exptime, write=write, postprocess=write)
+                assert exposure.data is not None
+
+                point = await loop.run_in_executor(
+                    None,
+                    partial(
+                        get_focus_point,
+                        exposure.data,
+                        offset,
+                        binning=binning,
+                        **options,
+                    ),
+                )
+                points.append(point)
+
+                self.log(
+                    f"Focus offset {offset}: {point.n_sources} sources, "
+                    f"FWHM={point.fwhm}, HFD={point.hfd}."
+                )
+
+        finally:
+            try:
+                await self.set_binning(hbin, vbin)
+                await self._call(device.set_image_area, current_area)
+            except FLIError as err:
+                self.log(f"Failed restoring the image area: {err}", WARNING)
+
+        return fit_focus(points, metric=metric)
+
+    def _setup_video(self, exptime: float):
+        """Sets up the device and starts video mode. Runs in the device worker."""
+
+        device = self._device
+
+        device.cancel_exposure()
+        device.set_exposure_time(exptime)
+        self._set_nflushes(exptime)
+        device.set_frame_type("normal")
+        device.start_video()
+
+    def video(
+        self,
+        exptime: float,
+        decimate: int = 1,
+        n_buffers: int = 3,
+        max_frames: int | None = None,
+    ) -> VideoStream:
+        """Returns a `.VideoStream` to stream frames in video mode.
+
+        The stream must be used as an asynchronous context manager. See
+        `.VideoStream` for details on the parameters.
+
+        """
+
+        if self.video_stream is not None:
+            raise ExposureError("a video stream is already running.")
+
+        return VideoStream(
+            self,
+            exptime,
+            decimate=decimate,
+            n_buffers=n_buffers,
+            max_frames=max_frames,
+        )
+
+    async def _write_sequence_exposure(
+        self,
+        exposure: Exposure,
+        postprocess: bool = True,
+    ) -> str:
+        """Post-processes and writes an exposure of a sequence."""
+
+        if postprocess:
+            exposure = await self._post_process_internal(exposure)
+
+        filename = os.path.realpath(str(exposure.filename))
+        self.notify(CameraEvent.EXPOSURE_WRITING, {"filename": filename})
+
+        await exposure.write()
+
+        self.notify(CameraEvent.EXPOSURE_WRITTEN, {"filename": filename})
+
+        return filename
+
+    async def _get_temperature_internal(self) -> float:
+        """Internal method to get the camera temperature."""
+
+        await self._call(self._device._update_temperature, priority=Priority.STATUS)
+        return self._device._temperature["CCD"]
+
+    async def _set_temperature_internal(self, temperature: float):
+        """Internal method to set the camera temperature."""
+
+        await self._call(self._device.set_temperature, temperature)
+
+    async def _get_image_area_internal(self) -> Tuple[int, int, int, int]:
+        """Internal method to return the image area."""
+
+        area = self._device.area
+
+        # Convert from (ul_x, ul_y, lr_x, lr_y) to (x0, x1, y0, y1)
+        area = (area[0], area[2], area[1], area[3])
+
+        return area
+
+    async def _set_image_area_internal(
+        self,
+        area: Optional[Tuple[int, int, int, int]] = None,
+    ):
+        """Internal method to set the image area."""
+
+        if area:
+            # Convert from (x0, x1, y0, y1) to (ul_x, ul_y, lr_x, lr_y)
+            area = (area[0], area[2], area[1], area[3])
+
+        await self._call(self._device.set_image_area, area)
+
+    async def get_readout_modes(self) -> List[str]:
+        """Returns the names of the readout modes supported by the camera."""
+
+        return list(self._device.readout_modes)
+
+    async def set_readout_mode(self, mode: int | str):
+        """Sets the readout mode by index or name.
+
+        See `.LibFLIDevice.set_readout_mode`.
+
+        """
+
+        await self._call(self._device.set_readout_mode, mode)
+
+        self.log(f"Readout mode set to {self._device.readout_mode_name!r}.")
+
+    async def _get_binning_internal(self) -> Tuple[int, int]:
+        """Internal method to return the binning."""
+
+        return (self._device.hbin, self._device.vbin)
+
+    async def _set_binning_internal(self, hbin, vbin):
+        """Internal method to set the binning."""
+
+        await self._call(self._device.set_binning, hbin, vbin)
+
+    async def _disconnect_internal(self) -> bool:
+        """Disconnects the camera."""
+
+        if self.frame_publisher is not None:
+            self.frame_publisher.close()
+            self.frame_publisher = None
+
+        if self._probe_task is not None and not self._probe_task.done():
+            self._probe_task.cancel()
+
+        if not self.worker.running:
+            return True
+
+        try:
+            await self._call(self._device.disconnect)
+        except FLIError as err:
+            # The device may have been unplugged already.
+            warnings.warn(f"Failed closing device: {err}", FLIWarning)
+        finally:
+            await self.worker.stop()
+
+        return True
 
 
 class FLICameraSystem(CameraSystem[FLICamera]):
-    """FLI camera system."""
+    """FLI camera system.
+
+    Parameters
+    ----------
+    simulation_mode
+        Whether to load the mock libfli.
+    process_isolation
+        If `True`, each device is opened and read in its own process (see
+        `.ProcessDevice`) so that readout scales with the number of cores and a
+        hung device cannot block the other cameras. The `.FLICamera` API does not
+        change.
+    lib_factory
+        A picklable callable that returns the `.LibFLI` object used by the device
+        processes. Defaults to `.LibFLI` with the same ``simulation_mode``.
+    readout_concurrency
+        The maximum number of concurrent readouts on each USB bus (see
+        `.ReadoutScheduler`). Defaults to the ``readout_concurrency`` value in
+        the configuration file.
+    args, kwargs
+        Other arguments to pass to `~basecam.camera.CameraSystem`.
+
+    """
 
     __version__ = flicamera_version  # type: ignore
 
     camera_class = FLICamera
 
-    def __init__(self, *args, simulation_mode: bool = False, **kwargs):
+    def __init__(
+        self,
+        *args,
+        simulation_mode: bool = False,
+        process_isolation: bool = False,
+        lib_factory: LibFactory | None = None,
+        readout_concurrency: int | Dict[str, int] | None = None,
+        **kwargs,
+    ):
         self.camera_class: Type[FLICamera] = kwargs.pop("camera_system", FLICamera)
         super().__init__(*args, **kwargs)
 
         self.simulation_mode = simulation_mode
         self.lib: LibFLI | None = None
 
+        self.process_isolation = process_isolation
+        self.lib_factory = lib_factory or partial(
+            LibFLI,
+            simulation_mode=simulation_mode,
+        )
+
+        if readout_concurrency is None:
+            readout_concurrency = config.get("readout_concurrency", None)
+        self.readout_scheduler = ReadoutScheduler(readout_concurrency)
+
+        self._serial_cache: Dict[str, str] = {}
+        self._cached_devices_id: Set[str] = set()
+
+        self.hotplug_monitor: HotplugMonitor | None = None
+
     def setup(self):
         """Set up the camera system."""
 
@@ -314,6 +1776,107 @@ class FLICameraSystem(CameraSystem[FLICamera]):
 
         return super().setup()
 
+    async def start_hotplug_monitor(
+        self,
+        source: HotplugEventSource | None = None,
+        debounce: float = 0.5,
+        fallback_interval: float = 5,
+    ):
+        """Updates the cameras when FLI devices are plugged or unplugged.
+
+        Event-driven alternative to ``start_camera_poller``. If the event source
+        cannot be created (for example, inotify is not available or there is no
+        ``/dev/bus/usb``), falls back to the camera poller.
+
+        Parameters
+        ----------
+        source
+            The `.HotplugEventSource` to use. Defaults to `.InotifyEventSource`.
+        debounce
+            Time, in seconds, to wait after an event before listing the cameras.
+        fallback_interval
+            The interval for the camera poller if the monitor cannot be started.
+
+        """
+
+        try:
+            if self.hotplug_monitor is None:
+                self.hotplug_monitor = HotplugMonitor(
+                    self,
+                    source=source,
+                    debounce=debounce,
+                )
+            await self.hotplug_monitor.start()
+            self.log("started hotplug monitor.")
+        except OSError as err:
+            warnings.warn(
+                f"Cannot start hotplug monitor ({err}). Using camera poller.",
+                FLIWarning,
+            )
+            self.hotplug_monitor = None
+            await self.start_camera_poller(interval=fallback_interval)
+
+        return self
+
+    async def stop_hotplug_monitor(self):
+        """Stops the hotplug monitor, if running."""
+
+        if self.hotplug_monitor is not None:
+            await self.hotplug_monitor.stop()
+            self.hotplug_monitor = None
+
+    async def disconnect(self):
+        """Shuts down the system."""
+
+        await self.stop_hotplug_monitor()
+
+        await super().disconnect()
+
+    async def _check_cameras(self):
+        """Checks the list of connected cameras.
+
+        Like `~basecam.camera.CameraSystem._check_cameras` but the cameras are
+        listed in a thread and the new cameras are added concurrently. Each
+        camera opens its device in its own worker, so connecting all the cameras
+        of a host takes about as long as connecting one.
+
+        """
+
+        loop = asyncio.get_running_loop()
+        uids = await loop.run_in_executor(None, self.list_available_cameras)
+
+        for camera in list(self.cameras):
+            if camera.uid not in uids and not camera.force:
+                self.log(
+                    f"camera with UID {camera.uid!r} ({camera.name}) has been removed.",
+                    INFO,
+                )
+                await self.remove_camera(camera.name)
+
+        camera_uids = [camera.uid for camera in self.cameras]
+
+        new_uids = []
+        for uid in uids:
+            if uid in camera_uids:
+                continue
+            elif self.include and uid not in self.include:
+                continue
+            elif self.exclude and uid in self.exclude:
+                continue
+
+            self.log(f"detected new camera with UID {uid!r}.", INFO)
+            new_uids.append(uid)
+
+        results = await asyncio.gather(
+            *[self.add_camera(uid=uid) for uid in new_uids],
+            return_exceptions=True,
+        )
+
+        # A camera that fails to connect does not prevent adding the others.
+        for uid, result in zip(new_uids, results):
+            if isinstance(result, Exception):
+                self.log(f"Failed adding camera {uid!r}: {result}", WARNING)
+
     def list_available_cameras(self) -> List[str]:
         if self.lib is None:
             return []
@@ -322,14 +1885,49 @@ class FLICameraSystem(CameraSystem[FLICamera]):
         # are replugged or moved to a different computer.
         devices_id = self.lib.list_cameras()
 
+        # Serial numbers are cached by device path. The cache is only invalidated
+        # when the list of devices changes, so that polling does not require
+        # accessing each device.
+        if set(devices_id) != self._cached_devices_id:
+            self.lib.prune(devices_id)
+            self._serial_cache = {}
+            self._cached_devices_id = set(devices_id)
+
+        if self.process_isolation:
+            # Devices owned by a device process must not be opened here.
+            for camera in self.cameras:
+                device = getattr(camera, "_device", None)
+                if isinstance(device, ProcessDevice) and device.is_open:
+                    self._serial_cache.setdefault(device.name, device.serial)
+
+        # The new devices are opened in parallel to read their serial numbers.
+        new_devices = [dev for dev in devices_id if dev not in self._serial_cache]
+        if len(new_devices) > 0:
+            with ThreadPoolExecutor(max_workers=len(new_devices)) as executor:
+                serials = executor.map(self._read_serial, new_devices)
+                for device_id, serial in zip(new_devices, serials):
+                    if serial is not None:
+                        self._serial_cache[device_id] = serial
+
         # Get the serial number as UID.
-        serial_numbers = []
-        for device_id in devices_id:
-            try:
-                device = LibFLIDevice(device_id, self.lib)
-                serial_numbers.append(device.serial)
-            except FLIError as err:
-                warnings.warn(str(err), FLIWarning)
-                continue
+        return [
+            self._serial_cache[dev] for dev in devices_id if dev in self._serial_cache
+        ]
+
+    def _read_serial(self, device_id: str) -> str | None:
+        """Opens a device, without probing it, and returns its serial number."""
+
+        assert self.lib is not None
+
+        try:
+            device = self.lib.get_device(device_id, probe=False)
+            serial = device.serial
+
+            # Releases the device so that a device process can open it.
+            if self.process_isolation:
+                device.disconnect()
+        except FLIError as err:
+            warnings.warn(str(err), FLIWarning)
+            return None
 
-        return serial_numbers
+        return serial
@@ -0,0 +1,1206 @@
+/*
+ * @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+ * @Date: 2026-10-18
+ * @Filename: libflimock.c
+ * @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+ *
+ * A mock of the camera functions of libfli. It exports the same functions as
+ * libfli, so it can be loaded by flicamera.lib.LibFLI with the real argtypes
+ * and error checking, and serves synthetic frames from memory with a timing
+ * model for the exposure, the flushing and the readout.
+ *
+ * Devices are added with FLIMockAddDevice or from the FLIMOCK_DEVICES
+ * environment variable, a comma-separated list of name:serial[:WIDTHxHEIGHT]
+ * entries read when the library is loaded. Each call to a device function
+ * takes at least the call latency of the device, to simulate the USB round
+ * trips. Functions for other devices (filter wheels, focusers) or not used by
+ * the mock return -ENOSYS.
+ *
+ * The mock can be called from several threads. Each device has a mutex that
+ * is held for the duration of each call to it, as a USB device handles one
+ * request at a time, and a reference count. Removed devices are taken out of
+ * the device list but only freed when the last call using them returns.
+ */
+
+#include <errno.h>
+#include <math.h>
+#include <pthread.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#define MOCK_MAX_DEVICES 64
+#define MOCK_STR_SIZE 64
+#define MOCK_VTABLE_MAX_ENTRIES 63
+#define MOCK_DEFAULT_MODEL "MicroLine ML50100"
+
+#define FLI_TEMPERATURE_CCD 0x0000
+#define FLI_TEMPERATURE_BASE 0x0001
+
+#define FLI_MODE_8BIT 0
+#define FLI_BGFLUSH_START 0x0001
+
+#define FLI_CAMERA_STATUS_IDLE 0x00
+#define FLI_CAMERA_STATUS_EXPOSING 0x02
+#define FLI_CAMERA_DATA_READY 0x80000000
+
+#define VTABLE_MODE_READ 1
+
+typedef long flidev_t;
+typedef long flidomain_t;
+typedef long fliframe_t;
+typedef long flibitdepth_t;
+typedef long flishutter_t;
+typedef long flibgflush_t;
+typedef long flichannel_t;
+typedef long flidebug_t;
+typedef long flimode_t;
+typedef long flistatus_t;
+typedef long flitdirate_t;
+typedef long flitdiflags_t;
+
+static const char *MOCK_READOUT_MODES[] = {"8 MHz", "1 MHz"};
+#define MOCK_N_READOUT_MODES 2
+
+typedef struct
+{
+    long height;
+    long bin;
+    long mode;
+} vtable_entry_t;
+
+typedef struct
+{
+    /* Held during each call to the device. */
+    pthread_mutex_t lock;
+
+    /* Number of calls using the device, and whether it has been removed. Both
+     * are protected by devices_lock. */
+    long refcount;
+    int removed;
+
+    flidev_t handle;
+    char name[MOCK_STR_SIZE];
+    char serial[MOCK_STR_SIZE];
+    char model[MOCK_STR_SIZE];
+
+    /* Size of the chip and synthetic frame. */
+    long width;
+    long height;
+    uint16_t *frame;
+
+    /* Image area as passed to FLISetImageArea (lr is in binned pixels). */
+    long ul_x, ul_y, lr_x, lr_y;
+    long hbin, vbin;
+
+    long exptime;
+    int exposing;
+    double exposure_start;
+
+    int bit_depth;
+    long nflushes;
+    int background_flush;
+    long camera_mode;
+
+    double temperature_ccd;
+    double temperature_base;
+
+    /* Timing model. A pixel rate of zero means instantaneous readout. */
+    double pixel_rate;
+    double row_overhead;
+    double flush_row_time;
+    double call_latency;
+
+    /* Rows of the chip to read in the current exposure. */
+    long *rows;
+    long n_rows;
+    long row;
+    double skip_time;
+    double readout_start;
+
+    int vtable_enabled;
+    long vtable_width;
+    long vtable_offset;
+    long vtable_n_entries;
+    vtable_entry_t vtable[MOCK_VTABLE_MAX_ENTRIES];
+
+    int video_mode;
+    double video_start;
+    long video_frame;
+} mockdev_t;
+
+static mockdev_t *devices[MOCK_MAX_DEVICES];
+static long n_devices = 0;
+static flidev_t next_handle = 1;
+static pthread_mutex_t devices_lock = PTHREAD_MUTEX_INITIALIZER;
+
+/* Utilities */
+
+static double now(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+static void sleep_seconds(double seconds)
+{
+    struct timespec ts;
+
+    if (seconds <= 0)
+        return;
+
+    ts.tv_sec = (time_t)seconds;
+    ts.tv_nsec = (long)((seconds - ts.tv_sec) * 1e9);
+
+    while (nanosleep(&ts, &ts) == -1 && errno == EINTR)
+        ;
+}
+
+static void sleep_until(double deadline)
+{
+    sleep_seconds(deadline - now());
+}
+
+static void free_device(mockdev_t *device)
+{
+    pthread_mutex_destroy(&device->lock);
+    free(device->frame);
+    free(device->rows);
+    free(device);
+}
+
+/* Returns a referenced device from its handle or name. Must be called with
+ * devices_lock held. */
+static mockdev_t *reference_device(flidev_t handle, const char *name)
+{
+    long ii;
+
+    for (ii = 0; ii < n_devices; ii++)
+    {
+        if ((name == NULL && devices[ii]->handle == handle) ||
+            (name != NULL && strcmp(devices[ii]->name, name) == 0))
+        {
+            devices[ii]->refcount++;
+            return devices[ii];
+        }
+    }
+
+    return NULL;
+}
+
+/* Looks up a device, locks it, and waits for the call latency. The device
+ * must be released with put_device. */
+static mockdev_t *get_device(flidev_t handle, const char *name)
+{
+    mockdev_t *device;
+
+    pthread_mutex_lock(&devices_lock);
+    device = reference_device(handle, name);
+    pthread_mutex_unlock(&devices_lock);
+
+    if (device == NULL)
+        return NULL;
+
+    pthread_mutex_lock(&device->lock);
+    sleep_seconds(device->call_latency);
+
+    return device;
+}
+
+/* Unlocks a device and frees it if it was removed and this was its last
+ * reference. Used as the cleanup function of GET_DEVICE. */
+static void put_device(mockdev_t **device_ptr)
+{
+    mockdev_t *device = *device_ptr;
+    int free_it;
+
+    if (device == NULL)
+        return;
+
+    pthread_mutex_unlock(&device->lock);
+
+    pthread_mutex_lock(&devices_lock);
+    free_it = --device->refcount == 0 && device->removed;
+    pthread_mutex_unlock(&devices_lock);
+
+    if (free_it)
+        free_device(device);
+
+    *device_ptr = NULL;
+}
+
+/* Removes a device from the list. Must be called with devices_lock held. */
+static void remove_device(long index)
+{
+    mockdev_t *device = devices[index];
+    long ii;
+
+    for (ii = index; ii < n_devices - 1; ii++)
+        devices[ii] = devices[ii + 1];
+    n_devices--;
+
+    device->removed = 1;
+    if (device->refcount == 0)
+        free_device(device);
+}
+
+/* Declares the locked device for the handle dev, which is released when the
+ * function returns. */
+#define GET_DEVICE(dev)                                             \
+    mockdev_t *device __attribute__((cleanup(put_device))) =        \
+        get_device(dev, NULL);                                      \
+    if (device == NULL)                                             \
+        return -ENXIO;
+
+/* The same as GET_DEVICE, for a device name. */
+#define GET_DEVICE_BY_NAME(name)                                    \
+    mockdev_t *device __attribute__((cleanup(put_device))) =        \
+        get_device(0, name);                                        \
+    if (device == NULL)                                             \
+        return -ENXIO;
+
+static void copy_string(char *dest, const char *src, size_t len)
+{
+    if (len == 0)
+        return;
+
+    strncpy(dest, src, len - 1);
+    dest[len - 1] = '\0';
+}
+
+/* Returns a normally distributed random number using a xorshift generator. */
+static double random_normal(uint64_t *state)
+{
+    double u1, u2;
+
+    *state ^= *state << 13;
+    *state ^= *state >> 7;
+    *state ^= *state << 17;
+    u1 = ((*state >> 11) + 1.0) / 9007199254740993.0;
+
+    *state ^= *state << 13;
+    *state ^= *state >> 7;
+    *state ^= *state << 17;
+    u2 = (*state >> 11) / 9007199254740992.0;
+
+    return sqrt(-2.0 * log(u1)) * cos(2.0 * M_PI * u2);
+}
+
+/* Creates the synthetic frame: a bias with noise and a grid of stars. */
+static int make_frame(mockdev_t *device)
+{
+    const double bias = 1000.0, noise = 15.0;
+    const double sigma = 2.0, amplitude = 5000.0;
+    const long spacing = 128, radius = 8;
+
+    uint64_t state = 0x9E3779B97F4A7C15ULL ^ (uint64_t)device->handle;
+    long row, col, x0, y0;
+    double value;
+
+    device->frame = malloc(sizeof(uint16_t) * device->width * device->height);
+    if (device->frame == NULL)
+        return -ENOMEM;
+
+    for (row = 0; row < device->height; row++)
+    {
+        for (col = 0; col < device->width; col++)
+        {
+            value = bias + noise * random_normal(&state);
+            device->frame[row * device->width + col] = (uint16_t)fmax(value, 0);
+        }
+    }
+
+    for (y0 = spacing / 2; y0 < device->height; y0 += spacing)
+    {
+        for (x0 = spacing / 2; x0 < device->width; x0 += spacing)
+        {
+            for (row = y0 - radius; row <= y0 + radius; row++)
+            {
+                for (col = x0 - radius; col <= x0 + radius; col++)
+                {
+                    if (row < 0 || row >= device->height || col < 0 ||
+                        col >= device->width)
+                        continue;
+
+                    value = device->frame[row * device->width + col];
+                    value += amplitude * exp(-((row - y0) * (row - y0) +
+                                               (col - x0) * (col - x0)) /
+                                             (2 * sigma * sigma));
+                    device->frame[row * device->width + col] =
+                        (uint16_t)fmin(value, 65535);
+                }
+            }
+        }
+    }
+
+    return 0;
+}
+
+/* Returns the width and height of the binned readout. */
+static void get_readout_shape(mockdev_t *device, long *width, long *height)
+{
+    long ii;
+
+    if (!device->vtable_enabled)
+    {
+        *width = device->lr_x - device->ul_x;
+        *height = device->lr_y - device->ul_y;
+        return;
+    }
+
+    *width = device->vtable_width;
+    *height = 0;
+    for (ii = 0; ii < device->vtable_n_entries; ii++)
+    {
+        if (device->vtable[ii].mode == VTABLE_MODE_READ)
+            *height += (device->vtable[ii].height + device->vtable[ii].bin - 1) /
+                       device->vtable[ii].bin;
+    }
+}
+
+static long get_first_column(mockdev_t *device)
+{
+    return device->vtable_enabled ? device->vtable_offset : device->ul_x;
+}
+
+static double get_row_readout_time(mockdev_t *device, long n_cols)
+{
+    if (device->pixel_rate <= 0)
+        return 0.0;
+
+    return device->row_overhead * device->vbin + n_cols / device->pixel_rate;
+}
+
+/* Computes the rows of the chip that will be read in the next exposure. */
+static int prepare_rows(mockdev_t *device)
+{
+    long width, height, ii, jj, row, n_skipped = 0;
+
+    get_readout_shape(device, &width, &height);
+
+    free(device->rows);
+    device->rows = malloc(sizeof(long) * (height > 0 ? height : 1));
+    if (device->rows == NULL)
+        return -ENOMEM;
+
+    device->n_rows = 0;
+
+    if (!device->vtable_enabled)
+    {
+        for (ii = 0; ii < height; ii++)
+            device->rows[device->n_rows++] = device->ul_y + ii * device->vbin;
+    }
+    else
+    {
+        row = device->ul_y;
+        for (ii = 0; ii < device->vtable_n_entries; ii++)
+        {
+            vtable_entry_t *entry = &device->vtable[ii];
+            if (entry->mode == VTABLE_MODE_READ)
+            {
+                for (jj = 0; jj < entry->height; jj += entry->bin)
+                    device->rows[device->n_rows++] = row + jj;
+            }
+            else
+            {
+                n_skipped += entry->height;
+            }
+            row += entry->height;
+        }
+    }
+
+    device->skip_time = n_skipped * device->row_overhead;
+    device->row = 0;
+
+    return 0;
+}
+
+/* Copies a binned row of the frame into buff, at the current bit depth. */
+static void copy_row(mockdev_t *device, long chip_row, void *buff, long n_cols)
+{
+    long col, chip_col, first_col = get_first_column(device);
+    uint16_t value;
+
+    for (col = 0; col < n_cols; col++)
+    {
+        chip_col = first_col + col * device->hbin;
+        if (chip_row < 0 || chip_row >= device->height || chip_col < 0 ||
+            chip_col >= device->width)
+            value = 0;
+        else
+            value = device->frame[chip_row * device->width + chip_col];
+
+        if (device->bit_depth == 8)
+            ((uint8_t *)buff)[col] = (uint8_t)(value >> 8);
+        else
+            ((uint16_t *)buff)[col] = value;
+    }
+}
+
+static long get_time_left(mockdev_t *device)
+{
+    double elapsed;
+
+    if (!device->exposing)
+        return 0;
+
+    elapsed = 1000 * (now() - device->exposure_start);
+    if (elapsed >= device->exptime)
+        return 0;
+
+    return (long)(device->exptime - elapsed);
+}
+
+/* Mock configuration */
+
+int FLIMockAddDevice(const char *name, const char *serial, const char *model,
+                     long width, long height)
+{
+    mockdev_t *device;
+    long ii;
+    int err;
+
+    if (name == NULL || serial == NULL || width <= 0 || height <= 0)
+        return -EINVAL;
+
+    pthread_mutex_lock(&devices_lock);
+
+    for (ii = 0; ii < n_devices; ii++)
+    {
+        if (strcmp(devices[ii]->name, name) == 0)
+        {
+            pthread_mutex_unlock(&devices_lock);
+            return -EEXIST;
+        }
+    }
+
+    if (n_devices >= MOCK_MAX_DEVICES)
+    {
+        pthread_mutex_unlock(&devices_lock);
+        return -ENOMEM;
+    }
+
+    device = calloc(1, sizeof(mockdev_t));
+    if (device == NULL)
+    {
+        pthread_mutex_unlock(&devices_lock);
+        return -ENOMEM;
+    }
+
+    pthread_mutex_init(&device->lock, NULL);
+
+    device->handle = next_handle++;
+    copy_string(device->name, name, MOCK_STR_SIZE);
+    copy_string(device->serial, serial, MOCK_STR_SIZE);
+    copy_string(device->model, model ? model : MOCK_DEFAULT_MODEL, MOCK_STR_SIZE);
+
+    device->width = width;
+    device->height = height;
+    device->lr_x = width;
+    device->lr_y = height;
+    device->hbin = 1;
+    device->vbin = 1;
+    device->bit_depth = 16;
+    device->background_flush = 1;
+
+    err = make_frame(device);
+    if (err != 0)
+    {
+        free_device(device);
+        pthread_mutex_unlock(&devices_lock);
+        return err;
+    }
+
+    devices[n_devices++] = device;
+
+    pthread_mutex_unlock(&devices_lock);
+
+    return 0;
+}
+
+int FLIMockSetTiming(const char *name, double pixel_rate, double row_overhead,
+                     double flush_row_time, double call_latency)
+{
+    GET_DEVICE_BY_NAME(name);
+
+    device->pixel_rate = pixel_rate;
+    device->row_overhead = row_overhead;
+    device->flush_row_time = flush_row_time;
+    device->call_latency = call_latency;
+
+    return 0;
+}
+
+int FLIMockSetTemperature(const char *name, double ccd, double base)
+{
+    GET_DEVICE_BY_NAME(name);
+
+    device->temperature_ccd = ccd;
+    device->temperature_base = base;
+
+    return 0;
+}
+
+int FLIMockRemoveDevice(const char *name)
+{
+    long ii;
+
+    pthread_mutex_lock(&devices_lock);
+    for (ii = 0; ii < n_devices; ii++)
+    {
+        if (strcmp(devices[ii]->name, name) == 0)
+        {
+            remove_device(ii);
+            pthread_mutex_unlock(&devices_lock);
+            return 0;
+        }
+    }
+    pthread_mutex_unlock(&devices_lock);
+
+    return -ENXIO;
+}
+
+void FLIMockReset(void)
+{
+    pthread_mutex_lock(&devices_lock);
+    while (n_devices > 0)
+        remove_device(n_devices - 1);
+    pthread_mutex_unlock(&devices_lock);
+}
+
+/* Adds the devices in FLIMOCK_DEVICES when the library is loaded. */
+__attribute__((constructor)) static void load_environment_devices(void)
+{
+    const char *env = getenv("FLIMOCK_DEVICES");
+    char *copy, *entry, *saveptr = NULL;
+    char name[MOCK_STR_SIZE], serial[MOCK_STR_SIZE];
+    long width, height;
+    int n_fields;
+
+    if (env == NULL)
+        return;
+
+    copy = strdup(env);
+    if (copy == NULL)
+        return;
+
+    for (entry = strtok_r(copy, ",", &saveptr); entry != NULL;
+         entry = strtok_r(NULL, ",", &saveptr))
+    {
+        width = 512;
+        height = 512;
+        n_fields = sscanf(entry, " %63[^:]:%63[^:]:%ldx%ld", name, serial, &width,
+                          &height);
+        if (n_fields == 2 || n_fields == 4)
+            FLIMockAddDevice(name, serial, NULL, width, height);
+    }
+
+    free(copy);
+}
+
+/* Library and device list */
+
+long FLISetDebugLevel(char *host, flidebug_t level)
+{
+    return 0;
+}
+
+long FLIGetLibVersion(char *ver, size_t len)
+{
+    copy_string(ver, "libflimock", len);
+    return 0;
+}
+
+long FLIList(flidomain_t domain, char ***names)
+{
+    char **list;
+    long ii, n;
+    size_t size;
+
+    pthread_mutex_lock(&devices_lock);
+
+    n = n_devices;
+    list = calloc(n + 1, sizeof(char *));
+    if (list == NULL)
+    {
+        pthread_mutex_unlock(&devices_lock);
+        return -ENOMEM;
+    }
+
+    for (ii = 0; ii < n; ii++)
+    {
+        size = strlen(devices[ii]->name) + strlen(devices[ii]->model) + 2;
+        list[ii] = malloc(size);
+        if (list[ii] != NULL)
+            snprintf(list[ii], size, "%s;%s", devices[ii]->name, devices[ii]->model);
+    }
+
+    pthread_mutex_unlock(&devices_lock);
+
+    *names = list;
+
+    return 0;
+}
+
+long FLIFreeList(char **names)
+{
+    long ii;
+
+    if (names == NULL)
+        return 0;
+
+    for (ii = 0; names[ii] != NULL; ii++)
+        free(names[ii]);
+    free(names);
+
+    return 0;
+}
+
+long FLIOpen(flidev_t *dev, char *name, flidomain_t domain)
+{
+    GET_DEVICE_BY_NAME(name);
+    *dev = device->handle;
+
+    return 0;
+}
+
+long FLIClose(flidev_t dev)
+{
+    GET_DEVICE(dev);
+    return 0;
+}
+
+long FLILockDevice(flidev_t dev)
+{
+    GET_DEVICE(dev);
+    return 0;
+}
+
+long FLIUnlockDevice(flidev_t dev)
+{
+    GET_DEVICE(dev);
+    return 0;
+}
+
+/* Device information */
+
+long FLIGetModel(flidev_t dev, char *model, size_t len)
+{
+    GET_DEVICE(dev);
+    copy_string(model, device->model, len);
+    return 0;
+}
+
+long FLIGetSerialString(flidev_t dev, char *serial, size_t len)
+{
+    GET_DEVICE(dev);
+    copy_string(serial, device->serial, len);
+    return 0;
+}
+
+long FLIGetHWRevision(flidev_t dev, long *hwrev)
+{
+    GET_DEVICE(dev);
+    *hwrev = 256;
+    return 0;
+}
+
+long FLIGetFWRevision(flidev_t dev, long *fwrev)
+{
+    GET_DEVICE(dev);
+    *fwrev = 512;
+    return 0;
+}
+
+long FLIGetPixelSize(flidev_t dev, double *pixel_x, double *pixel_y)
+{
+    GET_DEVICE(dev);
+    *pixel_x = 9e-6;
+    *pixel_y = 9e-6;
+    return 0;
+}
+
+long FLIGetArrayArea(flidev_t dev, long *ul_x, long *ul_y, long *lr_x, long *lr_y)
+{
+    GET_DEVICE(dev);
+    *ul_x = 0;
+    *ul_y = 0;
+    *lr_x = device->width;
+    *lr_y = device->height;
+    return 0;
+}
+
+long FLIGetVisibleArea(flidev_t dev, long *ul_x, long *ul_y, long *lr_x,
+                       long *lr_y)
+{
+    return FLIGetArrayArea(dev, ul_x, ul_y, lr_x, lr_y);
+}
+
+long FLIGetDeviceStatus(flidev_t dev, long *status)
+{
+    GET_DEVICE(dev);
+
+    if (!device->exposing)
+        *status = FLI_CAMERA_STATUS_IDLE;
+    else if (get_time_left(device) > 0)
+        *status = FLI_CAMERA_STATUS_EXPOSING;
+    else
+        *status = FLI_CAMERA_DATA_READY;
+
+    return 0;
+}
+
+/* Temperature */
+
+long FLISetTemperature(flidev_t dev, double temperature)
+{
+    GET_DEVICE(dev);
+    device->temperature_ccd = temperature;
+    return 0;
+}
+
+long FLIGetTemperature(flidev_t dev, double *temperature)
+{
+    GET_DEVICE(dev);
+    *temperature = device->temperature_ccd;
+    return 0;
+}
+
+long FLIReadTemperature(flidev_t dev, flichannel_t channel, double *temperature)
+{
+    GET_DEVICE(dev);
+
+    if (channel == FLI_TEMPERATURE_BASE)
+        *temperature = device->temperature_base;
+    else
+        *temperature = device->temperature_ccd;
+
+    return 0;
+}
+
+long FLIGetCoolerPower(flidev_t dev, double *power)
+{
+    GET_DEVICE(dev);
+    *power = 0.0;
+    return 0;
+}
+
+long FLISetFanSpeed(flidev_t dev, long fan_speed)
+{
+    GET_DEVICE(dev);
+    return 0;
+}
+
+/* Exposure settings */
+
+long FLISetExposureTime(flidev_t dev, long exptime)
+{
+    GET_DEVICE(dev);
+
+    if (exptime < 0)
+        return -EINVAL;
+
+    device->exptime = exptime;
+
+    return 0;
+}
+
+long FLISetFrameType(flidev_t dev, fliframe_t frametype)
+{
+    GET_DEVICE(dev);
+    return 0;
+}
+
+long FLISetTDI(flidev_t dev, flitdirate_t tdi_rate, flitdiflags_t flags)
+{
+    GET_DEVICE(dev);
+    return 0;
+}
+
+long FLISetImageArea(flidev_t dev, long ul_x, long ul_y, long lr_x, long lr_y)
+{
+    GET_DEVICE(dev);
+
+    if (ul_x < 0 || ul_y < 0 || lr_x <= ul_x || lr_y <= ul_y ||
+        lr_x > device->width || lr_y > device->height)
+        return -EINVAL;
+
+    device->ul_x = ul_x;
+    device->ul_y = ul_y;
+    device->lr_x = lr_x;
+    device->lr_y = lr_y;
+
+    /* Setting the image area disables the vertical table. */
+    device->vtable_enabled = 0;
+    device->vtable_n_entries = 0;
+
+    return 0;
+}
+
+long FLISetHBin(flidev_t dev, long hbin)
+{
+    GET_DEVICE(dev);
+
+    if (hbin < 1 || hbin > 16)
+        return -EINVAL;
+
+    device->hbin = hbin;
+
+    return 0;
+}
+
+long FLISetVBin(flidev_t dev, long vbin)
+{
+    GET_DEVICE(dev);
+
+    if (vbin < 1 || vbin > 16)
+        return -EINVAL;
+
+    device->vbin = vbin;
+
+    return 0;
+}
+
+long FLISetNFlushes(flidev_t dev, long nflushes)
+{
+    GET_DEVICE(dev);
+
+    if (nflushes < 0 || nflushes > 16)
+        return -EINVAL;
+
+    device->nflushes = nflushes;
+
+    return 0;
+}
+
+long FLIControlBackgroundFlush(flidev_t dev, flibgflush_t bgflush)
+{
+    GET_DEVICE(dev);
+    device->background_flush = bgflush == FLI_BGFLUSH_START;
+    return 0;
+}
+
+long FLISetBitDepth(flidev_t dev, flibitdepth_t bitdepth)
+{
+    GET_DEVICE(dev);
+
+    /* Like libfli for the USB cameras, 8-bit mode is not supported. */
+    return -EINVAL;
+}
+
+long FLIControlShutter(flidev_t dev, flishutter_t shutter)
+{
+    GET_DEVICE(dev);
+    return 0;
+}
+
+long FLIGetCameraModeString(flidev_t dev, flimode_t mode_index, char *mode_string,
+                            size_t siz)
+{
+    GET_DEVICE(dev);
+
+    if (mode_index < 0 || mode_index >= MOCK_N_READOUT_MODES)
+        return -EINVAL;
+
+    copy_string(mode_string, MOCK_READOUT_MODES[mode_index], siz);
+
+    return 0;
+}
+
+long FLIGetCameraMode(flidev_t dev, flimode_t *mode_index)
+{
+    GET_DEVICE(dev);
+    *mode_index = device->camera_mode;
+    return 0;
+}
+
+long FLISetCameraMode(flidev_t dev, flimode_t mode_index)
+{
+    GET_DEVICE(dev);
+
+    if (mode_index < 0 || mode_index >= MOCK_N_READOUT_MODES)
+        return -EINVAL;
+
+    device->camera_mode = mode_index;
+
+    return 0;
+}
+
+/* Vertical table */
+
+long FLIEnableVerticalTable(flidev_t dev, long width, long offset, long flags)
+{
+    GET_DEVICE(dev);
+
+    device->vtable_enabled = 1;
+    device->vtable_width = width;
+    device->vtable_offset = offset;
+    device->vtable_n_entries = 0;
+
+    return 0;
+}
+
+long FLISetVerticalTableEntry(flidev_t dev, long index, long height, long bin,
+                              long mode)
+{
+    GET_DEVICE(dev);
+
+    if (!device->vtable_enabled)
+        return -EFAULT;
+
+    if (index > device->vtable_n_entries || index >= MOCK_VTABLE_MAX_ENTRIES)
+        return -EINVAL;
+
+    /* An entry with zero height ends the table. */
+    device->vtable_n_entries = index;
+    if (height > 0)
+    {
+        device->vtable[index].height = height;
+        device->vtable[index].bin = bin > 0 ? bin : 1;
+        device->vtable[index].mode = mode;
+        device->vtable_n_entries = index + 1;
+    }
+
+    return 0;
+}
+
+long FLIGetVerticalTableEntry(flidev_t dev, long index, long *height, long *bin,
+                              long *mode)
+{
+    GET_DEVICE(dev);
+
+    if (index < 0 || index >= device->vtable_n_entries)
+        return -EINVAL;
+
+    *height = device->vtable[index].height;
+    *bin = device->vtable[index].bin;
+    *mode = device->vtable[index].mode;
+
+    return 0;
+}
+
+long FLIGetReadoutDimensions(flidev_t dev, long *width, long *hoffset, long *hbin,
+                             long *height, long *voffset, long *vbin)
+{
+    GET_DEVICE(dev);
+
+    get_readout_shape(device, width, height);
+    *hoffset = get_first_column(device);
+    *hbin = device->hbin;
+    *voffset = device->ul_y;
+    *vbin = device->vbin;
+
+    return 0;
+}
+
+/* Exposure and readout */
+
+long FLIExposeFrame(flidev_t dev)
+{
+    long n_rows;
+    int err;
+
+    GET_DEVICE(dev);
+
+    if (device->exposing)
+        return -EALREADY;
+
+    /* Like libfli, flushes the array before starting the exposure. */
+    n_rows = device->lr_y - device->ul_y;
+    sleep_seconds(device->nflushes * n_rows * device->flush_row_time);
+
+    err = prepare_rows(device);
+    if (err != 0)
+        return err;
+
+    device->exposing = 1;
+    device->exposure_start = now();
+
+    return 0;
+}
+
+long FLICancelExposure(flidev_t dev)
+{
+    GET_DEVICE(dev);
+    device->exposing = 0;
+    device->row = 0;
+    return 0;
+}
+
+long FLIEndExposure(flidev_t dev)
+{
+    GET_DEVICE(dev);
+    device->exptime = (long)(1000 * (now() - device->exposure_start));
+    return 0;
+}
+
+long FLITriggerExposure(flidev_t dev)
+{
+    GET_DEVICE(dev);
+    return 0;
+}
+
+long FLIGetExposureStatus(flidev_t dev, long *timeleft)
+{
+    GET_DEVICE(dev);
+    *timeleft = get_time_left(device);
+    return 0;
+}
+
+long FLIGrabRow(flidev_t dev, void *buff, size_t width)
+{
+    long n_cols, n_rows;
+
+    GET_DEVICE(dev);
+
+    if (!device->exposing || device->row >= device->n_rows)
+        return -EFAULT;
+
+    if (get_time_left(device) > 0)
+        return -EBUSY;
+
+    get_readout_shape(device, &n_cols, &n_rows);
+    if ((long)width > n_cols)
+        width = n_cols;
+
+    if (device->row == 0)
+        device->readout_start = now() + device->skip_time;
+
+    copy_row(device, device->rows[device->row], buff, width);
+    device->row++;
+
+    /* The readout time is counted from the start of the readout, so that the
+     * granularity of the sleeps does not add up. */
+    sleep_until(device->readout_start +
+                device->row * get_row_readout_time(device, n_cols));
+
+    if (device->row == device->n_rows)
+        device->exposing = 0;
+
+    return 0;
+}
+
+long FLIGrabFrame(flidev_t dev, void *buff, size_t buffsize, size_t *bytesgrabbed)
+{
+    long n_cols, n_rows, row;
+    size_t itemsize, row_size;
+    long err;
+
+    {
+        GET_DEVICE(dev);
+        get_readout_shape(device, &n_cols, &n_rows);
+        itemsize = device->bit_depth == 8 ? 1 : 2;
+    }
+
+    row_size = n_cols * itemsize;
+    *bytesgrabbed = 0;
+
+    for (row = 0; row < n_rows && *bytesgrabbed + row_size <= buffsize; row++)
+    {
+        err = FLIGrabRow(dev, (char *)buff + *bytesgrabbed, n_cols);
+        if (err != 0)
+            return err;
+        *bytesgrabbed += row_size;
+    }
+
+    return 0;
+}
+
+long FLIFlushRow(flidev_t dev, long rows, long repeat)
+{
+    GET_DEVICE(dev);
+    sleep_seconds(rows * repeat * device->flush_row_time);
+    return 0;
+}
+
+/* Video mode */
+
+long FLIStartVideoMode(flidev_t dev)
+{
+    GET_DEVICE(dev);
+    device->video_mode = 1;
+    device->video_start = now();
+    device->video_frame = 0;
+    return 0;
+}
+
+long FLIStopVideoMode(flidev_t dev)
+{
+    GET_DEVICE(dev);
+    device->video_mode = 0;
+    return 0;
+}
+
+long FLIGrabVideoFrame(flidev_t dev, void *buff, size_t size)
+{
+    long n_cols, n_rows, row;
+    size_t itemsize;
+    double period;
+
+    GET_DEVICE(dev);
+
+    if (!device->video_mode)
+        return -EINVAL;
+
+    /* Video frames always use the image area. */
+    n_cols = device->lr_x - device->ul_x;
+    n_rows = device->lr_y - device->ul_y;
+    itemsize = device->bit_depth == 8 ? 1 : 2;
+
+    if (size < n_rows * n_cols * itemsize)
+        return -EINVAL;
+
+    /* Frames are produced every exposure time or readout time, whichever is
+     * longer, counted from the start of the video mode. */
+    period = fmax(device->exptime / 1000.0,
+                  n_rows * get_row_readout_time(device, n_cols));
+
+    device->video_frame++;
+    sleep_until(device->video_start + device->video_frame * period);
+
+    for (row = 0; row < n_rows; row++)
+        copy_row(device, device->ul_y + row * device->vbin,
+                 (char *)buff + row * n_cols * itemsize, n_cols);
+
+    return 0;
+}
+
+/* Functions that are not implemented by the mock */
+
+#define NOT_IMPLEMENTED(signature) \
+    long signature                 \
+    {                              \
+        return -ENOSYS;            \
+    }
+
+NOT_IMPLEMENTED(FLIReadIOPort(flidev_t dev, long *ioportset))
+NOT_IMPLEMENTED(FLIWriteIOPort(flidev_t dev, long ioportset))
+NOT_IMPLEMENTED(FLIConfigureIOPort(flidev_t dev, long ioportset))
+NOT_IMPLEMENTED(FLISetFilterPos(flidev_t dev, long filter))
+NOT_IMPLEMENTED(FLIGetFilterPos(flidev_t dev, long *filter))
+NOT_IMPLEMENTED(FLIGetFilterCount(flidev_t dev, long *filter))
+NOT_IMPLEMENTED(FLIStepMotor(flidev_t dev, long steps))
+NOT_IMPLEMENTED(FLIGetStepperPosition(flidev_t dev, long *position))
+NOT_IMPLEMENTED(FLIHomeFocuser(flidev_t dev))
+NOT_IMPLEMENTED(FLICreateList(flidomain_t domain))
+NOT_IMPLEMENTED(FLIDeleteList(void))
+NOT_IMPLEMENTED(FLIListFirst(flidomain_t *domain, char *filename, size_t fnlen,
+                             char *name, size_t namelen))
+NOT_IMPLEMENTED(FLIListNext(flidomain_t *domain, char *filename, size_t fnlen,
+                            char *name, size_t namelen))
+NOT_IMPLEMENTED(FLISetDAC(flidev_t dev, unsigned long dacset))
+NOT_IMPLEMENTED(FLIGetStepsRemaining(flidev_t dev, long *steps))
+NOT_IMPLEMENTED(FLIStepMotorAsync(flidev_t dev, long steps))
+NOT_IMPLEMENTED(FLIGetFocuserExtent(flidev_t dev, long *extent))
+NOT_IMPLEMENTED(FLIUsbBulkIO(flidev_t dev, int ep, void *buf, long *len))
+NOT_IMPLEMENTED(FLIHomeDevice(flidev_t dev))
+NOT_IMPLEMENTED(FLIReadUserEEPROM(flidev_t dev, long loc, long address,
+                                  long length, void *rbuf))
+NOT_IMPLEMENTED(FLIWriteUserEEPROM(flidev_t dev, long loc, long address,
+                                   long length, void *wbuf))
+NOT_IMPLEMENTED(FLISetActiveWheel(flidev_t dev, long wheel))
+NOT_IMPLEMENTED(FLIGetFilterName(flidev_t dev, long filter, char *name,
+                                 size_t len))
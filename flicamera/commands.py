@@ -0,0 +1,416 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: commands.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+# Additional actor commands and overrides of the basecam commands. Importing
+# this module registers the commands with the basecam camera parser.
+
+from __future__ import annotations
+
+import asyncio
+import math
+from functools import partial
+
+import click
+
+from basecam.actor.commands.base import camera_parser
+from basecam.actor.commands.expose import report_exposure_state
+from basecam.actor.tools import get_cameras
+from basecam.events import CameraEvent
+from basecam.exceptions import ExposureError
+
+
+__all__ = ["status", "sequence", "video", "readout_mode", "focus_sweep"]
+
+
+@camera_parser.command()
+@click.argument("CAMERAS", nargs=-1, type=str, required=False)
+async def status(command, cameras):
+    """Returns the status of a camera."""
+
+    cameras = get_cameras(command, cameras=cameras, fail_command=True)
+    if not cameras:  # pragma: no cover
+        return
+
+    for camera in cameras:
+        # Reads the status in the device worker instead of using the blocking
+        # get_status(update=True).
+        status = await camera.update_status()
+        if status is None:
+            return command.fail(
+                {
+                    "camera": camera.name,
+                    "error": "Camera did not respond to status request.",
+                }
+            )
+
+        command.info(status={"camera": camera.name, **status})
+
+    command.finish()
+
+
+@camera_parser.command()
+@click.argument("CAMERA_NAMES", nargs=-1, type=str, required=False)
+@click.argument("EXPTIME", type=float, required=False)
+@click.option(
+    "--object",
+    "image_type",
+    flag_value="object",
+    default=True,
+    help="Takes object exposures.",
+)
+@click.option("--flat", "image_type", flag_value="flat", help="Takes flats.")
+@click.option("--dark", "image_type", flag_value="dark", help="Takes darks.")
+@click.option("--bias", "image_type", flag_value="bias", help="Takes biases.")
+@click.option(
+    "-c",
+    "--count",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of exposures to take.",
+)
+@click.option(
+    "-i",
+    "--interval",
+    type=float,
+    default=0.0,
+    show_default=True,
+    help="Minimum time between the start of consecutive exposures.",
+)
+@click.option(
+    "--no-postprocess",
+    is_flag=True,
+    help="Skip the post-process step.",
+)
+async def sequence(
+    command,
+    camera_names,
+    exptime,
+    image_type,
+    count,
+    interval,
+    no_postprocess,
+):
+    """Takes a sequence of exposures setting up the cameras only once."""
+
+    cameras = get_cameras(command, cameras=camera_names, fail_command=True)
+    if not cameras:  # pragma: no cover
+        return
+
+    if image_type == "bias":
+        exptime = 0.0
+
+    if exptime is None:
+        return command.fail("Exposure time not provided.")
+
+    report_exposure_state_partial = partial(report_exposure_state, command)
+    command.actor.listener.register_callback(report_exposure_state_partial)
+
+    try:
+        results = await asyncio.gather(
+            *[
+                camera.expose_sequence(
+                    exptime,
+                    count,
+                    interval=interval,
+                    image_type=image_type,
+                    postprocess=not no_postprocess,
+                )
+                for camera in cameras
+            ],
+            return_exceptions=True,
+        )
+    finally:
+        # Allow leftover messages sent by the notifier to be output.
+        await asyncio.sleep(0.5)
+        command.actor.listener.remove_callback(report_exposure_state_partial)
+
+    def _value(value):
+        return value if value is not None else -999.0
+
+    failed = False
+    for camera, result in zip(cameras, results):
+        if isinstance(result, ExposureError):
+            command.error(error={"camera": camera.name, "error": str(result)})
+            failed = True
+            continue
+        elif isinstance(result, BaseException):
+            raise result
+
+        command.info(
+            sequence={
+                "camera": camera.name,
+                "count": result.count,
+                "elapsed": result.elapsed,
+                "cadence": _value(result.cadence),
+                "dead_time": _value(result.dead_time),
+            }
+        )
+
+        report_exposure_state(
+            command,
+            CameraEvent.EXPOSURE_IDLE,
+            {"name": camera.name},
+        )
+
+    if failed:
+        return command.fail("One or more cameras failed to expose.")
+
+    return command.finish()
+
+
+@camera_parser.command()
+@click.argument("CAMERA_NAMES", nargs=-1, type=str, required=False)
+@click.argument("EXPTIME", type=float, required=False)
+@click.option(
+    "-n",
+    "--frames",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Number of frames to deliver.",
+)
+@click.option(
+    "-d",
+    "--decimate",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Deliver only one of every N frames.",
+)
+async def video(command, camera_names, exptime, frames, decimate):
+    """Streams frames in video mode and reports the frame rate."""
+
+    cameras = get_cameras(command, cameras=camera_names, fail_command=True)
+    if not cameras:  # pragma: no cover
+        return
+
+    if exptime is None:
+        return command.fail("Exposure time not provided.")
+
+    async def stream_camera(camera):
+        async with camera.video(
+            exptime,
+            decimate=decimate,
+            max_frames=frames,
+        ) as stream:
+            async for _ in stream:
+                pass
+
+        return stream.stats
+
+    results = await asyncio.gather(
+        *[stream_camera(camera) for camera in cameras],
+        return_exceptions=True,
+    )
+
+    failed = False
+    for camera, result in zip(cameras, results):
+        if isinstance(result, Exception):
+            command.error(error={"camera": camera.name, "error": str(result)})
+            failed = True
+            continue
+
+        command.info(
+            video={
+                "camera": camera.name,
+                "n_frames": result.n_frames,
+                "n_delivered": result.n_delivered,
+                "n_dropped": result.n_dropped,
+                "frame_rate": result.frame_rate,
+            }
+        )
+
+    if failed:
+        return command.fail("One or more cameras failed to stream.")
+
+    return command.finish()
+
+
+@camera_parser.command(name="readout-mode")
+@click.argument("CAMERAS", nargs=-1, type=str, required=False)
+@click.option(
+    "-m",
+    "--mode",
+    type=str,
+    help="The name or index of the readout mode to set.",
+)
+async def readout_mode(command, cameras, mode):
+    """Reports or sets the readout mode."""
+
+    cameras = get_cameras(command, cameras=cameras, fail_command=True)
+    if not cameras:  # pragma: no cover
+        return
+
+    for camera in cameras:
+        if mode is not None:
+            try:
+                await camera.set_readout_mode(int(mode) if mode.isdigit() else mode)
+            except Exception as err:
+                return command.fail(error={"camera": camera.name, "error": str(err)})
+
+        command.info(
+            readout_mode={
+                "camera": camera.name,
+                "mode": camera._device.readout_mode_name,
+                "available": await camera.get_readout_modes(),
+            }
+        )
+
+    command.finish()
+
+
+@camera_parser.command(name="focus-sweep")
+@click.argument("CAMERA_NAMES", nargs=-1, type=str, required=False)
+@click.argument("EXPTIME", type=float, required=False)
+@click.option(
+    "-o",
+    "--offsets",
+    type=str,
+    required=True,
+    help="Comma-separated list of focus offsets.",
+)
+@click.option(
+    "-b",
+    "--binning",
+    type=int,
+    default=2,
+    show_default=True,
+    help="Binning of the exposures.",
+)
+@click.option(
+    "-a",
+    "--area",
+    type=int,
+    nargs=4,
+    default=None,
+    help="Image area to read as ul_x ul_y lr_x lr_y.",
+)
+@click.option(
+    "-m",
+    "--metric",
+    type=click.Choice(["hfd", "fwhm"]),
+    default="hfd",
+    show_default=True,
+    help="Focus metric to fit.",
+)
+@click.option(
+    "-f",
+    "--focus-command",
+    type=str,
+    default=None,
+    help="Command that moves the focus, with the actor first and {offset} "
+    "where the offset goes, e.g., 'tcc set focus={offset}/incr'. Required.",
+)
+@click.option("--write", is_flag=True, help="Write the exposures to disk.")
+async def focus_sweep(
+    command,
+    camera_names,
+    exptime,
+    offsets,
+    binning,
+    area,
+    metric,
+    focus_command,
+    write,
+):
+    """Exposes at a list of focus offsets and fits the best focus."""
+
+    cameras = get_cameras(command, cameras=camera_names, fail_command=True)
+    if not cameras:  # pragma: no cover
+        return
+
+    if exptime is None:
+        return command.fail("Exposure time not provided.")
+
+    try:
+        offset_values = [float(offset) for offset in offsets.split(",")]
+    except ValueError:
+        return command.fail(f"Invalid offsets {offsets!r}.")
+
+    # Without moving the focus all the frames would be taken at the same focus
+    # and the fitted best offset would be meaningless.
+    if not focus_command:
+        return command.fail("A focus command is required.")
+
+    if len(cameras) > 1:
+        return command.fail("Only one camera can move the focus.")
+
+    target, _, command_string = focus_command.strip().partition(" ")
+    command_string = command_string.strip()
+
+    try:
+        valid = command_string.format(offset=0.0) != command_string
+    except (KeyError, IndexError, ValueError):
+        valid = False
+
+    if not target or not valid:
+        return command.fail(
+            f"Invalid focus command {focus_command!r}. It must include the "
+            "actor and {offset}."
+        )
+
+    async def set_focus(offset):
+        focus_cmd = await command.send_command(
+            target,
+            command_string.format(offset=offset),
+        )
+        if focus_cmd.status.did_fail:
+            raise ExposureError(f"Failed setting the focus offset {offset}.")
+
+    results = await asyncio.gather(
+        *[
+            camera.focus_sweep(
+                exptime,
+                offset_values,
+                set_focus=set_focus,
+                binning=binning,
+                area=area or None,
+                metric=metric,
+                write=write,
+            )
+            for camera in cameras
+        ],
+        return_exceptions=True,
+    )
+
+    def _value(value):
+        return value if value is not None and math.isfinite(value) else -999.0
+
+    failed = False
+    for camera, result in zip(cameras, results):
+        if isinstance(result, Exception):
+            command.error(error={"camera": camera.name, "error": str(result)})
+            failed = True
+            continue
+
+        for point in result.points:
+            command.debug(
+                focus_point={
+                    "camera": camera.name,
+                    "offset": point.offset,
+                    "n_sources": point.n_sources,
+                    "fwhm": _value(point.fwhm),
+                    "hfd": _value(point.hfd),
+                }
+            )
+
+        command.info(
+            focus_sweep={
+                "camera": camera.name,
+                "metric": result.metric,
+                "best_offset": _value(result.best_offset),
+                "best_value": _value(result.best_value),
+                "n_rejected": result.n_rejected,
+            }
+        )
+
+    if failed:
+        return command.fail("One or more cameras failed the focus sweep.")
+
+    return command.finish()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: focus.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy
+
+from flicamera.sources import extract_sources
+from flicamera.stats import MAD_TO_STD
+
+
+__all__ = ["FocusPoint", "FocusSweepResult", "get_focus_point", "fit_focus"]
+
+
+#: Metrics that can be used to find the best focus.
+FOCUS_METRICS = ["hfd", "fwhm"]
+
+
+@dataclass
+class FocusPoint:
+    """The focus metric of a frame taken at a given focus offset.
+
+    ``fwhm`` and ``hfd`` are the medians for all the sources in the frame, in
+    unbinned pixels.
+
+    """
+
+    offset: float
+    n_sources: int
+    fwhm: float
+    hfd: float
+
+
+@dataclass
+class FocusSweepResult:
+    """The result of a focus sweep.
+
+    ``coefficients`` are the coefficients of the parabola fitted to the metric,
+    highest power first. ``best_offset`` is the offset at its minimum, or `None`
+    if the fit failed, the curve has no minimum, or the minimum is outside the
+    range of offsets that were swept.
+
+    """
+
+    metric: str
+    points: List[FocusPoint] = field(default_factory=list)
+    best_offset: Optional[float] = None
+    best_value: Optional[float] = None
+    coefficients: Optional[Tuple[float, float, float]] = None
+    n_rejected: int = 0
+
+
+def get_focus_point(
+    data: numpy.ndarray,
+    offset: float,
+    binning: int = 1,
+    min_sources: int = 1,
+    **kwargs,
+) -> FocusPoint:
+    """Calculates the focus metric of a frame.
+
+    The sources are detected with `.extract_sources` and the median of their
+    FWHM and half-flux diameter is used, which is robust against the occasional
+    cosmic ray or blended source.
+
+    Parameters
+    ----------
+    data
+        The frame.
+    offset
+        The focus offset at which the frame was taken.
+    binning
+        The binning of the frame. The metrics are returned in unbinned pixels.
+    min_sources
+        The minimum number of sources. If fewer are found, the metrics are NaN.
+    kwargs
+        Other arguments to pass to `.extract_sources`.
+
+    """
+
+    sources = extract_sources(data, **kwargs)
+
+    if len(sources) < min_sources:
+        return FocusPoint(offset, len(sources), numpy.nan, numpy.nan)
+
+    return FocusPoint(
+        offset=offset,
+        n_sources=len(sources),
+        fwhm=round(float(numpy.median(sources["fwhm"])) * binning, 3),
+        hfd=round(float(numpy.median(sources["hfd"])) * binning, 3),
+    )
+
+
+def fit_focus(
+    points: Sequence[FocusPoint],
+    metric: str = "hfd",
+    reject_sigma: float = 3.0,
+) -> FocusSweepResult:
+    """Fits a parabola to the focus metric and finds the best focus.
+
+    Points without a valid metric are ignored. After a first fit, points whose
+    residual is larger than ``reject_sigma`` times the standard deviation of
+    the residuals, estimated as 1.4826 times their median absolute value, are
+    rejected and the parabola is fitted again. The minimum of the parabola is
+    only reported as the best focus if it is within the offsets of the valid
+    points, since an extrapolated minimum is not reliable.
+
+    Parameters
+    ----------
+    points
+        The focus points of the sweep.
+    metric
+        The metric to fit, ``hfd`` or ``fwhm``.
+    reject_sigma
+        The rejection threshold.
+
+    """
+
+    if metric not in FOCUS_METRICS:
+        raise ValueError(f"invalid focus metric {metric!r}.")
+
+    result = FocusSweepResult(metric=metric, points=list(points))
+
+    offsets = numpy.array([point.offset for point in points], dtype=float)
+    values = numpy.array([getattr(point, metric) for point in points], dtype=float)
+
+    good = numpy.isfinite(values)
+    if numpy.unique(offsets[good]).size < 3:
+        return result
+
+    coefficients = numpy.polyfit(offsets[good], values[good], 2)
+
+    residuals = numpy.abs(values - numpy.polyval(coefficients, offsets))
+    mad = numpy.median(residuals[good])
+    if mad > 0:
+        keep = good & (residuals <= reject_sigma * MAD_TO_STD * mad)
+        if numpy.unique(offsets[keep]).size >= 3 and keep.sum() < good.sum():
+            coefficients = numpy.polyfit(offsets[keep], values[keep], 2)
+            result.n_rejected = int(good.sum() - keep.sum())
+
+    a, b, c = (float(value) for value in coefficients)
+    result.coefficients = (a, b, c)
+
+    if a > 0:
+        best = -b / (2 * a)
+        if best < offsets[good].min() or best > offsets[good].max():
+            return result
+
+        result.best_offset = round(best, 4)
+        result.best_value = round(float(numpy.polyval(coefficients, best)), 3)
+
+    return result
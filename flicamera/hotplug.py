@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: hotplug.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import pathlib
+from dataclasses import dataclass
+from logging import WARNING
+
+from typing import TYPE_CHECKING, Dict, Optional
+
+
+if TYPE_CHECKING:
+    from .camera import FLICameraSystem
+
+
+__all__ = [
+    "FLI_VENDOR_ID",
+    "HotplugEvent",
+    "HotplugEventSource",
+    "InotifyEventSource",
+    "HotplugMonitor",
+    "get_usb_devices",
+]
+
+
+#: The USB vendor ID of Finger Lakes Instrumentation.
+FLI_VENDOR_ID = "0f18"
+
+USB_DEV_PATH = "/dev/bus/usb"
+USB_SYSFS_PATH = "/sys/bus/usb/devices"
+
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+
+
+@dataclass
+class HotplugEvent:
+    """A USB device that has been plugged or unplugged."""
+
+    action: str
+    vendor_id: str
+    device: str
+
+
+def get_usb_devices(sysfs_path: str = USB_SYSFS_PATH) -> Dict[str, str]:
+    """Returns a mapping of USB sysfs device names to their vendor ID.
+
+    Only reads sysfs and does not communicate with the devices.
+
+    """
+
+    devices = {}
+
+    try:
+        entries = list(os.scandir(sysfs_path))
+    except OSError:
+        return devices
+
+    for entry in entries:
+        vendor_path = pathlib.Path(entry.path) / "idVendor"
+        try:
+            devices[entry.name] = vendor_path.read_text().strip().lower()
+        except OSError:
+            # Interfaces and hubs being removed do not have a vendor.
+            continue
+
+    return devices
+
+
+class HotplugEventSource(object):
+    """A source of `.HotplugEvent` events.
+
+    Subclasses must implement `.start` and `.stop` and call `.put` with new
+    events. The events are consumed by `.HotplugMonitor` using `.get`.
+
+    """
+
+    def __init__(self):
+        self._queue: asyncio.Queue[HotplugEvent] = asyncio.Queue()
+
+    async def start(self):
+        """Starts listening to events."""
+
+        pass
+
+    async def stop(self):
+        """Stops listening to events."""
+
+        pass
+
+    def put(self, event: HotplugEvent):
+        """Queues a new event."""
+
+        self._queue.put_nowait(event)
+
+    async def get(self) -> HotplugEvent:
+        """Waits for and returns the next event."""
+
+        return await self._queue.get()
+
+    def clear(self):
+        """Discards all the queued events."""
+
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+
+class InotifyEventSource(HotplugEventSource):
+    """Detects USB devices being plugged or unplugged using inotify.
+
+    Watches ``/dev/bus/usb`` for device nodes being created or deleted. When
+    that happens, the USB devices in sysfs are listed and compared with the
+    previous list to generate events with the vendor of each device.
+
+    Parameters
+    ----------
+    dev_path
+        The path to the USB device nodes.
+    sysfs_path
+        The path in sysfs with the USB devices.
+
+    Raises
+    ------
+    OSError
+        If inotify is not available or ``dev_path`` cannot be watched.
+
+    """
+
+    def __init__(
+        self,
+        dev_path: str = USB_DEV_PATH,
+        sysfs_path: str = USB_SYSFS_PATH,
+    ):
+        super().__init__()
+
+        self.dev_path = dev_path
+        self.sysfs_path = sysfs_path
+
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available in this system.")
+
+        if not os.path.isdir(self.dev_path):
+            raise OSError(f"{self.dev_path} does not exist.")
+
+        self._fd: Optional[int] = None
+        self._devices: Dict[str, str] = {}
+
+    def _add_watch(self, path: str):
+        """Adds an inotify watch for a directory."""
+
+        assert self._fd is not None
+
+        wd = self._libc.inotify_add_watch(
+            self._fd,
+            path.encode(),
+            IN_CREATE | IN_DELETE,
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"cannot watch {path}: {os.strerror(errno)}")
+
+    def _add_watches(self):
+        """Watches the USB device directory and each one of the bus directories."""
+
+        self._add_watch(self.dev_path)
+        for entry in os.scandir(self.dev_path):
+            if entry.is_dir():
+                self._add_watch(entry.path)
+
+    async def start(self):
+        """Starts watching the USB device directory."""
+
+        if self._fd is not None:
+            return
+
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+
+        self._fd = fd
+        self._add_watches()
+
+        self._devices = get_usb_devices(self.sysfs_path)
+
+        asyncio.get_running_loop().add_reader(self._fd, self._on_readable)
+
+    async def stop(self):
+        """Stops watching and closes the inotify file descriptor."""
+
+        if self._fd is None:
+            return
+
+        asyncio.get_running_loop().remove_reader(self._fd)
+        os.close(self._fd)
+        self._fd = None
+
+    def _on_readable(self):
+        """Drains the inotify events and generates hotplug events."""
+
+        assert self._fd is not None
+
+        while True:
+            try:
+                if not os.read(self._fd, 4096):
+                    break
+            except BlockingIOError:
+                break
+
+        # A new bus directory may have been created.
+        try:
+            self._add_watches()
+        except OSError:
+            pass
+
+        devices = get_usb_devices(self.sysfs_path)
+
+        for device in devices.keys() - self._devices.keys():
+            self.put(HotplugEvent("add", devices[device], device))
+
+        for device in self._devices.keys() - devices.keys():
+            self.put(HotplugEvent("remove", self._devices[device], device))
+
+        self._devices = devices
+
+
+class HotplugMonitor(object):
+    """Updates the list of cameras when FLI devices are plugged or unplugged.
+
+    An alternative to `~basecam.camera.CameraSystem.start_camera_poller` that
+    only calls `.FLICameraSystem.list_available_cameras` when a device with the
+    FLI vendor ID appears or disappears.
+
+    Parameters
+    ----------
+    camera_system
+        The camera system whose cameras will be updated.
+    source
+        The `.HotplugEventSource` to use. Defaults to `.InotifyEventSource`.
+    debounce
+        Time, in seconds, to wait after an event before checking the cameras.
+        Events received during that time are handled together. This also gives
+        time for the device node to be ready before it is opened.
+    vendor_id
+        The vendor ID of the devices that trigger an update.
+
+    """
+
+    def __init__(
+        self,
+        camera_system: FLICameraSystem,
+        source: Optional[HotplugEventSource] = None,
+        debounce: float = 0.5,
+        vendor_id: str = FLI_VENDOR_ID,
+    ):
+        self.camera_system = camera_system
+        self.source = source or InotifyEventSource()
+        self.debounce = debounce
+        self.vendor_id = vendor_id.lower()
+
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor is running."""
+
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """Starts the monitor and checks the cameras already connected."""
+
+        if self.running:
+            return
+
+        await self.source.start()
+        await self.camera_system._check_cameras()
+
+        self._task = asyncio.create_task(self._monitor())
+
+    async def stop(self):
+        """Stops the monitor."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.source.stop()
+
+    async def _monitor(self):
+        """Waits for events and updates the cameras."""
+
+        while True:
+            event = await self.source.get()
+            if event.vendor_id.lower() != self.vendor_id:
+                continue
+
+            self.camera_system.log(f"USB hotplug event: {event!r}.")
+
+            await asyncio.sleep(self.debounce)
+
+            # Other events received during the debounce period are handled
+            # by the same check.
+            self.source.clear()
+
+            try:
+                await self.camera_system._check_cameras()
+            except Exception as err:
+                self.camera_system.log(f"Failed checking cameras: {err}", WARNING)
@@ -11,9 +11,12 @@
 from __future__ import annotations
 
 import ctypes
+import errno
 import logging
 import os
 import pathlib
+import threading
+import time
 from ctypes import (
     POINTER,
     byref,
@@ -27,12 +30,23 @@ from ctypes import (
 )
 from functools import partial
 
-from typing import Callable, Dict, Optional, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 import numpy
 
 
-__ALL__ = ["LibFLI", "FLIWarning", "FLIError", "chk_err"]
+__ALL__ = ["LibFLI", "FLIWarning", "FLIError", "chk_err", "DeviceRegistry"]
 
 
 c_double_p = POINTER(c_double)
@@ -109,6 +123,16 @@ FLI_TEMPERATURE_CCD = 0x0000
 FLI_TEMPERATURE_BASE = 0x0001
 
 
+# Modes of a vertical table entry. libfli does not define names for them. Rows
+# in a skip entry are shifted out without being digitised. An entry with zero
+# height ends the table. The last entry is reserved by FLIEnableVerticalTable.
+
+VTABLE_MODE_SKIP = 0
+VTABLE_MODE_READ = 1
+
+VTABLE_MAX_ENTRIES = 63
+
+
 # Type specifying library debug levels.
 
 flidebug_t = c_long
@@ -347,32 +371,202 @@ _API_FUNCTION_PROTOTYPES = [
 ]
 
 
+# errno values returned by libfli when the device has been unplugged or its
+# handle is no longer valid, and those that can be the result of a transient
+# USB problem and are worth retrying.
+DISCONNECT_ERRNOS = {errno.ENODEV, errno.ENXIO, errno.ESHUTDOWN, errno.EPIPE}
+TRANSIENT_ERRNOS = {errno.EIO, errno.ETIMEDOUT, errno.EBUSY, errno.EAGAIN}
+
+
 def chk_err(err):
     """Wraps a libFLI C function call with error checking code."""
     if err < 0:
         msg = os.strerror(abs(err))  # err is always negative
-        raise FLIError(msg + f" ({err})")
+        raise FLIError(msg + f" ({err})", errno=abs(err))
     if err > 0:
         msg = os.strerror(err)
-        raise FLIWarning(msg + f" ({err})")
+        raise FLIWarning(msg + f" ({err})", errno=err)
     return err
 
 
 class FLIWarning(UserWarning):
     """A warning from the FLI library."""
 
-    pass
+    def __init__(self, message: str = "", errno: Optional[int] = None):
+        super().__init__(message)
+        self.errno = errno
+
+    def __reduce__(self):
+        # Keeps the errno when the error is sent from a worker process.
+        return (self.__class__, (str(self), self.errno))
 
 
 class FLIError(Exception):
-    """An error from the FLI library."""
+    """An error from the FLI library.
+
+    Parameters
+    ----------
+    message
+        The error message.
+    errno
+        The (positive) ``errno`` value returned by libfli, if known.
+
+    """
+
+    def __init__(self, message: str = "", errno: Optional[int] = None):
+        super().__init__(message)
+        self.errno = errno
+
+    def __reduce__(self):
+        return (self.__class__, (str(self), self.errno))
+
+    @property
+    def is_disconnect(self) -> bool:
+        """Whether the error indicates that the device is no longer available."""
+
+        return self.errno in DISCONNECT_ERRNOS
+
+    @property
+    def is_transient(self) -> bool:
+        """Whether the error may be caused by a transient USB problem."""
+
+        return self.errno in TRANSIENT_ERRNOS
+
+
+T = TypeVar("T")
+
+
+class DeviceRegistry(Generic[T]):
+    """An indexed collection of devices.
+
+    Devices are indexed by handle, name (the device path returned by ``FLIList``)
+    and serial, so that lookups are constant-time regardless of the number of
+    devices. Devices must provide ``handle``, ``name``, and ``serial`` attributes.
+    The registry is used both by `.LibFLI` and by the mock library.
+
+    Parameters
+    ----------
+    devices
+        An initial list of devices to add to the registry.
+
+    """
+
+    def __init__(self, devices: Iterable[T] = ()):
+        self._devices: Dict[int, T] = {}
+        self._keys: Dict[int, Tuple[Optional[int], str, str]] = {}
+
+        self._by_handle: Dict[int, T] = {}
+        self._by_name: Dict[str, T] = {}
+        self._by_serial: Dict[str, T] = {}
 
-    pass
+        # Devices can be opened concurrently from the camera workers.
+        self._lock = threading.RLock()
+
+        for device in devices:
+            self.add(device)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(list(self._devices.values()))
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def __getitem__(self, index: int) -> T:
+        return list(self._devices.values())[index]
+
+    def __contains__(self, device) -> bool:
+        return id(device) in self._devices
+
+    @staticmethod
+    def _get_keys(device) -> Tuple[Optional[int], str, str]:
+        """Returns the handle, name, and serial of a device."""
+
+        return (device.handle, device.name, device.serial)
+
+    def add(self, device: T):
+        """Adds a device to the registry or updates its indices."""
+
+        handle, name, serial = self._get_keys(device)
+
+        with self._lock:
+            self.remove(device)
+
+            self._devices[id(device)] = device
+            self._keys[id(device)] = (handle, name, serial)
+
+            if handle is not None:
+                self._by_handle[handle] = device
+            if name:
+                self._by_name[name] = device
+            if serial:
+                self._by_serial[serial] = device
+
+    append = add
+
+    def remove(self, device: T):
+        """Removes a device from the registry. Does not fail if not present."""
+
+        with self._lock:
+            if id(device) not in self._devices:
+                return
+
+            handle, name, serial = self._keys.pop(id(device))
+            self._devices.pop(id(device))
+
+            for index, key in (
+                (self._by_handle, handle),
+                (self._by_name, name),
+                (self._by_serial, serial),
+            ):
+                if index.get(key, None) is device:  # type: ignore
+                    index.pop(key)  # type: ignore
+
+    def get(
+        self,
+        handle: Optional[int] = None,
+        name: Optional[str] = None,
+        serial: Optional[str] = None,
+    ) -> Optional[T]:
+        """Returns a device by handle, name, or serial, or `None` if not found."""
+
+        if handle is not None:
+            return self._by_handle.get(handle, None)
+        elif name is not None:
+            return self._by_name.get(name, None)
+        elif serial is not None:
+            return self._by_serial.get(serial, None)
+
+        return None
+
+    def names(self) -> List[str]:
+        """Returns the names of the registered devices."""
+
+        return list(self._by_name)
+
+    def clear(self):
+        """Removes all the devices."""
+
+        with self._lock:
+            for index in (
+                self._devices,
+                self._keys,
+                self._by_handle,
+                self._by_name,
+                self._by_serial,
+            ):
+                index.clear()
 
 
 class LibFLI(ctypes.CDLL):
     """Wrapper for the FLI library.
 
+    Devices can be opened from several threads, but libfli keeps its open
+    devices in a global table that is not protected by a lock. `.open_lock` is
+    held around ``FLIOpen`` and ``FLIClose`` and while the `.LibFLIDevice`
+    instances are created, so those steps are serialised. All the other calls
+    to an open device, including its initialisation in `.LibFLIDevice.open`
+    and `.LibFLIDevice.probe`, can run in parallel.
+
     Parameters
     ----------
     shared_object
@@ -380,9 +574,18 @@ class LibFLI(ctypes.CDLL):
         default, internal version.
     debug
         Whether to use the debug mode.
+    simulation_mode
+        If `True` and ``shared_object`` is not provided, loads ``libflimock``,
+        the C mock of libfli built with the package.
+    log
+        A function used to log messages.
 
     """
 
+    #: Lock held around ``FLIOpen``, ``FLIClose``, and the creation of devices.
+    #: It is shared by all the instances because libfli state is global.
+    open_lock = threading.RLock()
+
     def __init__(
         self,
         shared_object: Optional[str] = None,
@@ -393,14 +596,20 @@ class LibFLI(ctypes.CDLL):
         self.domain = flidomain_t(FLIDOMAIN_USB | FLIDEVICE_CAMERA)
 
         if not shared_object:
+            workdir = pathlib.Path(__file__).parent
             if not simulation_mode:  # pragma: no cover
-                workdir = pathlib.Path(__file__).parent
-                shared_object_list = list(workdir.glob("libfli*.so"))
+                shared_object_list = [
+                    path
+                    for path in workdir.glob("libfli*.so")
+                    if not path.name.startswith("libflimock")
+                ]
                 if len(shared_object_list) == 0:
                     raise OSError("The library was compiled without a copy of libfli.")
                 shared_object = str(shared_object_list[0])
             else:
-                shared_object = "libflimock.so"
+                # The mock of libfli built with the package, see libflimock.c.
+                mock_list = list(workdir.glob("libflimock*.so"))
+                shared_object = str(mock_list[0]) if mock_list else "libflimock.so"
 
         self.libc = ctypes.cdll.LoadLibrary(shared_object)
 
@@ -415,6 +624,9 @@ class LibFLI(ctypes.CDLL):
 
         self.log = log or partial(logging.log, logging.DEBUG)
 
+        #: The devices opened by this library, indexed by handle, name, and serial.
+        self.devices: DeviceRegistry[LibFLIDevice] = DeviceRegistry()
+
         if debug:
             self.set_debug(True)
 
@@ -451,12 +663,58 @@ class LibFLI(ctypes.CDLL):
 
         return cameras
 
-    def get_camera(self, serial):
-        """Gets a camera by its serial string."""
+    def get_device(self, name: str, probe: bool = True) -> LibFLIDevice:
+        """Returns the device for a device path, opening it if not registered.
+
+        If ``probe=False``, only the information needed to identify and use the
+        device is read when it is opened (see `.LibFLIDevice.open`).
+
+        """
+
+        device = self.devices.get(name=name)
+        if device is None:
+            device = LibFLIDevice(name, self, probe=False)
+            self.devices.add(device)
+
+        if probe and not device.is_probed:
+            device.probe()
+
+        return device
+
+    def prune(self, names: Iterable[str]):
+        """Removes from the registry the devices whose names are not in ``names``.
+
+        The devices are not closed; this only ensures that the registry does not
+        return devices that are no longer listed by ``FLIList``.
+
+        """
+
+        names = set(names)
+        for device in self.devices:
+            if device.name not in names:
+                self.devices.remove(device)
+
+    def get_camera(self, serial, probe: bool = True):
+        """Gets a camera by its serial string.
+
+        Devices that have been opened before are looked up by serial without
+        issuing any call to the device. Only devices not yet in the registry
+        are opened, with ``probe`` passed to `.get_device`.
+
+        """
 
         camera_names = self.list_cameras()
+        self.prune(camera_names)
+
+        fli_camera = self.devices.get(serial=serial)
+        if fli_camera is not None:
+            return fli_camera
+
         for camera_name in camera_names:
-            fli_camera = LibFLIDevice(camera_name, self)
+            if self.devices.get(name=camera_name) is not None:
+                continue
+
+            fli_camera = self.get_device(camera_name, probe=probe)
             if fli_camera.serial == serial:
                 return fli_camera
 
@@ -468,15 +726,33 @@ class LibFLIDevice(object):
 
     _instances = {}
 
-    def __new__(cls, name, lib):
+    # Readout modes by serial number. The modes of a camera do not change, so
+    # they are only enumerated the first time the camera is opened.
+    _readout_modes: Dict[str, List[str]] = {}
+
+    def __new__(cls, name, lib, probe: bool = True):
         # Create a singleton to avoid opening the camera multiple times.
-        if name not in cls._instances:
-            cls._instances[name] = super(LibFLIDevice, cls).__new__(cls)
-            cls._instances[name].is_open = False
+        with LibFLI.open_lock:
+            if name not in cls._instances:
+                instance = super(LibFLIDevice, cls).__new__(cls)
+                instance.is_open = False
+                instance._init_lock = threading.Lock()
+                cls._instances[name] = instance
+
+            return cls._instances[name]
+
+    def __init__(self, name, lib, probe: bool = True):
+        # Only one thread opens the instance, but different devices are
+        # opened in parallel.
+        with self._init_lock:
+            self._initialise(name, lib)
 
-        return cls._instances[name]
+        if probe and not self.is_probed:
+            self.probe()
+
+    def _initialise(self, name, lib):
+        """Sets the attributes of a new instance and opens the device."""
 
-    def __init__(self, name, lib):
         if not self.is_open:
             self.domain = flidomain_t(FLIDOMAIN_USB | FLIDEVICE_CAMERA)
             self._str_size = 100
@@ -490,8 +766,11 @@ class LibFLIDevice(object):
             self._model = ctypes.create_string_buffer(self._str_size)
             self._serial = ctypes.create_string_buffer(self._str_size)
 
-            self.fwrev: int
-            self.hwrev: int
+            self.fwrev: int = 0
+            self.hwrev: int = 0
+
+            # Whether the information read by probe() is available.
+            self.is_probed = False
 
             self.hbin: int
             self.vbin: int
@@ -502,7 +781,32 @@ class LibFLIDevice(object):
             self.shutter = False
             self._temperature: Dict[str, float] = {"CCD": 0.0, "base": 0.0}
 
-            self.open()
+            self.video_mode = False
+
+            # The bit depth of the readout (8 or 16).
+            self.bit_depth: int = 16
+
+            # Flushing, as set by set_nflushes and set_background_flush.
+            self.nflushes: int = 0
+            self.background_flush: bool = True
+
+            # The readout modes supported by the camera and the current one.
+            self.readout_modes: List[str] = []
+            self.readout_mode: int = 0
+
+            # Windows read using the vertical table, their position in the
+            # readout frame (row0, row1, col0, col1), and the readout shape.
+            self.windows: List[Tuple[int, int, int, int]] = []
+            self.window_slices: List[Tuple[int, int, int, int]] = []
+            self.readout_shape: Tuple[int, int] = (0, 0)
+
+            self.open(probe=False)
+
+    @property
+    def handle(self) -> int:
+        """The ``flidev_t`` handle of the device."""
+
+        return self.dev.value
 
     @property
     def model(self):
@@ -524,46 +828,89 @@ class LibFLIDevice(object):
 
         return self._temperature
 
-    def open(self):
-        """Opens the device and grabs information."""
+    def open(self, probe: bool = True):
+        """Opens the device and grabs information.
 
-        self.libc.FLIOpen(byref(self.dev), self.name.encode(), self.domain)
-        self.libc.FLILockDevice(self.dev)
+        Parameters
+        ----------
+        probe
+            Whether to also read the information that is not needed to expose
+            (see `.probe`). If `False`, `.probe` can be called later. Only
+            ``FLIOpen`` is called with `.LibFLI.open_lock` held.
 
-        fwrev = c_long()
-        self.libc.FLIGetFWRevision(self.dev, byref(fwrev))
-        self.fwrev = fwrev.value
+        """
 
-        hwrev = c_long()
-        self.libc.FLIGetHWRevision(self.dev, byref(hwrev))
-        self.hwrev = hwrev.value
+        with LibFLI.open_lock:
+            self.libc.FLIOpen(byref(self.dev), self.name.encode(), self.domain)
+
+        self.libc.FLILockDevice(self.dev)
 
         self.libc.FLIGetModel(self.dev, self._model, self._str_size)
         self.libc.FLIGetSerialString(self.dev, self._serial, self._str_size)
 
+        # libfli resets the flushing settings when the device is opened.
+        self.nflushes = 0
+        self.background_flush = True
+
         # The camera doesn't allow to get the status of the shutter so we
         # close it on initialisation to be sure we know where it is.
         self.set_shutter(False)
 
-        # Set bit depth (all our cameras should support 16bits)
-        # self.libc.FLISetBitDepth(self.dev, FLI_MODE_16BIT)
-
-        self._update_temperature()
+        # libfli opens the cameras in 16-bit mode. Setting it explicitly
+        # fails in some cameras.
+        self.bit_depth = 16
 
         # Sets the binning to (1, 1) and resets the image area.
         self.set_binning(1, 1)
 
+        self.is_probed = False
         self.is_open = True
 
-    def disconnect(self):
-        """Disconnects and frees the device."""
+        if probe:
+            self.probe()
 
-        self.libc.FLIUnlockDevice(self.dev)
+    def probe(self):
+        """Reads the revisions, readout modes and temperatures of the device."""
+
+        fwrev = c_long()
+        self.libc.FLIGetFWRevision(self.dev, byref(fwrev))
+        self.fwrev = fwrev.value
 
-        if self.is_open:
+        hwrev = c_long()
+        self.libc.FLIGetHWRevision(self.dev, byref(hwrev))
+        self.hwrev = hwrev.value
+
+        self.readout_modes = self.get_readout_modes()
+        self.readout_mode = self.get_readout_mode()
+
+        self._update_temperature()
+
+        self.is_probed = True
+
+    def close(self):
+        """Closes the device handle without releasing the device.
+
+        The device can be reopened with `.open`.
+
+        """
+
+        with LibFLI.open_lock:
             self.libc.FLIClose(self.dev)
 
-        LibFLIDevice._instances.pop(self.name, None)
+    def disconnect(self):
+        """Disconnects and frees the device."""
+
+        with LibFLI.open_lock:
+            try:
+                self.libc.FLIUnlockDevice(self.dev)
+
+                if self.is_open:
+                    self.libc.FLIClose(self.dev)
+            finally:
+                # Always release the instance, even if the device is gone.
+                self.is_open = False
+                LibFLIDevice._instances.pop(self.name, None)
+                self.lib.devices.remove(self)
 
     def _update_temperature(self):
         """Gets the temperatures and updates the ``temperature`` dict."""
@@ -610,6 +957,161 @@ class LibFLIDevice(object):
 
         return cooler.value
 
+    def get_readout_modes(self, refresh: bool = False) -> List[str]:
+        """Returns the names of the readout modes supported by the camera.
+
+        The modes are enumerated with ``FLIGetCameraModeString`` and cached by
+        serial number. Use ``refresh=True`` to enumerate them again.
+
+        """
+
+        serial = self.serial
+        if not refresh and serial in LibFLIDevice._readout_modes:
+            return LibFLIDevice._readout_modes[serial].copy()
+
+        modes: List[str] = []
+        mode_string = ctypes.create_string_buffer(self._str_size)
+
+        while True:
+            try:
+                self.libc.FLIGetCameraModeString(
+                    self.dev,
+                    flimode_t(len(modes)),
+                    mode_string,
+                    self._str_size,
+                )
+            except FLIError as err:
+                # libfli returns EINVAL after the last mode.
+                if err.errno != errno.EINVAL:
+                    raise
+                break
+
+            modes.append(mode_string.value.decode())
+
+        LibFLIDevice._readout_modes[serial] = modes
+
+        return modes.copy()
+
+    def get_readout_mode(self) -> int:
+        """Returns the index of the current readout mode."""
+
+        mode = flimode_t()
+        self.libc.FLIGetCameraMode(self.dev, byref(mode))
+
+        return mode.value
+
+    def set_readout_mode(self, mode: int | str):
+        """Sets the readout mode.
+
+        Parameters
+        ----------
+        mode
+            The index or the name of the mode, as returned by
+            `.get_readout_modes`.
+
+        """
+
+        if not self.readout_modes:
+            self.readout_modes = self.get_readout_modes()
+
+        if isinstance(mode, str):
+            if mode not in self.readout_modes:
+                raise ValueError(f"unknown readout mode {mode!r}.")
+            mode = self.readout_modes.index(mode)
+        elif self.readout_modes and not 0 <= mode < len(self.readout_modes):
+            raise ValueError(f"invalid readout mode index {mode}.")
+
+        self.libc.FLISetCameraMode(self.dev, flimode_t(mode))
+        self.readout_mode = mode
+
+    @property
+    def readout_mode_name(self) -> str:
+        """The name of the current readout mode."""
+
+        if 0 <= self.readout_mode < len(self.readout_modes):
+            return self.readout_modes[self.readout_mode]
+
+        return "UNKNOWN"
+
+    def set_bit_depth(self, bit_depth: int):
+        """Sets the bit depth of the readout.
+
+        In 8-bit mode frames are read into ``uint8`` arrays. Raises `.FLIError`
+        with ``EINVAL`` if the camera does not support the bit depth.
+
+        """
+
+        if bit_depth not in (8, 16):
+            raise ValueError("bit_depth must be 8 or 16.")
+
+        mode = FLI_MODE_8BIT if bit_depth == 8 else FLI_MODE_16BIT
+        self.libc.FLISetBitDepth(self.dev, mode)
+
+        self.bit_depth = bit_depth
+
+    def set_nflushes(self, nflushes: int):
+        """Sets the number of times the array is flushed before an exposure.
+
+        libfli flushes the array in ``FLIExposeFrame``, so each flush delays the
+        start of the integration by the time needed to shift the whole array.
+
+        """
+
+        if nflushes < 0 or nflushes > 16:
+            raise ValueError("nflushes must be between 0 and 16.")
+
+        self.libc.FLISetNFlushes(self.dev, c_long(nflushes))
+        self.nflushes = nflushes
+
+    def set_background_flush(self, enabled: bool):
+        """Starts or stops flushing the array while the camera is idle."""
+
+        bgflush = FLI_BGFLUSH_START if enabled else FLI_BGFLUSH_STOP
+        self.libc.FLIControlBackgroundFlush(self.dev, flibgflush_t(bgflush))
+        self.background_flush = enabled
+
+    def get_device_status(self) -> int:
+        """Returns the camera status as returned by ``FLIGetDeviceStatus``."""
+
+        status = c_long()
+        self.libc.FLIGetDeviceStatus(self.dev, byref(status))
+
+        return status.value & 0xFFFFFFFF
+
+    def expose_frame_timed(self, timeout: float = 10.0) -> float:
+        """Starts an exposure and returns the time until the integration starts.
+
+        The time is measured from the call to ``FLIExposeFrame`` until the
+        camera status is no longer idle. It includes the flushes done by libfli
+        before starting the exposure. If the camera does not report its status,
+        returns the time taken by ``FLIExposeFrame``.
+
+        """
+
+        start_time = time.perf_counter()
+        self.expose_frame()
+
+        while True:
+            status = self.get_device_status()
+            elapsed = time.perf_counter() - start_time
+
+            if status == FLI_CAMERA_STATUS_UNKNOWN:
+                return elapsed
+
+            if (status & FLI_CAMERA_STATUS_MASK) in (
+                FLI_CAMERA_STATUS_EXPOSING,
+                FLI_CAMERA_STATUS_READING_CCD,
+            ) or (status & FLI_CAMERA_DATA_READY):
+                return elapsed
+
+            if elapsed > timeout:
+                raise FLIError(
+                    "timed out waiting for the exposure to start.",
+                    errno.ETIMEDOUT,
+                )
+
+            time.sleep(0.001)
+
     def set_exposure_time(self, exp_time: float):
         """Sets the exposure time.
 
@@ -671,6 +1173,160 @@ class LibFLIDevice(object):
 
         self.area = (ul_x - v_ul_x, ul_y - v_ul_y, lr_x - v_ul_x, lr_y - v_ul_y)
 
+        # Setting the image area disables the vertical table.
+        self.windows = []
+        self.window_slices = []
+        self.readout_shape = (0, 0)
+
+    def set_windows(self, windows: Sequence[Tuple[int, int, int, int]]):
+        """Reads only the rows of the detector that contain ``windows``.
+
+        Uses the vertical table of the camera. The rows between windows are
+        shifted out without being digitised, and the rows of overlapping windows
+        are read once. Since all rows share the same columns, the readout frame
+        spans the columns of all the windows. Use `.extract_windows` to get the
+        cutout of each window from the frame returned by `.read_frame`.
+
+        The windows are kept until `.clear_windows`, `.set_image_area`, or
+        `.set_binning` are called.
+
+        Parameters
+        ----------
+        windows
+            A list of windows in the format :math:`(ul_x, ul_y, lr_x, lr_y)`,
+            in unbinned pixels and with the same origin as `.set_image_area`.
+            Windows are expanded to a multiple of the binning.
+
+        """
+
+        if len(windows) == 0:
+            raise ValueError("no windows provided.")
+
+        hbin = self.hbin
+        vbin = self.vbin
+
+        v_ul_x, v_ul_y, v_lr_x, v_lr_y = self.get_visible_area()
+        width = v_lr_x - v_ul_x
+        height = v_lr_y - v_ul_y
+
+        snapped: List[Tuple[int, int, int, int]] = []
+        for ul_x, ul_y, lr_x, lr_y in windows:
+            if not (0 <= ul_x < lr_x <= width and 0 <= ul_y < lr_y <= height):
+                raise ValueError(f"invalid window {(ul_x, ul_y, lr_x, lr_y)}.")
+
+            snapped.append(
+                (
+                    ul_x // hbin * hbin,
+                    ul_y // vbin * vbin,
+                    min(-(-lr_x // hbin) * hbin, width),
+                    min(-(-lr_y // vbin) * vbin, height),
+                )
+            )
+
+        # Merges the rows of the windows into bands.
+        bands: List[List[int]] = []
+        for ul_y, lr_y in sorted((window[1], window[3]) for window in snapped):
+            if bands and ul_y <= bands[-1][1]:
+                bands[-1][1] = max(bands[-1][1], lr_y)
+            else:
+                bands.append([ul_y, lr_y])
+
+        entries: List[Tuple[int, int, int]] = []
+        row = 0
+        for ul_y, lr_y in bands:
+            if ul_y > row:
+                entries.append((ul_y - row, 1, VTABLE_MODE_SKIP))
+            entries.append((lr_y - ul_y, vbin, VTABLE_MODE_READ))
+            row = lr_y
+
+        if len(entries) >= VTABLE_MAX_ENTRIES:
+            raise ValueError("too many row bands for the vertical table.")
+
+        col0 = min(window[0] for window in snapped)
+        col1 = max(window[2] for window in snapped)
+        n_cols = (col1 - col0) // hbin
+        n_rows = sum((lr_y - ul_y) // vbin for ul_y, lr_y in bands)
+
+        self.libc.FLIEnableVerticalTable(self.dev, n_cols, v_ul_x + col0, 0)
+        for index, (entry_height, entry_bin, mode) in enumerate(entries):
+            self.libc.FLISetVerticalTableEntry(
+                self.dev,
+                index,
+                entry_height,
+                entry_bin,
+                mode,
+            )
+        self.libc.FLISetVerticalTableEntry(self.dev, len(entries), 0, 0, 0)
+
+        readout_width, _, _, readout_height, _, _ = self.get_readout_dimensions()
+        if (readout_height, readout_width) != (n_rows, n_cols):
+            raise FLIError(
+                f"readout dimensions {(readout_height, readout_width)} do not "
+                f"match the windows {(n_rows, n_cols)}."
+            )
+
+        # Position of each window in the readout frame.
+        slices: List[Tuple[int, int, int, int]] = []
+        for ul_x, ul_y, lr_x, lr_y in snapped:
+            band_row = 0
+            for band_ul_y, band_lr_y in bands:
+                if band_ul_y <= ul_y < band_lr_y:
+                    break
+                band_row += (band_lr_y - band_ul_y) // vbin
+
+            row0 = band_row + (ul_y - band_ul_y) // vbin
+            col0_window = (ul_x - col0) // hbin
+            slices.append(
+                (
+                    row0,
+                    row0 + (lr_y - ul_y) // vbin,
+                    col0_window,
+                    col0_window + (lr_x - ul_x) // hbin,
+                )
+            )
+
+        self.windows = snapped
+        self.window_slices = slices
+        self.readout_shape = (n_rows, n_cols)
+
+    def clear_windows(self):
+        """Disables the vertical table and restores the image area."""
+
+        self.set_image_area(self.area)
+
+    def extract_windows(self, frame: numpy.ndarray) -> List[numpy.ndarray]:
+        """Returns the cutouts of the windows from a readout frame.
+
+        The cutouts are views of ``frame`` in the same order as the windows
+        passed to `.set_windows`.
+
+        """
+
+        if frame.shape != self.readout_shape:
+            raise ValueError("frame does not match the readout shape.")
+
+        return [
+            frame[row0:row1, col0:col1] for row0, row1, col0, col1 in self.window_slices
+        ]
+
+    def get_readout_dimensions(self) -> Tuple[int, int, int, int, int, int]:
+        """Returns the dimensions of the next readout.
+
+        Returns
+        -------
+        dimensions
+            A tuple ``(width, hoffset, hbin, height, voffset, vbin)`` as returned
+            by ``FLIGetReadoutDimensions``.
+
+        """
+
+        values = [c_long() for _ in range(6)]
+        self.libc.FLIGetReadoutDimensions(self.dev, *[byref(v) for v in values])
+
+        width, hoffset, hbin, height, voffset, vbin = (v.value for v in values)
+
+        return (width, hoffset, hbin, height, voffset, vbin)
+
     def get_visible_area(self) -> Tuple[int, int, int, int]:
         """Returns the visible area.
 
@@ -733,8 +1389,8 @@ class LibFLIDevice(object):
 
         self.libc.FLICancelExposure(self.dev)
 
-    def start_exposure(self, frametype="normal"):
-        """Starts and exposure and returns immediately."""
+    def set_frame_type(self, frametype="normal"):
+        """Sets the frame type (``normal`` or ``dark``) and disables TDI."""
 
         if frametype == "dark":
             frametype = FLI_FRAME_TYPE_DARK
@@ -743,9 +1399,57 @@ class LibFLIDevice(object):
 
         self.libc.FLISetFrameType(self.dev, fliframe_t(frametype))
         self.libc.FLISetTDI(self.dev, 0, 0)
+
+    def expose_frame(self):
+        """Starts an exposure with the current settings and returns immediately."""
+
         self.libc.FLIExposeFrame(self.dev)
 
-    def read_frame(self):
+    def start_exposure(self, frametype="normal"):
+        """Starts and exposure and returns immediately."""
+
+        self.set_frame_type(frametype)
+        self.expose_frame()
+
+    def get_frame_shape(self) -> Tuple[int, int]:
+        """Returns the shape ``(n_rows, n_cols)`` of the binned image area.
+
+        If windows are set, returns the shape of the readout frame.
+
+        """
+
+        if self.windows:
+            return self.readout_shape
+
+        (ul_x, ul_y, lr_x, lr_y) = self.area
+
+        n_cols = int((lr_x - ul_x) / self.hbin)
+        n_rows = int((lr_y - ul_y) / self.vbin)
+
+        return (n_rows, n_cols)
+
+    def get_frame_dtype(self) -> numpy.dtype:
+        """Returns the data type of the frame for the current bit depth."""
+
+        return numpy.dtype(numpy.uint8 if self.bit_depth == 8 else numpy.uint16)
+
+    def _get_frame_buffer(self, out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """Returns ``out`` after checking it matches the frame, or a new array."""
+
+        shape = self.get_frame_shape()
+        dtype = self.get_frame_dtype()
+
+        if out is None:
+            return numpy.empty(shape, dtype=dtype)
+
+        if out.shape != shape or out.dtype != dtype or not out.flags.c_contiguous:
+            raise ValueError(
+                f"out must be a C-contiguous {dtype} array of shape {shape}."
+            )
+
+        return out
+
+    def read_frame(self, out: Optional[numpy.ndarray] = None):
         """Reads the image frame.
 
         This function reads the image buffer row by row. In principle it could
@@ -753,22 +1457,66 @@ class LibFLIDevice(object):
         show that the gain is marginal so it's ok to keep it as a pure Python
         method.
 
+        Parameters
+        ----------
+        out
+            A C-contiguous array with the shape and data type of the frame (see
+            `.get_frame_shape` and `.get_frame_dtype`) into which the image is
+            read. If not provided, a new array is allocated.
+
         """
 
         if self.get_exposure_time_left() > 0:
             raise FLIError("the camera is still exposing.")
 
-        (ul_x, ul_y, lr_x, lr_y) = self.area
-
-        n_cols = int((lr_x - ul_x) / self.hbin)
-        n_rows = int((lr_y - ul_y) / self.vbin)
-
-        array = numpy.empty((n_rows, n_cols), dtype=numpy.uint16)
+        array = self._get_frame_buffer(out)
+        n_rows, n_cols = array.shape
 
-        img_ptr = array.ctypes.data_as(POINTER(ctypes.c_uint16))
+        img_ptr = array.ctypes.data_as(POINTER(ctypes.c_uint8))
 
         for row in range(n_rows):
-            offset = row * n_cols * ctypes.sizeof(ctypes.c_uint16)
+            offset = row * n_cols * array.itemsize
             self.libc.FLIGrabRow(self.dev, byref(img_ptr.contents, offset), n_cols)
 
         return array
+
+    def start_video(self):
+        """Starts video mode using the current exposure time, binning and area.
+
+        Frames must be retrieved with `.grab_video_frame` until `.stop_video` is
+        called.
+
+        """
+
+        self.libc.FLIStartVideoMode(self.dev)
+        self.video_mode = True
+
+    def grab_video_frame(self, out: Optional[numpy.ndarray] = None):
+        """Grabs the next video frame.
+
+        Blocks until the frame is available.
+
+        Parameters
+        ----------
+        out
+            A C-contiguous array with the shape and data type of the frame into
+            which the frame is read. If not provided, a new array is allocated.
+
+        """
+
+        if not self.video_mode:
+            raise FLIError("video mode is not active.")
+
+        out = self._get_frame_buffer(out)
+
+        self.libc.FLIGrabVideoFrame(self.dev, out.ctypes.data_as(c_void_p), out.nbytes)
+
+        return out
+
+    def stop_video(self):
+        """Stops video mode."""
+
+        try:
+            self.libc.FLIStopVideoMode(self.dev)
+        finally:
+            self.video_mode = False
@@ -10,36 +10,96 @@ from __future__ import annotations
 
 import ctypes
 import errno
+import pathlib
+import threading
 import time
 import unittest.mock
+from functools import partial
 from glob import glob
 
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
-import astropy.io.fits
-import astropy.table
 import numpy
-from astropy.modeling.models import Gaussian2D
-from photutils.datasets import apply_poisson_noise, make_model_image, make_noise_image
 
 import flicamera.lib
 
 from .camera import FLICameraSystem
 
 
+if TYPE_CHECKING:
+    import astropy.table
+
+
 DEV_COUNTER = 0
 
 
-def read_frame_mock(self):
+def read_frame_mock(self, out: Optional[numpy.ndarray] = None):
     """Mock version of `.LibFLIDevice.read_frame` for fast reading."""
 
-    return self.libc._get_image(self.dev)
+    image = self.libc._get_image(self.dev)
+
+    if out is None:
+        return image
+
+    out[...] = image[: out.shape[0], : out.shape[1]]
+
+    return out
+
+
+def get_mock_devices(
+    devices: Dict[str, Any],
+    faults: Optional[Dict[str, Any]] = None,
+) -> List[MockFLIDevice]:
+    """Returns a list of mocked devices.
+
+    See `.get_mock_camera_system` for the format of ``devices``. The
+    ``faults`` parameters apply to all the devices and are updated with the
+    ``faults`` section of each device.
+
+    """
+
+    return [
+        MockFLIDevice(
+            devname,
+            exposure_params=devices[devname].get("exposures", []),
+            status_params=devices[devname].get("params", {}),
+            readout_params=devices[devname].get("readout", {}),
+            fault_params={**(faults or {}), **devices[devname].get("faults", {})},
+        )
+        for devname in devices
+    ]
+
+
+def get_mock_lib(
+    devices: Dict[str, Any],
+    fast_read: bool = True,
+    faults: Optional[Dict[str, Any]] = None,
+) -> flicamera.lib.LibFLI:
+    """Returns a `.LibFLI` object with mock devices attached.
+
+    Can be used (with `functools.partial`) as the ``lib_factory`` of
+    `.FLICameraSystem` to run mock devices in device processes.
+
+    """
+
+    with unittest.mock.patch("ctypes.cdll.LoadLibrary", MockLibFLI):
+        lib = flicamera.lib.LibFLI(simulation_mode=True)
+
+    if fast_read is True:
+        flicamera.lib.LibFLIDevice.read_frame = read_frame_mock
+
+    assert isinstance(lib.libc, MockLibFLI)
+    lib.libc.devices = get_mock_devices(devices, faults=faults)
+
+    return lib
 
 
 async def get_mock_camera_system(
     devices: Dict[str, Any],
     camera_config: Dict[str, Any] = {},
     fast_read: bool = True,
+    process_isolation: bool = False,
+    faults: Optional[Dict[str, Any]] = None,
 ) -> FLICameraSystem:
     """Returns a camera system with mock devices attached.
 
@@ -53,12 +113,26 @@ async def get_mock_camera_system(
     fast_read
         If `True`, skips reading the mocked image row by row. This is significantly
         faster for large images.
+    process_isolation
+        If `True`, each mocked device runs in its own process. See
+        `.FLICameraSystem`.
+    faults
+        Parameters of the `.FaultInjector` of all the devices. Each device can
+        update them with its own ``faults`` section.
+
     """
 
     with unittest.mock.patch("ctypes.cdll.LoadLibrary", MockLibFLI):
         camera_system = FLICameraSystem(
             simulation_mode=True,
             camera_config=camera_config,
+            process_isolation=process_isolation,
+            lib_factory=partial(
+                get_mock_lib,
+                devices,
+                fast_read=fast_read,
+                faults=faults,
+            ),
         )
         camera_system.setup()
 
@@ -73,15 +147,8 @@ async def get_mock_camera_system(
         if fast_read is True:
             flicamera.lib.LibFLIDevice.read_frame = read_frame_mock
 
-        for devname in devices:
-            device = MockFLIDevice(
-                devname,
-                exposure_params=devices[devname].get("exposures", {}),
-                status_params=devices[devname].get("params", {}),
-            )
-            camera_system.lib.libc.devices.append(device)
+        camera_system.lib.libc.devices = get_mock_devices(devices, faults=faults)
 
-        camera_system.setup()
         for camera_name in devices:
             await camera_system.add_camera(
                 name=camera_name,
@@ -91,12 +158,89 @@ async def get_mock_camera_system(
         return camera_system
 
 
+def get_libflimock_path() -> Optional[str]:
+    """Returns the path to ``libflimock``, the C mock of libfli, if it was built."""
+
+    mock_list = list(pathlib.Path(__file__).parent.glob("libflimock*.so"))
+
+    return str(mock_list[0]) if mock_list else None
+
+
+def add_libflimock_device(
+    lib: flicamera.lib.LibFLI,
+    name: str,
+    serial: str,
+    model: Optional[str] = None,
+    shape: Tuple[int, int] = (512, 512),
+    pixel_rate: float = 0.0,
+    row_overhead: float = 0.0,
+    flush_row_time: float = 0.0,
+    call_latency: float = 0.0,
+):
+    """Adds a device to a `.LibFLI` that has loaded ``libflimock``.
+
+    Parameters
+    ----------
+    lib
+        The `.LibFLI` object.
+    name
+        The device name, as returned by ``FLIList``.
+    serial
+        The serial number of the device.
+    model
+        The model of the device.
+    shape
+        The shape of the chip, as ``(n_rows, n_cols)``.
+    pixel_rate
+        The number of binned pixels digitised per second. Zero for instantaneous
+        readout.
+    row_overhead
+        The time, in seconds, to shift one physical row into the serial register.
+    flush_row_time
+        The time, in seconds, to shift one row out when flushing.
+    call_latency
+        The minimum duration, in seconds, of each call to the device.
+
+    """
+
+    libc = lib.libc
+
+    libc.FLIMockAddDevice.argtypes = [
+        ctypes.c_char_p,
+        ctypes.c_char_p,
+        ctypes.c_char_p,
+        ctypes.c_long,
+        ctypes.c_long,
+    ]
+    libc.FLIMockAddDevice.restype = flicamera.lib.chk_err
+
+    libc.FLIMockSetTiming.argtypes = [ctypes.c_char_p] + [ctypes.c_double] * 4
+    libc.FLIMockSetTiming.restype = flicamera.lib.chk_err
+
+    libc.FLIMockAddDevice(
+        name.encode(),
+        serial.encode(),
+        model.encode() if model else None,
+        shape[1],
+        shape[0],
+    )
+    libc.FLIMockSetTiming(
+        name.encode(),
+        pixel_rate,
+        row_overhead,
+        flush_row_time,
+        call_latency,
+    )
+
+
 def get_source_table(
     param_ranges: dict[str, Any],
     n_sources: int = 1,
 ) -> astropy.table.Table:
     """Returns a table of sources."""
 
+    import astropy.table
+
     def get_random_range(param):
         if isinstance(param_ranges[param], list):
             return numpy.random.uniform(
@@ -130,6 +274,375 @@ def get_source_table(
     return source_table
 
 
+class FrameCache(object):
+    """A cache of archived frames that are replayed by a mock device.
+
+    Frames are read in order. Each time a frame is requested, a background
+    thread starts decoding the next ``prefetch`` files so that they are
+    ready before the next exposure. Only the current frame and the prefetched
+    ones are kept in memory.
+
+    If ``cache_dir`` is set, each file is decompressed once and its data is
+    saved there as a ``.npy`` file, which is memory-mapped the next time the
+    frame is needed. This makes replaying compressed images as fast as reading
+    them from the page cache. `.warm` decompresses all the files in advance.
+
+    Parameters
+    ----------
+    files
+        The list of FITS files to replay. The data of the first HDU with data
+        is used.
+    prefetch
+        The number of frames to decode ahead of the current one. If zero, the
+        frames are decoded when requested.
+    cache_dir
+        The directory in which to keep the decompressed frames.
+
+    """
+
+    def __init__(
+        self,
+        files: List[str],
+        prefetch: int = 4,
+        cache_dir: Optional[Union[str, pathlib.Path]] = None,
+    ):
+        if len(files) == 0:
+            raise ValueError("no files to replay.")
+
+        self.files = list(files)
+        self.prefetch = min(max(prefetch, 0), len(self.files) - 1)
+
+        self.cache_dir = pathlib.Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._frames: Dict[int, numpy.ndarray] = {}
+        self._loading: set[int] = set()
+        self._failed: set[int] = set()
+        self._current = 0
+
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+        self.n_hits = 0
+        self.n_misses = 0
+
+    def __len__(self):
+        return len(self.files)
+
+    def _get_cache_path(self, index: int) -> Optional[pathlib.Path]:
+        """Returns the path to the decompressed frame in the cache directory."""
+
+        if self.cache_dir is None:
+            return None
+
+        name = pathlib.Path(self.files[index]).name
+        return self.cache_dir / f"{index:05d}_{name}.npy"
+
+    def load(self, index: int) -> numpy.ndarray:
+        """Reads a frame from the cache directory or decodes it from its file."""
+
+        cache_path = self._get_cache_path(index)
+        if cache_path and cache_path.exists():
+            return numpy.load(cache_path, mmap_mode="r")
+
+        import astropy.io.fits
+
+        with astropy.io.fits.open(self.files[index]) as hdul:
+            hdu = next((hdu for hdu in hdul if hdu.data is not None), None)
+            if hdu is None:
+                raise ValueError(f"{self.files[index]} does not contain data.")
+            data = numpy.ascontiguousarray(hdu.data, dtype=numpy.uint16)
+
+        if cache_path:
+            # Write to a temporary file first so that a partial file is never
+            # memory-mapped.
+            tmp_path = cache_path.with_suffix(".tmp.npy")
+            numpy.save(tmp_path, data)
+            tmp_path.replace(cache_path)
+
+        return data
+
+    def warm(self):
+        """Decompresses all the frames into the cache directory."""
+
+        if self.cache_dir is None:
+            raise ValueError("cache_dir is not set.")
+
+        for index in range(len(self.files)):
+            cache_path = self._get_cache_path(index)
+            if cache_path and not cache_path.exists():
+                self.load(index)
+
+    def _get_window(self) -> List[int]:
+        """Returns the indices of the current frame and the ones to prefetch."""
+
+        n_files = len(self.files)
+
+        return [(self._current + ii) % n_files for ii in range(self.prefetch + 1)]
+
+    def get(self, index: int) -> numpy.ndarray:
+        """Returns a frame and starts prefetching the ones that follow it."""
+
+        index = index % len(self.files)
+
+        with self._condition:
+            self._current = index
+
+            window = self._get_window()
+            for cached in list(self._frames):
+                if cached not in window:
+                    del self._frames[cached]
+
+            if self.prefetch > 0 and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._prefetch,
+                    name="flicamera-replay-prefetch",
+                    daemon=True,
+                )
+                self._thread.start()
+
+            self._condition.notify_all()
+
+            # If the frame is being prefetched, waits for it.
+            while index in self._loading:
+                self._condition.wait()
+
+            if index in self._frames:
+                self.n_hits += 1
+                return self._frames[index]
+
+            self.n_misses += 1
+            self._loading.add(index)
+            self._failed.discard(index)
+
+        try:
+            data = self.load(index)
+        finally:
+            with self._condition:
+                self._loading.discard(index)
+                self._condition.notify_all()
+
+        with self._condition:
+            if index in self._get_window():
+                self._frames[index] = data
+
+        return data
+
+    def _prefetch(self):
+        """Loads the frames that follow the current one. Runs in a thread."""
+
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopped:
+                        return
+                    pending = [
+                        index
+                        for index in self._get_window()
+                        if index not in self._frames
+                        and index not in self._loading
+                        and index not in self._failed
+                    ]
+                    if len(pending) > 0:
+                        break
+                    self._condition.wait()
+
+                index = pending[0]
+                self._loading.add(index)
+
+            try:
+                data = self.load(index)
+            except Exception:
+                data = None
+
+            with self._condition:
+                self._loading.discard(index)
+                if data is None:
+                    # The frame is read again, and the error raised, when it
+                    # is requested.
+                    self._failed.add(index)
+                elif index in self._get_window():
+                    self._frames[index] = data
+                self._condition.notify_all()
+
+    def close(self):
+        """Stops the prefetcher and clears the cache in memory."""
+
+        with self._condition:
+            self._stopped = True
+            self._frames = {}
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class FaultInjector(object):
+    """Injects faults and latency into the calls to a mock device.
+
+    The parameters are usually read from the ``faults`` section of a simulation
+    profile (for all the devices) or of a simulated device. All the
+    probabilities default to zero.
+
+    Parameters
+    ----------
+    seed
+        The seed of the random number generator.
+    latency
+        The distribution of the latency, in seconds, added to each call to the
+        device. A dictionary with the name of a `numpy.random.Generator`
+        ``distribution`` (e.g., ``uniform``, ``normal``, ``lognormal``, or
+        ``exponential``) and its parameters, or ``constant`` with a ``value``.
+        Negative values are treated as zero.
+    disconnect_probability
+        The probability that a call finds the device unplugged. The call and
+        all the following ones fail with ``ENODEV``, and the device is not
+        listed, for ``disconnect_time`` seconds.
+    disconnect_time
+        The time, in seconds, the device remains disconnected.
+    slow_row_probability
+        The probability that reading a row is delayed by ``slow_row_delay``.
+    slow_row_delay
+        The delay, in seconds, of a slow row.
+    stuck_probability
+        The probability that the exposure status of an exposure keeps
+        reporting that the camera is exposing for ``stuck_time`` seconds after
+        the exposure has finished.
+    stuck_time
+        The time, in seconds, an exposure remains stuck. If `None`, until the
+        exposure is cancelled.
+    partial_read_probability
+        The probability that the readout of a frame fails with ``EIO`` at a
+        random row.
+
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        latency: Optional[Dict[str, Any]] = None,
+        disconnect_probability: float = 0.0,
+        disconnect_time: float = 5.0,
+        slow_row_probability: float = 0.0,
+        slow_row_delay: float = 0.01,
+        stuck_probability: float = 0.0,
+        stuck_time: Optional[float] = 10.0,
+        partial_read_probability: float = 0.0,
+    ):
+        self.rng = numpy.random.default_rng(seed)
+
+        self.latency = latency.copy() if latency else None
+        if self.latency:
+            distribution = self.latency.get("distribution", "constant")
+            if distribution != "constant" and not hasattr(self.rng, distribution):
+                raise ValueError(f"invalid latency distribution {distribution!r}.")
+
+        self.disconnect_probability = disconnect_probability
+        self.disconnect_time = disconnect_time
+        self.slow_row_probability = slow_row_probability
+        self.slow_row_delay = slow_row_delay
+        self.stuck_probability = stuck_probability
+        self.stuck_time = stuck_time
+        self.partial_read_probability = partial_read_probability
+
+        self.disconnected_until: float = 0.0
+
+        #: The number of faults injected, by type.
+        self.counts: Dict[str, int] = {
+            "disconnects": 0,
+            "slow_rows": 0,
+            "stuck_exposures": 0,
+            "partial_reads": 0,
+        }
+
+    @property
+    def is_disconnected(self) -> bool:
+        """Whether the device is currently disconnected."""
+
+        return time.time() < self.disconnected_until
+
+    def get_latency(self) -> float:
+        """Returns a random call latency, in seconds."""
+
+        if not self.latency:
+            return 0.0
+
+        params = self.latency.copy()
+        distribution = params.pop("distribution", "constant")
+
+        if distribution == "constant":
+            return max(params.get("value", 0.0), 0.0)
+
+        return max(float(getattr(self.rng, distribution)(**params)), 0.0)
+
+    def before_call(self) -> int:
+        """Sleeps for the call latency and returns the ``errno`` of the call.
+
+        Returns zero if the call should proceed.
+
+        """
+
+        latency = self.get_latency()
+        if latency > 0:
+            time.sleep(latency)
+
+        if self.is_disconnected:
+            return errno.ENODEV
+
+        if self.disconnect_probability > 0:
+            if self.rng.random() < self.disconnect_probability:
+                self.disconnected_until = time.time() + self.disconnect_time
+                self.counts["disconnects"] += 1
+                return errno.ENODEV
+
+        return 0
+
+    def get_rows_delay(self, n_rows: int = 1) -> float:
+        """Returns the total delay, in seconds, of the slow rows in ``n_rows``."""
+
+        if self.slow_row_probability <= 0 or n_rows <= 0:
+            return 0.0
+
+        n_slow = int(self.rng.binomial(n_rows, self.slow_row_probability))
+        self.counts["slow_rows"] += n_slow
+
+        return n_slow * self.slow_row_delay
+
+    def get_stuck_time(self) -> float:
+        """Returns how long, in seconds, a new exposure will be stuck.
+
+        Zero if the exposure is not stuck; infinite if it is stuck until it is
+        cancelled.
+
+        """
+
+        if self.stuck_probability <= 0:
+            return 0.0
+
+        if self.rng.random() >= self.stuck_probability:
+            return 0.0
+
+        self.counts["stuck_exposures"] += 1
+
+        return numpy.inf if self.stuck_time is None else self.stuck_time
+
+    def get_failed_row(self, n_rows: int) -> Optional[int]:
+        """Returns the row at which the readout of a new frame will fail, if any."""
+
+        if self.partial_read_probability <= 0 or n_rows <= 0:
+            return None
+
+        if self.rng.random() >= self.partial_read_probability:
+            return None
+
+        self.counts["partial_reads"] += 1
+
+        return int(self.rng.integers(0, n_rows))
+
+
 class MockFLIDevice(object):
     """A mock FLI device."""
 
@@ -146,13 +659,34 @@ class MockFLIDevice(object):
         "ul_y": 0,
         "lr_x": 512,
         "lr_y": 512,
+        "hbin": 1,
+        "vbin": 1,
+        "video_mode": False,
+        "readout_modes": ["8 MHz", "1 MHz"],
+        "camera_mode": 0,
+        "nflushes": 0,
+        "background_flush": True,
+        "bit_depth": 16,
+        "supports_8bit": False,
+    }
+
+    # Readout model. pixel_rate is the number of (binned) pixels digitised per
+    # second and row_overhead the time needed to shift one physical row into the
+    # serial register. A pixel_rate of None means instantaneous readout.
+    # flush_row_time is the time needed to shift one row out when flushing.
+    _readout_defaults = {
+        "pixel_rate": None,
+        "row_overhead": 0.0,
+        "flush_row_time": 0.0,
     }
 
     def __init__(
         self,
         name: str,
         status_params: Dict[str, Any] = {},
-        exposure_params: Union[str, List[Dict[str, Any]]] = [],
+        exposure_params: Union[str, Dict[str, Any], List[Dict[str, Any]]] = [],
+        readout_params: Dict[str, Any] = {},
+        fault_params: Optional[Dict[str, Any]] = None,
     ):
         global DEV_COUNTER
 
@@ -167,10 +701,31 @@ class MockFLIDevice(object):
 
         self._exposure_params: Union[List[str], List[Dict[str, Any]]]
         self._exposure_idx: int = 0
+        self.replay: Optional[FrameCache] = None
         self.set_exposure_params(exposure_params)
 
+        self.readout: Dict[str, Any]
+        self.set_readout_params(readout_params)
+
         self.image: Optional[numpy.ndarray] = None
         self.row = 0
+        self.readout_start_time: float = 0.0
+
+        self.video_start_time: float = 0.0
+        self.video_frame = 0
+
+        # The vertical table, if enabled, and the time spent shifting out the
+        # rows that are skipped.
+        self.vertical_table: Optional[Dict[str, Any]] = None
+        self.skip_time: float = 0.0
+
+        self.faults: Optional[FaultInjector] = None
+        self.set_fault_params(fault_params)
+
+        # The time, in seconds, the current exposure is stuck after it ends, and
+        # the row at which its readout fails, if any.
+        self.stuck_time: float = 0.0
+        self.failed_row: Optional[int] = None
 
     def reset_defaults(self):
         """Resets the device to the default state."""
@@ -178,18 +733,208 @@ class MockFLIDevice(object):
         self.state = self._defaults.copy()
         self.row = 0
 
-    def set_exposure_params(self, exposure_params: Union[str, List[Dict[str, Any]]]):
-        """Sets the exposure simulation parameters."""
+    @property
+    def handle(self) -> int:
+        """The device handle."""
+
+        return self.dev
+
+    @property
+    def serial(self) -> str:
+        """The serial number of the device."""
+
+        return self.state["serial"]
+
+    def set_fault_params(self, fault_params: Optional[Dict[str, Any]]):
+        """Sets the parameters of the `.FaultInjector`. `None` disables faults."""
+
+        self.faults = FaultInjector(**fault_params) if fault_params else None
+
+    def get_exposure_time_left(self) -> int:
+        """Returns the time left, in ms, including the time the exposure is stuck."""
+
+        if self.state["exposure_status"] != "exposing":
+            return 0
+
+        elapsed = 1000 * (time.time() - self.state["exposure_start_time"])
+        time_left = self.state["exposure_time"] + 1000 * self.stuck_time - elapsed
+
+        if time_left <= 0:
+            return 0
+
+        # A stuck exposure reports a time left of at least 1 ms.
+        return max(int(min(time_left, 2**31 - 1)), 1)
+
+    def delay_rows(self, n_rows: int = 1):
+        """Sleeps for the slow rows, if any, that the faults inject in ``n_rows``.
+
+        The start of the readout is moved by the same delay so that the rows
+        that follow are not read faster to make up for it.
+
+        """
+
+        if self.faults is None:
+            return
+
+        delay = self.faults.get_rows_delay(n_rows)
+        if delay > 0:
+            time.sleep(delay)
+            self.readout_start_time += delay
+
+    def set_readout_params(self, readout_params: Dict[str, Any]):
+        """Sets the parameters of the readout model."""
+
+        self.readout = self._readout_defaults.copy()
+        self.readout.update(readout_params)
+
+    def get_row_readout_time(self, n_cols: int) -> float:
+        """Returns the time, in seconds, needed to read a row of ``n_cols`` pixels.
+
+        ``n_cols`` is the number of binned pixels in the row. Each output row
+        requires shifting ``vbin`` physical rows into the serial register, so
+        vertical binning increases the per-row overhead while horizontal binning
+        reduces the number of pixels to digitise.
+
+        """
+
+        pixel_rate = self.readout["pixel_rate"]
+        if not pixel_rate:
+            return 0.0
+
+        row_overhead = self.readout["row_overhead"] * self.state["vbin"]
+
+        return row_overhead + n_cols / pixel_rate
+
+    def get_readout_time(self, n_rows: int, n_cols: int) -> float:
+        """Returns the time, in seconds, needed to read a full frame."""
+
+        return n_rows * self.get_row_readout_time(n_cols)
+
+    def wait_readout(self, n_rows: int, n_cols: int):
+        """Blocks until ``n_rows`` rows have been read since the readout started.
+
+        The wait is computed against the start of the readout, not the previous
+        row, so that the accumulated sleep granularity does not add up.
+
+        """
+
+        if not self.readout["pixel_rate"]:
+            return
+
+        deadline = self.readout_start_time + self.get_readout_time(n_rows, n_cols)
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    def get_frame_shape(self) -> Tuple[int, int]:
+        """Returns the shape of the frame that will be read."""
+
+        assert self.image is not None
+
+        if self.vertical_table is not None:
+            return self.image.shape
+
+        return (
+            self.image.shape[0] // self.state["vbin"],
+            self.image.shape[1] // self.state["hbin"],
+        )
+
+    def to_bit_depth(self, data: numpy.ndarray) -> numpy.ndarray:
+        """Converts image data to the current bit depth.
+
+        In 8-bit mode the most significant byte of each pixel is returned.
+
+        """
+
+        if self.state["bit_depth"] == 8:
+            return numpy.ascontiguousarray(data >> 8, dtype=numpy.uint8)
+
+        return numpy.ascontiguousarray(data, dtype=numpy.uint16)
+
+    def apply_vertical_table(self):
+        """Replaces the image with the rows and columns the vertical table reads.
+
+        Binned rows and columns are decimated instead of summed.
+
+        """
+
+        if self.vertical_table is None or self.image is None:
+            self.skip_time = 0.0
+            return
+
+        hbin = self.state["hbin"]
+        col0 = self.vertical_table["offset"] - self.state["ul_x"]
+        col1 = col0 + self.vertical_table["width"] * hbin
+
+        bands = []
+        n_skipped = 0
+        row = 0
+        for height, bin, mode in self.vertical_table["entries"]:
+            if mode == flicamera.lib.VTABLE_MODE_READ:
+                bands.append(self.image[row : row + height : bin, col0:col1:hbin])
+            else:
+                n_skipped += height
+            row += height
+
+        self.image = numpy.ascontiguousarray(numpy.vstack(bands))
+        self.skip_time = n_skipped * self.readout["row_overhead"]
+
+    def set_exposure_params(
+        self,
+        exposure_params: Union[str, Dict[str, Any], List[Dict[str, Any]]],
+    ):
+        """Sets the exposure simulation parameters.
+
+        ``exposure_params`` can be a list of exposure simulation parameters, a
+        glob pattern of FITS files to replay, or a dictionary with the replay
+        options. In the latter case the dictionary must contain the glob
+        pattern as ``files`` and can include the ``prefetch`` and ``cache_dir``
+        parameters of `.FrameCache`. Raises `ValueError` if the pattern does
+        not match any file.
+
+        """
+
+        if self.replay is not None:
+            self.replay.close()
+            self.replay = None
+
+        if isinstance(exposure_params, (str, dict)):
+            if isinstance(exposure_params, str):
+                exposure_params = {"files": exposure_params}
+
+            replay_params = exposure_params.copy()
+            pattern = replay_params.pop("files")
 
-        if isinstance(exposure_params, str):
-            self._exposure_params = list(sorted(glob(exposure_params)))
+            files = list(sorted(glob(pattern)))
+            if len(files) == 0:
+                raise ValueError(f"no files match {pattern!r}.")
+
+            self._exposure_params = files
+            self.replay = FrameCache(files, **replay_params)
         else:
             self._exposure_params = exposure_params
+
         self._exposure_idx = 0
 
     def prepare_image(self):
         """Creates the image that will be fetched."""
 
+        if self.replay is not None:
+            # The cached frame may be memory-mapped and is shared with the
+            # prefetcher, so the image is a copy.
+            frame = self.replay.get(self._exposure_idx)
+            self.image = numpy.array(frame, dtype=numpy.uint16)
+            return
+
+        # The simulation stack is only imported when the first image is created.
+        import astropy.table
+        from astropy.modeling.models import Gaussian2D
+        from photutils.datasets import (
+            apply_poisson_noise,
+            make_model_image,
+            make_noise_image,
+        )
+
         # Default values
         exposure_params: Dict[str, Any] = dict(
             seed=None,
@@ -213,11 +958,7 @@ class MockFLIDevice(object):
                 }
             else:
                 this_exposure = self._exposure_params[self._exposure_idx]
-
-                # If str, file is the image to return
-                if isinstance(this_exposure, str):
-                    data = astropy.io.fits.getdata(this_exposure)
-                    return data
+                assert isinstance(this_exposure, dict)
 
                 exposure_params.update(this_exposure)
 
@@ -257,10 +998,13 @@ class MockFLIDevice(object):
         """Clears the image. Called when the buffer has been read."""
 
         self.image = None
+        self.stuck_time = 0.0
+        self.failed_row = None
+
+        # Like the real cameras, the exposure time is kept for the next frame.
         self.state.update(
             {
                 "exposure_time_left": 0,
-                "exposure_time": 0,
                 "exposure_status": "idle",
                 "exposure_start_time": 0,
             }
@@ -275,10 +1019,20 @@ class MockLibFLI(ctypes.CDLL):
 
     def __init__(self, dlpath: str):
         self.dlpath: str = dlpath
-        self.devices: List[MockFLIDevice] = []
+        self.devices = []
 
         self.restype = flicamera.lib.chk_err
 
+    @property
+    def devices(self) -> flicamera.lib.DeviceRegistry[MockFLIDevice]:
+        """The registry of mocked devices, indexed by handle, name, and serial."""
+
+        return self._devices
+
+    @devices.setter
+    def devices(self, devices: Iterable[MockFLIDevice]):
+        self._devices = flicamera.lib.DeviceRegistry(devices)
+
     def reset(self):
         """Resets the initial values of the mocked device."""
 
@@ -293,20 +1047,36 @@ class MockLibFLI(ctypes.CDLL):
             return unittest.mock.MagicMock(retur_value=self.restype(0))
 
     def _get_device(self, dev):
-        """Gets the appropriate device."""
+        """Gets the appropriate device.
+
+        If the device injects faults, the call is delayed and an `.FLIError` is
+        raised if the device is disconnected.
+
+        """
 
         if isinstance(dev, ctypes.c_long):
             dev = dev.value
 
-        for device in self.devices:
-            if device.dev == dev:
-                return device
+        device = self.devices.get(handle=dev)
+
+        if device is not None and device.faults is not None:
+            err = device.faults.before_call()
+            if err != 0:
+                self.restype(-err)  # Raises FLIError.
 
-        return None
+        return device
+
+    @staticmethod
+    def _is_disconnected(device: MockFLIDevice) -> bool:
+        """Whether a fault has disconnected the device."""
+
+        return device.faults is not None and device.faults.is_disconnected
 
     def FLIList(self, domain, names_ptr):
         device_names = [
-            (dev.name + ";" + dev.state["model"]).encode() for dev in self.devices
+            (dev.name + ";" + dev.state["model"]).encode()
+            for dev in self.devices
+            if not self._is_disconnected(dev)
         ]
 
         # names_ptr is a pointer to a pointer to a char pointer (yep).
@@ -315,16 +1085,18 @@ class MockLibFLI(ctypes.CDLL):
         # See https://stackoverflow.com/a/4145859 for details.
         # Then we access the object to which the names_ptr points to and
         # replace its contents.
-        names_ptr._obj.contents = (ctypes.c_char_p * len(self.devices))(*device_names)
+        names_ptr._obj.contents = (ctypes.c_char_p * len(device_names))(*device_names)
 
         return self.restype(0)
 
     def FLIOpen(self, dev_ptr, name, domain):
-        name = name.decode()
-        for device in self.devices:
-            if device.name == name:
-                dev_ptr._obj.value = device.dev
-                return 0
+        device = self.devices.get(name=name.decode())
+        if device is not None:
+            if self._is_disconnected(device):
+                return self.restype(-errno.ENODEV)
+
+            dev_ptr._obj.value = device.dev
+            return 0
 
         return self.restype(-errno.ENXIO)
 
@@ -372,6 +1144,28 @@ class MockLibFLI(ctypes.CDLL):
 
         return self.restype(0)
 
+    def FLISetHBin(self, dev, hbin):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        if isinstance(hbin, ctypes._SimpleCData):
+            hbin = hbin.value
+        device.state["hbin"] = hbin
+
+        return self.restype(0)
+
+    def FLISetVBin(self, dev, vbin):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        if isinstance(vbin, ctypes._SimpleCData):
+            vbin = vbin.value
+        device.state["vbin"] = vbin
+
+        return self.restype(0)
+
     def FLISetTemperature(self, dev, temperature):
         device = self._get_device(dev)
         if not device:
@@ -407,15 +1201,7 @@ class MockLibFLI(ctypes.CDLL):
         if not device:
             return self.restype(-errno.ENXIO)
 
-        if device.state["exposure_status"] == "idle":
-            timeleft_ptr._obj.value = 0
-        elif device.state["exposure_status"] == "exposing":
-            time_elapsed = 1000 * (time.time() - device.state["exposure_start_time"])
-            if time_elapsed > device.state["exposure_time"]:
-                timeleft_ptr._obj.value = 0
-            else:
-                time_left = int(device.state["exposure_time"] - time_elapsed)
-                timeleft_ptr._obj.value = time_left
+        timeleft_ptr._obj.value = device.get_exposure_time_left()
 
         return self.restype(0)
 
@@ -427,12 +1213,89 @@ class MockLibFLI(ctypes.CDLL):
         if device.state["exposure_status"] != "idle":
             return self.restype(-errno.EALREADY)
 
+        # Like libfli, flushes the array before starting the exposure.
+        n_rows = device.state["lr_y"] - device.state["ul_y"]
+        flush_time = device.state["nflushes"] * n_rows
+        flush_time *= device.readout["flush_row_time"]
+        if flush_time > 0:
+            time.sleep(flush_time)
+
         device.state["exposure_status"] = "exposing"
         device.state["exposure_start_time"] = time.time()
 
         device.row = 0  # Reset readout row
+        device.readout_start_time = 0.0
 
         device.prepare_image()  # Prepare image
+        device.apply_vertical_table()
+
+        if device.faults is not None:
+            assert device.image is not None
+            device.stuck_time = device.faults.get_stuck_time()
+            device.failed_row = device.faults.get_failed_row(device.image.shape[0])
+
+        return self.restype(0)
+
+    def FLIGetDeviceStatus(self, dev, status_ptr):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        if device.state["exposure_status"] == "exposing":
+            if device.get_exposure_time_left() > 0:
+                status = flicamera.lib.FLI_CAMERA_STATUS_EXPOSING
+            else:
+                status = flicamera.lib.FLI_CAMERA_DATA_READY
+        else:
+            status = flicamera.lib.FLI_CAMERA_STATUS_IDLE
+
+        status_ptr._obj.value = status
+
+        return self.restype(0)
+
+    def FLISetBitDepth(self, dev, bitdepth):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        # Like libfli for the USB cameras, fails unless 8-bit is supported.
+        if not device.state["supports_8bit"]:
+            return self.restype(-errno.EINVAL)
+
+        if isinstance(bitdepth, ctypes._SimpleCData):
+            bitdepth = bitdepth.value
+
+        if bitdepth == flicamera.lib.FLI_MODE_8BIT.value:
+            device.state["bit_depth"] = 8
+        else:
+            device.state["bit_depth"] = 16
+
+        return self.restype(0)
+
+    def FLISetNFlushes(self, dev, nflushes):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        if isinstance(nflushes, ctypes._SimpleCData):
+            nflushes = nflushes.value
+
+        if nflushes < 0 or nflushes > 16:
+            return self.restype(-errno.EINVAL)
+
+        device.state["nflushes"] = nflushes
+
+        return self.restype(0)
+
+    def FLIControlBackgroundFlush(self, dev, bgflush):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        if isinstance(bgflush, ctypes._SimpleCData):
+            bgflush = bgflush.value
+
+        device.state["background_flush"] = bgflush == flicamera.lib.FLI_BGFLUSH_START
 
         return self.restype(0)
 
@@ -443,6 +1306,7 @@ class MockLibFLI(ctypes.CDLL):
 
         device.state["exposure_status"] = "idle"
         device.state["exposure_time_left"] = 0
+        device.stuck_time = 0.0
 
         return self.restype(0)
 
@@ -459,15 +1323,35 @@ class MockLibFLI(ctypes.CDLL):
         return self.restype(0)
 
     def _get_image(self, dev):
-        """Return the whole image. Used for the ``fast_read`` mode."""
+        """Return the whole image. Used for the ``fast_read`` mode.
+
+        The call blocks for the time the readout model assigns to the full
+        (binned) frame.
+
+        """
 
         device = self._get_device(dev)
 
         assert device is not None and device.image is not None
 
-        image = device.image.copy()
+        n_rows, n_cols = device.get_frame_shape()
+
+        device.readout_start_time = time.perf_counter() + device.skip_time
+
+        failed_row = device.failed_row
+        if failed_row is not None:
+            n_rows = failed_row
+
+        device.delay_rows(n_rows)
+
+        image = device.to_bit_depth(device.image)
+        device.wait_readout(n_rows, n_cols)
+
         device.clear_image()
 
+        if failed_row is not None:
+            self.restype(-errno.EIO)  # Raises FLIError.
+
         return image
 
     def FLIGrabRow(self, dev, array_ptr, col_size):
@@ -486,25 +1370,211 @@ class MockLibFLI(ctypes.CDLL):
 
         assert device is not None and device.image is not None
 
-        # This is a hack ... but there doesn't seem to be another way to access
-        # the memory address. In principle byref(img_ptr.contents, offset)
-        # should send a pointer pointing to the address of the first element
-        # in the array plus the offset, but this function always seems to get
-        # the initial address of the array regardless of the offset. This may
-        # be due to the fact that this function is Python and not C ... In any
-        # case, we can get the value of each memory address that would
-        # correspond to this row and assign it. It's very slow  because it
-        # iterates over each elements, so do not use with large image.
-        initial_address = ctypes.addressof(array_ptr._obj)
-        for ii in range(col_size):
-            offset = device.row * col_size + ii
-            address = initial_address + offset * ctypes.sizeof(ctypes.c_uint16)
-
-            (ctypes.c_uint16).from_address(address).value = device.image[device.row, ii]
+        if device.row == 0:
+            device.readout_start_time = time.perf_counter() + device.skip_time
+
+        if device.failed_row is not None and device.row == device.failed_row:
+            device.clear_image()
+            return self.restype(-errno.EIO)
+
+        # byref(img_ptr.contents, offset) is received here as the initial
+        # address of the array regardless of the offset (this function is Python
+        # and not C), so we calculate the address of the row from the row counter
+        # and copy the whole row in one go.
+        row_data = device.to_bit_depth(device.image[device.row, :col_size])
+
+        row_offset = device.row * col_size * row_data.itemsize
+        row_address = ctypes.addressof(array_ptr._obj) + row_offset
+
+        ctypes.memmove(row_address, row_data.ctypes.data, row_data.nbytes)
+
+        device.row += 1
+        device.delay_rows()
+
+        device.wait_readout(device.row, col_size)
 
         if device.image.shape[0] == device.row:
             device.clear_image()
+
+        return self.restype(0)
+
+    def FLISetImageArea(self, dev, ul_x, ul_y, lr_x, lr_y):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        device.vertical_table = None
+
+        return self.restype(0)
+
+    def FLIEnableVerticalTable(self, dev, width, offset, flags):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        device.vertical_table = {"width": width, "offset": offset, "entries": []}
+
+        return self.restype(0)
+
+    def FLISetVerticalTableEntry(self, dev, index, height, bin, mode):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        if device.vertical_table is None:
+            return self.restype(-errno.EFAULT)
+
+        entries = device.vertical_table["entries"]
+        if index > len(entries) or index >= flicamera.lib.VTABLE_MAX_ENTRIES:
+            return self.restype(-errno.EINVAL)
+
+        # An entry with zero height ends the table.
+        del entries[index:]
+        if height > 0:
+            entries.append((height, bin, mode))
+
+        return self.restype(0)
+
+    def FLIGetReadoutDimensions(
+        self,
+        dev,
+        width_ptr,
+        hoffset_ptr,
+        hbin_ptr,
+        height_ptr,
+        voffset_ptr,
+        vbin_ptr,
+    ):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        state = device.state
+        vertical_table = device.vertical_table
+
+        if vertical_table is None:
+            width = (state["lr_x"] - state["ul_x"]) // state["hbin"]
+            hoffset = state["ul_x"]
+            height = (state["lr_y"] - state["ul_y"]) // state["vbin"]
         else:
-            device.row += 1
+            width = vertical_table["width"]
+            hoffset = vertical_table["offset"]
+            height = sum(
+                -(-entry_height // bin)
+                for entry_height, bin, mode in vertical_table["entries"]
+                if mode == flicamera.lib.VTABLE_MODE_READ
+            )
+
+        width_ptr._obj.value = width
+        hoffset_ptr._obj.value = hoffset
+        hbin_ptr._obj.value = state["hbin"]
+        height_ptr._obj.value = height
+        voffset_ptr._obj.value = state["ul_y"]
+        vbin_ptr._obj.value = state["vbin"]
+
+        return self.restype(0)
+
+    def FLIGetCameraModeString(self, dev, mode_index, mode_string, size):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        if isinstance(mode_index, ctypes._SimpleCData):
+            mode_index = mode_index.value
+
+        modes = device.state["readout_modes"]
+        if not 0 <= mode_index < len(modes):
+            return self.restype(-errno.EINVAL)
+
+        mode_string.value = modes[mode_index].encode()
+
+        return self.restype(0)
+
+    def FLIGetCameraMode(self, dev, mode_ptr):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        mode_ptr._obj.value = device.state["camera_mode"]
+
+        return self.restype(0)
+
+    def FLISetCameraMode(self, dev, mode_index):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        if isinstance(mode_index, ctypes._SimpleCData):
+            mode_index = mode_index.value
+
+        if not 0 <= mode_index < len(device.state["readout_modes"]):
+            return self.restype(-errno.EINVAL)
+
+        device.state["camera_mode"] = mode_index
+
+        return self.restype(0)
+
+    def FLIStartVideoMode(self, dev):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        device.state["video_mode"] = True
+        device.video_start_time = time.perf_counter()
+        device.video_frame = 0
+
+        return self.restype(0)
+
+    def FLIStopVideoMode(self, dev):
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        device.state["video_mode"] = False
+
+        return self.restype(0)
+
+    def FLIGrabVideoFrame(self, dev, buff, size):
+        """Returns the next video frame.
+
+        Frames are produced every exposure time or readout time, whichever is
+        longer, counted from the start of the video mode.
+
+        """
+
+        device = self._get_device(dev)
+        if not device:
+            return self.restype(-errno.ENXIO)
+
+        if not device.state["video_mode"]:
+            return self.restype(-errno.EINVAL)
+
+        n_cols = (device.state["lr_x"] - device.state["ul_x"]) // device.state["hbin"]
+        n_rows = (device.state["lr_y"] - device.state["ul_y"]) // device.state["vbin"]
+
+        itemsize = 1 if device.state["bit_depth"] == 8 else 2
+        nbytes = n_rows * n_cols * itemsize
+        if size < nbytes:
+            return self.restype(-errno.EINVAL)
+
+        period = max(
+            device.state["exposure_time"] / 1000.0,
+            device.get_readout_time(n_rows, n_cols),
+        )
+
+        device.video_frame += 1
+        delay = device.video_start_time + device.video_frame * period
+        delay -= time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+        device.prepare_image()
+        image = device.image
+        assert image is not None
+
+        frame = device.to_bit_depth(image[:n_rows, :n_cols])
+        ctypes.memmove(buff, frame.ctypes.data, nbytes)
+
+        device.image = None
 
         return self.restype(0)
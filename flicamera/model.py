@@ -22,7 +22,6 @@ from basecam.models import (
     MacroCard,
     WCSCards,
 )
-from clu.legacy.types.pvt import PVT
 from sdsstools.time import get_sjd
 
 import flicamera
@@ -35,6 +34,9 @@ MacroCardReturnType = List[Union[Tuple[str, Any], Tuple[str, Any, str], Card]]
 
 
 def pvt2pos(tup):
+    # Imported here because clu is only needed when the actor is running.
+    from clu.legacy.types.pvt import PVT
+
     pvt = PVT(*tup)
     return pvt.getPos()
 
@@ -516,6 +518,29 @@ class FPSCards(TronModelCards):
         return cards
 
 
+class FrameStatsCards(MacroCard):
+    """Statistics of the frame calculated during post-processing."""
+
+    name = "frame_stats"
+
+    def macro(self, exposure: Exposure, context: Dict[str, Any] = {}):
+        stats = getattr(exposure, "frame_stats", None)
+        if stats is None:
+            return []
+
+        return [
+            ("DATAMEAN", stats.mean, "Mean of the frame [ADU]"),
+            ("DATAMED", stats.median, "Median of the frame [ADU]"),
+            ("DATAP05", stats.p05, "5th percentile of the frame [ADU]"),
+            ("DATAP95", stats.p95, "95th percentile of the frame [ADU]"),
+            ("DATAMIN", stats.minimum, "Minimum pixel value [ADU]"),
+            ("DATAMAX", stats.maximum, "Maximum pixel value [ADU]"),
+            ("NSATUR", stats.n_saturated, "Number of saturated pixels"),
+            ("BKG", stats.background, "Background level [ADU]"),
+            ("BKGRMS", stats.background_rms, "Background RMS [ADU]"),
+        ]
+
+
 window_group = CardGroup(
     [
         Card(
@@ -591,6 +616,20 @@ models = [
         default=-999.0,
     ),
     window_group,
+    Card(
+        "BITDEPTH",
+        "{__camera__.bit_depth}",
+        "Bits per pixel of the image data",
+        default=16,
+        type=int,
+    ),
+    Card(
+        "READMODE",
+        "{__camera__._device.readout_mode_name}",
+        "Readout mode",
+        default="UNKNOWN",
+    ),
+    FrameStatsCards(),
     Card(
         "GAIN",
         "{__camera__.gain}",
@@ -0,0 +1,437 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: process.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import errno
+import multiprocessing
+import signal
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy
+
+from flicamera.lib import FLIError, LibFLI, LibFLIDevice
+
+
+__all__ = ["ProcessDevice", "LibFactory"]
+
+
+#: A picklable callable that returns a `.LibFLI` object in the device process.
+LibFactory = Callable[[], LibFLI]
+
+
+# Attributes of the device that are sent back to the proxy after each call.
+_STATE_ATTRIBUTES = [
+    "name",
+    "serial",
+    "model",
+    "fwrev",
+    "hwrev",
+    "hbin",
+    "vbin",
+    "area",
+    "shutter",
+    "_temperature",
+    "video_mode",
+    "readout_modes",
+    "readout_mode",
+    "bit_depth",
+    "nflushes",
+    "background_flush",
+    "windows",
+    "window_slices",
+    "readout_shape",
+    "is_probed",
+]
+
+
+# Methods that read a frame. They are called with the name of the shared memory
+# buffer instead of an array.
+_FRAME_METHODS = ["read_frame", "grab_video_frame"]
+
+
+def _get_state(device: Optional[LibFLIDevice]) -> Optional[Dict[str, Any]]:
+    """Returns the attributes of the device to mirror in the proxy."""
+
+    if device is None:
+        return None
+
+    return {attr: getattr(device, attr, None) for attr in _STATE_ATTRIBUTES}
+
+
+def _run_device(
+    conn: Connection,
+    serial: str,
+    lib_factory: LibFactory,
+    probe: bool = True,
+):
+    """Opens a device and runs the calls received from the proxy.
+
+    This is the entry point of the device process. Each request is a tuple
+    ``(method, args, kwargs)`` and each reply a tuple ``(status, result, state)``
+    where ``status`` is ``"ok"`` or ``"error"``.
+
+    """
+
+    # The parent process handles the shutdown.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    device: Optional[LibFLIDevice] = None
+    shm: Optional[SharedMemory] = None
+
+    try:
+        lib = lib_factory()
+        device = lib.get_camera(serial, probe=probe)
+        if device is None:
+            raise FLIError(f"cannot find camera with serial {serial}.", errno.ENODEV)
+    except BaseException as err:
+        conn.send(("error", err, None))
+        return
+
+    conn.send(("ok", None, _get_state(device)))
+
+    while True:
+        try:
+            method, args, kwargs = conn.recv()
+        except EOFError:
+            break
+
+        if method == "stop":
+            break
+
+        try:
+            if method in _FRAME_METHODS:
+                # Reads the frame directly into the shared memory buffer.
+                if shm is None or shm.name != args[0]:
+                    if shm is not None:
+                        shm.close()
+                    shm = SharedMemory(name=args[0])
+
+                shape = device.get_frame_shape()
+                dtype = device.get_frame_dtype()
+                out = numpy.ndarray(shape, dtype=dtype, buffer=shm.buf)
+                getattr(device, method)(out=out)
+                del out
+
+                result = shape
+            else:
+                result = getattr(device, method)(*args, **kwargs)
+        except BaseException as err:
+            conn.send(("error", err, _get_state(device)))
+        else:
+            conn.send(("ok", result, _get_state(device)))
+
+    if shm is not None:
+        shm.close()
+
+    conn.close()
+
+
+def _forward(method: str):
+    """Returns a proxy method that runs ``method`` in the device process."""
+
+    def func(self: ProcessDevice, *args, **kwargs):
+        return self._call(method, *args, **kwargs)
+
+    func.__name__ = method
+    func.__doc__ = f"Runs `.LibFLIDevice.{method}` in the device process."
+
+    return func
+
+
+class ProcessDevice(object):
+    """A `.LibFLIDevice` that runs in its own process.
+
+    Exposes the same API as `.LibFLIDevice` but each call is sent to a process
+    that owns the device. Frames are read by the device process into a shared
+    memory buffer and copied once by the proxy. A device that hangs only blocks
+    its own process; if a call does not return within ``timeout`` the process
+    is killed and `.FLIError` is raised with ``ETIMEDOUT``.
+
+    The calls block, so they are meant to run in the camera `.DeviceWorker`.
+
+    Parameters
+    ----------
+    serial
+        The serial number of the camera.
+    lib_factory
+        A picklable callable that returns the `.LibFLI` object to use in the
+        device process.
+    timeout
+        Maximum time, in seconds, to wait for a call to return.
+
+    """
+
+    def __init__(
+        self,
+        serial: str,
+        lib_factory: LibFactory,
+        timeout: float = 60.0,
+    ):
+        self.serial = serial
+        self.lib_factory = lib_factory
+        self.timeout = timeout
+
+        self.name: str = ""
+        self.model: str = ""
+        self.fwrev: int = 0
+        self.hwrev: int = 0
+        self.is_probed = False
+
+        self.hbin: int = 1
+        self.vbin: int = 1
+        self.area: Tuple[int, int, int, int] = (0, 0, 0, 0)
+
+        self.shutter = False
+        self._temperature: Dict[str, float] = {"CCD": 0.0, "base": 0.0}
+
+        self.video_mode = False
+
+        self.readout_modes: List[str] = []
+        self.readout_mode: int = 0
+
+        self.bit_depth: int = 16
+
+        self.nflushes: int = 0
+        self.background_flush: bool = True
+
+        self.windows: List[Tuple[int, int, int, int]] = []
+        self.window_slices: List[Tuple[int, int, int, int]] = []
+        self.readout_shape: Tuple[int, int] = (0, 0)
+
+        self.is_open = False
+
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._conn: Optional[Connection] = None
+        self._shm: Optional[SharedMemory] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the device process is running."""
+
+        return self._process is not None and self._process.is_alive()
+
+    @property
+    def temperature(self):
+        """Returns a dictionary of temperatures at different locations."""
+
+        self._update_temperature()
+
+        return self._temperature
+
+    get_frame_shape = LibFLIDevice.get_frame_shape
+    get_frame_dtype = LibFLIDevice.get_frame_dtype
+    extract_windows = LibFLIDevice.extract_windows
+    readout_mode_name = LibFLIDevice.readout_mode_name
+
+    def _update_state(self, state: Dict[str, Any]):
+        """Updates the mirrored attributes of the device."""
+
+        for attr, value in state.items():
+            if value is not None:
+                setattr(self, attr, value)
+
+    def _receive(self) -> Any:
+        """Waits for the reply to a call."""
+
+        assert self._conn is not None
+
+        try:
+            ready = self._conn.poll(self.timeout)
+            if ready:
+                status, result, state = self._conn.recv()
+        except (EOFError, OSError) as err:
+            self.terminate()
+            raise FLIError(
+                f"device process for {self.serial} died.",
+                errno.ENODEV,
+            ) from err
+
+        if not ready:
+            self.terminate()
+            raise FLIError(
+                f"device process for {self.serial} timed out.",
+                errno.ETIMEDOUT,
+            )
+
+        if state:
+            self._update_state(state)
+
+        if status == "error":
+            raise result
+
+        return result
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        """Runs a method of the device in the device process."""
+
+        if not self.running or self._conn is None:
+            raise FLIError(
+                f"device process for {self.serial} is not running.",
+                errno.ENODEV,
+            )
+
+        try:
+            self._conn.send((method, args, kwargs))
+        except OSError as err:
+            self.terminate()
+            raise FLIError(
+                f"device process for {self.serial} died.",
+                errno.ENODEV,
+            ) from err
+
+        return self._receive()
+
+    def open(self, probe: bool = True):
+        """Starts the device process, which opens the device.
+
+        If the process is already running it is restarted. The device is looked
+        up by serial, so it is found even if it was replugged. ``probe`` is
+        passed to `.LibFLIDevice.open`.
+
+        """
+
+        self.terminate()
+
+        context = multiprocessing.get_context("spawn")
+        conn, child_conn = context.Pipe()
+
+        self._process = context.Process(
+            target=_run_device,
+            args=(child_conn, self.serial, self.lib_factory, probe),
+            name=f"flicamera-{self.serial}",
+            daemon=True,
+        )
+        self._process.start()
+        self._conn = conn
+
+        child_conn.close()
+
+        try:
+            self._receive()
+        except BaseException:
+            self.terminate()
+            raise
+
+        self.is_open = True
+
+    def close(self):
+        """Closes the device handle. The process keeps running."""
+
+        self._call("close")
+
+    def terminate(self):
+        """Stops the device process without closing the device."""
+
+        if self._process is not None:
+            if self._process.is_alive() and self._conn is not None:
+                try:
+                    self._conn.send(("stop", (), {}))
+                except OSError:
+                    pass
+                self._process.join(1)
+
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join()
+
+            self._process = None
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+        self.is_open = False
+
+    def disconnect(self):
+        """Disconnects the device and stops the device process."""
+
+        try:
+            if self.running:
+                self._call("disconnect")
+        finally:
+            self.terminate()
+
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+                self._shm = None
+
+    probe = _forward("probe")
+    _update_temperature = _forward("_update_temperature")
+    set_temperature = _forward("set_temperature")
+    set_shutter = _forward("set_shutter")
+    get_cooler_power = _forward("get_cooler_power")
+    set_exposure_time = _forward("set_exposure_time")
+    set_image_area = _forward("set_image_area")
+    get_visible_area = _forward("get_visible_area")
+    set_binning = _forward("set_binning")
+    get_exposure_time_left = _forward("get_exposure_time_left")
+    cancel_exposure = _forward("cancel_exposure")
+    start_exposure = _forward("start_exposure")
+    set_frame_type = _forward("set_frame_type")
+    expose_frame = _forward("expose_frame")
+    start_video = _forward("start_video")
+    stop_video = _forward("stop_video")
+    get_readout_modes = _forward("get_readout_modes")
+    get_readout_mode = _forward("get_readout_mode")
+    set_readout_mode = _forward("set_readout_mode")
+    set_bit_depth = _forward("set_bit_depth")
+    set_nflushes = _forward("set_nflushes")
+    set_background_flush = _forward("set_background_flush")
+    get_device_status = _forward("get_device_status")
+    expose_frame_timed = _forward("expose_frame_timed")
+    set_windows = _forward("set_windows")
+    clear_windows = _forward("clear_windows")
+    get_readout_dimensions = _forward("get_readout_dimensions")
+
+    def _read_into(self, method: str, out: Optional[numpy.ndarray]) -> numpy.ndarray:
+        """Runs a frame method in the device process through shared memory."""
+
+        n_rows, n_cols = self.get_frame_shape()
+        dtype = self.get_frame_dtype()
+        nbytes = max(n_rows * n_cols * dtype.itemsize, 1)
+
+        if self._shm is None or self._shm.size < nbytes:
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+            self._shm = SharedMemory(create=True, size=nbytes)
+
+        shape = self._call(method, self._shm.name)
+
+        frame = numpy.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+        if out is None:
+            array = frame.copy()
+        else:
+            out[...] = frame
+            array = out
+        del frame
+
+        return array
+
+    def read_frame(self, out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """Reads the image frame through shared memory.
+
+        See `.LibFLIDevice.read_frame`.
+
+        """
+
+        return self._read_into("read_frame", out)
+
+    def grab_video_frame(self, out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """Grabs the next video frame through shared memory.
+
+        See `.LibFLIDevice.grab_video_frame`.
+
+        """
+
+        return self._read_into("grab_video_frame", out)
@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: publisher.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from typing import Any, Dict, Optional, Set, Tuple
+
+import numpy
+
+
+__all__ = ["FramePublisher", "FrameSubscriber", "SharedFrame"]
+
+
+# Layout of the ring. The ring header is followed by n_slots slots, each one
+# with a slot header, the JSON-encoded FITS header, and the pixel data.
+_RING_MAGIC = b"FLIRING1"
+
+# magic, n_slots, header_size, data_size, slot_size, last_sequence.
+_RING_STRUCT = struct.Struct("<8sIIQQQ")
+
+# sequence, timestamp, n_rows, n_cols, dtype, header_length.
+_SLOT_STRUCT = struct.Struct("<QdII8sI")
+
+_RING_HEADER_SIZE = 64
+_SLOT_HEADER_SIZE = 64
+
+# Names of the rings created by this process. Used to avoid unregistering them
+# from the resource tracker when they are read by the same process.
+_PUBLISHED_NAMES: Set[str] = set()
+
+
+def _align(size: int, alignment: int = 64) -> int:
+    """Rounds up ``size`` to a multiple of ``alignment``."""
+
+    return (size + alignment - 1) // alignment * alignment
+
+
+@dataclass
+class SharedFrame:
+    """A frame read from a `.FrameSubscriber`.
+
+    ``data`` is a view of the shared memory, not a copy. It remains valid until
+    the slot is reused by the publisher, which can be checked with
+    `.FrameSubscriber.is_valid` after the data has been used.
+
+    """
+
+    slot: int
+    sequence: int
+    timestamp: float
+    header: Dict[str, Any]
+    data: numpy.ndarray
+
+
+class FramePublisher(object):
+    """Publishes frames to a ring of slots in POSIX shared memory.
+
+    Each slot holds one frame and its header as a JSON-encoded dictionary.
+    Slots are written in order and, once all have been used, the oldest one is
+    overwritten. The sequence number of a slot is zero while it is being
+    written, so readers can detect a frame that changed while they were using
+    it (see `.FrameSubscriber`).
+
+    Parameters
+    ----------
+    name
+        The name of the shared memory segment.
+    data_size
+        Maximum size, in bytes, of the pixel data of a frame.
+    n_slots
+        Number of frames in the ring.
+    header_size
+        Maximum size, in bytes, of the JSON-encoded header.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        data_size: int,
+        n_slots: int = 4,
+        header_size: int = 65536,
+    ):
+        if n_slots < 1:
+            raise ValueError("n_slots must be at least 1.")
+
+        self.name = name
+        self.n_slots = n_slots
+        self.header_size = _align(header_size)
+        self.data_size = _align(data_size)
+
+        self.slot_size = _SLOT_HEADER_SIZE + self.header_size + self.data_size
+        size = _RING_HEADER_SIZE + n_slots * self.slot_size
+
+        try:
+            self._shm = SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left over by a process that did not exit cleanly.
+            old = SharedMemory(name=name)
+            old.close()
+            old.unlink()
+            self._shm = SharedMemory(name=name, create=True, size=size)
+
+        _PUBLISHED_NAMES.add(self._shm.name)
+
+        self.sequence = 0
+        self._write_ring_header()
+
+    def _write_ring_header(self):
+        """Writes the ring header."""
+
+        _RING_STRUCT.pack_into(
+            self._shm.buf,
+            0,
+            _RING_MAGIC,
+            self.n_slots,
+            self.header_size,
+            self.data_size,
+            self.slot_size,
+            self.sequence,
+        )
+
+    def publish(
+        self,
+        data: numpy.ndarray,
+        header: Dict[str, Any] = {},
+    ) -> Tuple[int, int]:
+        """Copies a frame and its header to the next slot.
+
+        Parameters
+        ----------
+        data
+            A 2D array with the frame.
+        header
+            A dictionary of header keywords. Values that cannot be serialised as
+            JSON are converted to strings.
+
+        Returns
+        -------
+        slot_sequence
+            A tuple with the index of the slot and the sequence number of the
+            frame.
+
+        """
+
+        if data.ndim != 2:
+            raise ValueError("data must be a 2D array.")
+
+        if data.nbytes > self.data_size:
+            raise ValueError("the frame does not fit in the slot.")
+
+        header_bytes = json.dumps(header, default=str).encode()
+        if len(header_bytes) > self.header_size:
+            raise ValueError("the header does not fit in the slot.")
+
+        sequence = self.sequence + 1
+        slot = (sequence - 1) % self.n_slots
+
+        offset = _RING_HEADER_SIZE + slot * self.slot_size
+        buf = self._shm.buf
+
+        # Invalidates the slot while it is written.
+        struct.pack_into("<Q", buf, offset, 0)
+
+        header_offset = offset + _SLOT_HEADER_SIZE
+        buf[header_offset : header_offset + len(header_bytes)] = header_bytes
+
+        data_offset = header_offset + self.header_size
+        view = numpy.ndarray(
+            data.shape, dtype=data.dtype, buffer=buf, offset=data_offset
+        )
+        view[...] = data
+        del view
+
+        _SLOT_STRUCT.pack_into(
+            buf,
+            offset,
+            sequence,
+            time.time(),
+            data.shape[0],
+            data.shape[1],
+            data.dtype.str.encode(),
+            len(header_bytes),
+        )
+
+        self.sequence = sequence
+        self._write_ring_header()
+
+        return (slot, sequence)
+
+    def close(self):
+        """Closes and removes the shared memory segment."""
+
+        _PUBLISHED_NAMES.discard(self._shm.name)
+
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class FrameSubscriber(object):
+    """Reads the frames published by a `.FramePublisher`.
+
+    Frames are returned as views of the shared memory, without copying. Since
+    the publisher does not wait for readers, a consumer that needs the data for
+    longer than the ring takes to wrap around should copy it, and check with
+    `.is_valid` that the frame was not overwritten while it was being used.
+
+    Parameters
+    ----------
+    name
+        The name of the shared memory segment.
+
+    """
+
+    def __init__(self, name: str):
+        if sys.version_info >= (3, 13):
+            self._shm = SharedMemory(name=name, track=False)  # type: ignore
+        else:
+            self._shm = SharedMemory(name=name)
+            # Prevents the resource tracker from removing the segment when this
+            # process exits.
+            if self._shm.name not in _PUBLISHED_NAMES:
+                shm_name = self._shm._name  # type: ignore
+                resource_tracker.unregister(shm_name, "shared_memory")
+
+        ring_header = _RING_STRUCT.unpack_from(self._shm.buf, 0)
+        magic, n_slots, header_size, data_size, slot_size, _ = ring_header
+
+        if magic != _RING_MAGIC:
+            self._shm.close()
+            raise ValueError(f"{name} is not a frame ring.")
+
+        self.name = name
+        self.n_slots = n_slots
+        self.header_size = header_size
+        self.data_size = data_size
+        self.slot_size = slot_size
+
+    @property
+    def last_sequence(self) -> int:
+        """The sequence number of the last frame published."""
+
+        return _RING_STRUCT.unpack_from(self._shm.buf, 0)[-1]
+
+    def _get_sequence(self, slot: int) -> int:
+        """Returns the sequence number of the frame in a slot."""
+
+        offset = _RING_HEADER_SIZE + slot * self.slot_size
+        return struct.unpack_from("<Q", self._shm.buf, offset)[0]
+
+    def read(self, slot: int) -> Optional[SharedFrame]:
+        """Returns the frame in a slot or `None` if the slot is empty."""
+
+        if slot < 0 or slot >= self.n_slots:
+            raise IndexError(f"invalid slot {slot}.")
+
+        offset = _RING_HEADER_SIZE + slot * self.slot_size
+        buf = self._shm.buf
+
+        (sequence, timestamp, n_rows, n_cols, dtype, header_length) = (
+            _SLOT_STRUCT.unpack_from(buf, offset)
+        )
+        if sequence == 0:
+            return None
+
+        header_offset = offset + _SLOT_HEADER_SIZE
+        header_bytes = bytes(buf[header_offset : header_offset + header_length])
+
+        data = numpy.ndarray(
+            (n_rows, n_cols),
+            dtype=numpy.dtype(dtype.rstrip(b"\x00").decode()),
+            buffer=buf,
+            offset=header_offset + self.header_size,
+        )
+
+        frame = SharedFrame(
+            slot=slot,
+            sequence=sequence,
+            timestamp=timestamp,
+            header=json.loads(header_bytes),
+            data=data,
+        )
+
+        # The slot was overwritten while reading it.
+        if not self.is_valid(frame):
+            return None
+
+        return frame
+
+    def latest(self) -> Optional[SharedFrame]:
+        """Returns the last frame published or `None` if there are no frames."""
+
+        sequence = self.last_sequence
+        if sequence == 0:
+            return None
+
+        return self.read((sequence - 1) % self.n_slots)
+
+    def is_valid(self, frame: SharedFrame) -> bool:
+        """Checks that a frame has not been overwritten."""
+
+        return self._get_sequence(frame.slot) == frame.sequence
+
+    def close(self):
+        """Closes the shared memory.
+
+        If frames read from the ring are still referenced, the memory is unmapped
+        when they are garbage collected.
+
+        """
+
+        try:
+            self._shm.close()
+        except BufferError:
+            pass
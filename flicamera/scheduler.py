@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: scheduler.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import time
+from dataclasses import dataclass
+
+from typing import Awaitable, Callable, Dict, Optional, Sequence, Union
+
+import numpy
+
+
+__all__ = ["ReadoutScheduler", "BusStats", "get_usb_bus", "DEFAULT_BUS"]
+
+
+#: The bus of the devices whose USB bus cannot be determined.
+DEFAULT_BUS = "default"
+
+#: Directories in sysfs with the character devices created by the fliusb driver.
+FLIUSB_SYSFS_PATHS = ("/sys/class/usbmisc", "/sys/class/usb")
+
+
+def get_usb_bus(
+    device_path: str,
+    sysfs_paths: Sequence[str] = FLIUSB_SYSFS_PATHS,
+) -> Optional[str]:
+    """Returns the USB bus number of a device from its ``FLIList`` path.
+
+    Device paths from libusb (``/dev/bus/usb/<bus>/<device>``) contain the bus
+    number. For the nodes created by the fliusb driver (``/dev/fliusb<n>``) the
+    bus is read from the sysfs path of the device. Returns `None` if the bus
+    cannot be determined, for example for mock devices.
+
+    """
+
+    match = re.match(r"^/dev/bus/usb/(\d+)/\d+$", device_path)
+    if match:
+        return str(int(match.group(1)))
+
+    node = os.path.basename(device_path)
+    if not node:
+        return None
+
+    for sysfs_path in sysfs_paths:
+        device_link = os.path.join(sysfs_path, node, "device")
+        if not os.path.exists(device_link):
+            continue
+
+        # The real path contains the root hub of the bus, e.g.,
+        # /sys/devices/pci0000:00/0000:00:14.0/usb3/3-2/3-2:1.0
+        match = re.search(r"/usb(\d+)/", os.path.realpath(device_link))
+        if match:
+            return match.group(1)
+
+    return None
+
+
+@dataclass
+class BusStats:
+    """Readout statistics of a USB bus.
+
+    A burst starts when a readout is requested on an idle bus and ends when no
+    readouts are running or waiting. ``busy_time`` is the total duration of the
+    bursts, and ``bandwidth`` the aggregate bandwidth in bytes per second over
+    that time. ``last_burst_time`` is the time it took to read all the frames in
+    the last burst, e.g., after a synchronised exposure.
+
+    """
+
+    bus: str
+    max_concurrent: Optional[int] = None
+    n_readouts: int = 0
+    n_bytes: int = 0
+    busy_time: float = 0.0
+    bandwidth: float = 0.0
+    last_burst_readouts: int = 0
+    last_burst_time: float = 0.0
+
+
+@dataclass
+class _Bus:
+    """The state of the readouts on a bus."""
+
+    stats: BusStats
+    semaphore: Optional[asyncio.Semaphore] = None
+    pending: int = 0
+    burst_start: float = 0.0
+    burst_readouts: int = 0
+
+
+class ReadoutScheduler(object):
+    """Limits the number of concurrent readouts of the devices on a USB bus.
+
+    Cameras that share a host controller compete for its bandwidth. Reading all
+    of them at once after a synchronised exposure makes each readout slower and
+    can cause timeouts. The scheduler lets at most ``max_concurrent`` readouts
+    run at the same time on each bus, in the order in which they were requested.
+
+    Parameters
+    ----------
+    max_concurrent
+        The maximum number of concurrent readouts on a bus. It can be a mapping
+        of bus to limit, in which case the ``default`` key, if present, is used
+        for the buses that are not listed. `None` means no limit.
+
+    """
+
+    def __init__(self, max_concurrent: Union[int, Dict[str, int], None] = None):
+        self.max_concurrent = max_concurrent
+
+        self._buses: Dict[str, _Bus] = {}
+
+    def get_limit(self, bus: str) -> Optional[int]:
+        """Returns the maximum number of concurrent readouts on a bus."""
+
+        if isinstance(self.max_concurrent, dict):
+            limits = {str(key): value for key, value in self.max_concurrent.items()}
+            limit = limits.get(bus, limits.get(DEFAULT_BUS, None))
+        else:
+            limit = self.max_concurrent
+
+        if limit is not None and limit < 1:
+            raise ValueError(f"invalid readout concurrency {limit} for bus {bus}.")
+
+        return limit
+
+    def _get_bus(self, bus: str) -> _Bus:
+        """Returns the state of a bus, creating it if needed."""
+
+        if bus not in self._buses:
+            limit = self.get_limit(bus)
+            self._buses[bus] = _Bus(
+                stats=BusStats(bus=bus, max_concurrent=limit),
+                semaphore=asyncio.Semaphore(limit) if limit else None,
+            )
+
+        return self._buses[bus]
+
+    async def readout(
+        self,
+        bus: str,
+        func: Callable[[], Awaitable[numpy.ndarray]],
+    ) -> numpy.ndarray:
+        """Runs a readout when there is a free slot on the bus.
+
+        Parameters
+        ----------
+        bus
+            The USB bus of the device.
+        func
+            A coroutine function, with no arguments, that reads and returns the
+            frame.
+
+        Returns
+        -------
+        data
+            The frame returned by ``func``.
+
+        """
+
+        state = self._get_bus(bus)
+
+        if state.pending == 0:
+            state.burst_start = time.perf_counter()
+            state.burst_readouts = 0
+
+        state.pending += 1
+
+        try:
+            if state.semaphore is None:
+                data = await func()
+            else:
+                async with state.semaphore:
+                    data = await func()
+
+            state.stats.n_readouts += 1
+            state.stats.n_bytes += data.nbytes
+            state.burst_readouts += 1
+
+            return data
+
+        finally:
+            state.pending -= 1
+            if state.pending == 0:
+                self._end_burst(state)
+
+    def _end_burst(self, state: _Bus):
+        """Updates the statistics of a bus when there are no pending readouts."""
+
+        stats = state.stats
+
+        burst_time = time.perf_counter() - state.burst_start
+        stats.busy_time += burst_time
+
+        if state.burst_readouts > 0:
+            stats.last_burst_readouts = state.burst_readouts
+            stats.last_burst_time = round(burst_time, 3)
+
+        if stats.busy_time > 0:
+            stats.bandwidth = round(stats.n_bytes / stats.busy_time, 1)
+
+    def get_stats(self) -> Dict[str, BusStats]:
+        """Returns the readout statistics of each bus."""
+
+        return {bus: state.stats for bus, state in self._buses.items()}
+
+    def reset_stats(self):
+        """Resets the statistics of all the buses."""
+
+        for bus, state in self._buses.items():
+            state.stats = BusStats(bus=bus, max_concurrent=state.stats.max_concurrent)
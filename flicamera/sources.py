@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: sources.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from typing import Any, List, Optional, Tuple
+
+import numpy
+from scipy import ndimage
+
+from flicamera.stats import MAD_TO_STD
+
+
+__all__ = [
+    "estimate_background",
+    "extract_sources",
+    "extract_sources_tiled",
+    "SOURCE_DTYPE",
+]
+
+
+#: The columns of the source table returned by `.extract_sources`.
+SOURCE_DTYPE = numpy.dtype(
+    [
+        ("x", "f4"),
+        ("y", "f4"),
+        ("flux", "f4"),
+        ("peak", "f4"),
+        ("fwhm", "f4"),
+        ("hfd", "f4"),
+        ("npix", "i4"),
+    ]
+)
+
+#: Ratio between the FWHM and the standard deviation of a Gaussian.
+SIGMA_TO_FWHM = 2.3548
+
+
+def _get_interpolation_weights(
+    n_pixels: int,
+    n_boxes: int,
+    box_size: int,
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Returns the indices and weights to interpolate between box centres."""
+
+    position = (numpy.arange(n_pixels) + 0.5) / box_size - 0.5
+    position = numpy.clip(position, 0, n_boxes - 1)
+
+    index0 = numpy.floor(position).astype(int)
+    index1 = numpy.minimum(index0 + 1, n_boxes - 1)
+
+    return index0, index1, (position - index0).astype(numpy.float32)
+
+
+def _interpolate_mesh(
+    mesh: numpy.ndarray,
+    shape: Tuple[int, int],
+    box_rows: int,
+    box_cols: int,
+) -> numpy.ndarray:
+    """Bilinearly interpolates a mesh of box values to the shape of the frame.
+
+    The mesh is first interpolated along the columns, which is cheap, and then
+    along the rows, with a single weighted sum over the frame. Pixels beyond the
+    outer box centres take the value of the closest centre.
+
+    """
+
+    mesh = mesh.astype(numpy.float32)
+
+    col0, col1, col_weight = _get_interpolation_weights(
+        shape[1],
+        mesh.shape[1],
+        box_cols,
+    )
+    rows = mesh[:, col0] * (1 - col_weight) + mesh[:, col1] * col_weight
+
+    row0, row1, row_weight = _get_interpolation_weights(
+        shape[0],
+        mesh.shape[0],
+        box_rows,
+    )
+    weight = row_weight[:, None]
+
+    return rows[row0] * (1 - weight) + rows[row1] * weight
+
+
+def estimate_background(
+    data: numpy.ndarray,
+    box_size: int = 64,
+) -> Tuple[numpy.ndarray, float]:
+    """Estimates the background of a frame.
+
+    The frame is divided in boxes of ``box_size`` pixels and the median of each
+    box is calculated at once on a reshaped view of the frame. The mesh of
+    medians is median-filtered and bilinearly interpolated to the shape of the
+    frame. The rows and columns that do not fill a box are not used to
+    calculate the mesh.
+
+    Parameters
+    ----------
+    data
+        The frame.
+    box_size
+        The size of the boxes, in pixels.
+
+    Returns
+    -------
+    background
+        A tuple with the background frame and the RMS of the background,
+        calculated from the median absolute deviation of the boxes.
+
+    """
+
+    n_rows, n_cols = data.shape
+    box_rows = max(min(box_size, n_rows), 1)
+    box_cols = max(min(box_size, n_cols), 1)
+
+    ny = n_rows // box_rows
+    nx = n_cols // box_cols
+
+    # Large boxes are sampled every other pixel, which is enough for a median
+    # and halves the size of the partition.
+    step = 2 if box_rows % 2 == 0 and box_cols % 2 == 0 and box_size >= 32 else 1
+
+    sampled = data[: ny * box_rows : step, : nx * box_cols : step]
+    boxes = sampled.reshape(ny, box_rows // step, nx, box_cols // step)
+    boxes = boxes.swapaxes(1, 2).reshape(ny, nx, -1).astype(numpy.float32)
+
+    medians = numpy.median(boxes, axis=2)
+    mad = numpy.median(numpy.abs(boxes - medians[:, :, None]), axis=2)
+    rms = float(MAD_TO_STD * numpy.median(mad))
+
+    # Boxes dominated by a bright star are replaced by their neighbours.
+    if ny >= 3 and nx >= 3:
+        medians = ndimage.median_filter(medians, size=3, mode="nearest")
+
+    background = _interpolate_mesh(medians, (n_rows, n_cols), box_rows, box_cols)
+
+    return background, rms
+
+
+def extract_sources(
+    data: numpy.ndarray,
+    threshold: float = 5.0,
+    min_area: int = 5,
+    box_size: int = 64,
+    smoothing: float = 1.5,
+    max_sources: int | None = None,
+) -> numpy.ndarray:
+    """Detects and centroids the sources in a frame.
+
+    The background is subtracted (see `.estimate_background`) and the frame is
+    smoothed with a Gaussian kernel. Groups of connected pixels above
+    ``threshold`` times the background RMS are the sources. Their centroids,
+    fluxes and second moments are calculated in a single weighted sum over the
+    pixels of all the sources, using `numpy.bincount`.
+
+    Parameters
+    ----------
+    data
+        The frame.
+    threshold
+        The detection threshold, in units of the background RMS.
+    min_area
+        Minimum number of connected pixels of a source.
+    box_size
+        The size of the boxes used to estimate the background.
+    smoothing
+        The standard deviation, in pixels, of the smoothing kernel. Zero to
+        disable smoothing.
+    max_sources
+        The maximum number of sources to return. The brightest ones are kept.
+
+    Returns
+    -------
+    sources
+        A structured array with `.SOURCE_DTYPE` and a row for each source,
+        sorted by decreasing flux. ``x`` and ``y`` are the zero-indexed
+        centroid, ``flux`` the sum of the background-subtracted pixels,
+        ``fwhm`` is derived from the second moments assuming a circular
+        Gaussian, and ``hfd`` is the half-flux diameter.
+
+    """
+
+    background, rms = estimate_background(data, box_size=box_size)
+
+    subtracted = data.astype(numpy.float32) - background
+
+    if smoothing > 0:
+        # Reflecting the edges would correlate the noise of the edge pixels and
+        # cause spurious detections.
+        smoothed = ndimage.gaussian_filter(subtracted, smoothing, mode="constant")
+        # Smoothing reduces the noise by about 2 sqrt(pi) sigma.
+        detection_rms = rms / (2 * numpy.sqrt(numpy.pi) * smoothing)
+    else:
+        smoothed = subtracted
+        detection_rms = rms
+
+    mask = smoothed > threshold * max(detection_rms, 1e-6)
+
+    labels, n_labels = ndimage.label(mask)
+    if n_labels == 0:
+        return numpy.zeros(0, dtype=SOURCE_DTYPE)
+
+    yy, xx = numpy.nonzero(labels)
+    label = labels[yy, xx]
+    weight = numpy.clip(subtracted[yy, xx], 0, None).astype(numpy.float64)
+
+    n_bins = n_labels + 1
+
+    npix = numpy.bincount(label, minlength=n_bins)
+    flux = numpy.bincount(label, weights=weight, minlength=n_bins)
+
+    valid = (npix >= min_area) & (flux > 0)
+    valid[0] = False
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        x = numpy.bincount(label, weights=weight * xx, minlength=n_bins) / flux
+        y = numpy.bincount(label, weights=weight * yy, minlength=n_bins) / flux
+        x2 = numpy.bincount(label, weights=weight * xx**2, minlength=n_bins) / flux
+        y2 = numpy.bincount(label, weights=weight * yy**2, minlength=n_bins) / flux
+
+    variance = numpy.clip(0.5 * (x2 - x**2 + y2 - y**2), 0, None)
+
+    # The half-flux diameter is estimated as twice the flux-weighted mean
+    # distance to the centroid.
+    radius = numpy.hypot(
+        xx - numpy.nan_to_num(x)[label], yy - numpy.nan_to_num(y)[label]
+    )
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        hfd = (
+            2 * numpy.bincount(label, weights=weight * radius, minlength=n_bins) / flux
+        )
+
+    peak = numpy.zeros(n_bins, dtype=numpy.float64)
+    numpy.maximum.at(peak, label, subtracted[yy, xx])
+
+    sources = numpy.zeros(int(valid.sum()), dtype=SOURCE_DTYPE)
+    sources["x"] = x[valid]
+    sources["y"] = y[valid]
+    sources["flux"] = flux[valid]
+    sources["peak"] = peak[valid]
+    sources["fwhm"] = SIGMA_TO_FWHM * numpy.sqrt(variance[valid])
+    sources["hfd"] = hfd[valid]
+    sources["npix"] = npix[valid]
+
+    sources = sources[numpy.argsort(-sources["flux"], kind="stable")]
+
+    if max_sources is not None:
+        sources = sources[:max_sources]
+
+    return sources
+
+
+def _get_tiles(
+    shape: Tuple[int, ...],
+    tile_size: int,
+    overlap: int,
+) -> List[Tuple[slice, slice, slice, slice]]:
+    """Returns the padded and core slices of the tiles of a frame."""
+
+    n_rows, n_cols = shape
+
+    tiles = []
+    for row0 in range(0, n_rows, tile_size):
+        for col0 in range(0, n_cols, tile_size):
+            row1 = min(row0 + tile_size, n_rows)
+            col1 = min(col0 + tile_size, n_cols)
+            tiles.append(
+                (
+                    slice(max(row0 - overlap, 0), min(row1 + overlap, n_rows)),
+                    slice(max(col0 - overlap, 0), min(col1 + overlap, n_cols)),
+                    slice(row0, row1),
+                    slice(col0, col1),
+                )
+            )
+
+    return tiles
+
+
+def _extract_tile(
+    data: numpy.ndarray,
+    tile: Tuple[slice, slice, slice, slice],
+    **kwargs,
+) -> numpy.ndarray:
+    """Extracts the sources of a tile whose centroid is in the core of the tile."""
+
+    rows, cols, core_rows, core_cols = tile
+
+    sources = extract_sources(data[rows, cols], **kwargs)
+
+    sources["x"] += cols.start
+    sources["y"] += rows.start
+
+    # Centroids are rounded to the pixel that contains them so that a source in
+    # the overlap of two tiles is kept only once.
+    x = numpy.floor(sources["x"] + 0.5)
+    y = numpy.floor(sources["y"] + 0.5)
+
+    in_core = (
+        (x >= core_cols.start)
+        & (x < core_cols.stop)
+        & (y >= core_rows.start)
+        & (y < core_rows.stop)
+    )
+
+    return sources[in_core]
+
+
+def extract_sources_tiled(
+    data: numpy.ndarray,
+    tile_size: int = 1024,
+    overlap: int = 32,
+    n_threads: Optional[int] = None,
+    max_sources: Optional[int] = None,
+    **kwargs: Any,
+) -> numpy.ndarray:
+    """Detects and centroids the sources of a large frame in parallel tiles.
+
+    The frame is divided in tiles of ``tile_size`` pixels that are processed by
+    `.extract_sources` in a pool of threads. Most of the work is done by numpy
+    and scipy functions that release the GIL, so the tiles are processed in
+    parallel. Each tile is extended by ``overlap`` pixels on each side, which
+    must be larger than the sources, and only the sources whose centroid is in
+    the tile itself are kept. The background is estimated independently for
+    each tile.
+
+    Parameters
+    ----------
+    data
+        The frame.
+    tile_size
+        The size of the tiles, in pixels.
+    overlap
+        The number of pixels by which the tiles overlap.
+    n_threads
+        The number of threads. Defaults to the number of CPUs.
+    max_sources
+        The maximum number of sources to return. The brightest ones are kept.
+    kwargs
+        Other arguments to pass to `.extract_sources`.
+
+    Returns
+    -------
+    sources
+        A structured array with `.SOURCE_DTYPE`, sorted by decreasing flux, with
+        the centroids in the coordinates of the whole frame.
+
+    """
+
+    tiles = _get_tiles(data.shape, tile_size, overlap)
+
+    n_threads = n_threads or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=min(n_threads, len(tiles))) as executor:
+        results = list(
+            executor.map(lambda tile: _extract_tile(data, tile, **kwargs), tiles)
+        )
+
+    sources = numpy.concatenate(results)
+    sources = sources[numpy.argsort(-sources["flux"], kind="stable")]
+
+    if max_sources is not None:
+        sources = sources[:max_sources]
+
+    return sources
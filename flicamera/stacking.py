@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: stacking.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy
+
+from flicamera.stats import MAD_TO_STD
+
+
+__all__ = ["Stacker", "sigclip", "get_reducer", "REDUCERS"]
+
+
+def sigclip(data: numpy.ndarray, axis: int = 0, sigma: float = 3.0) -> numpy.ndarray:
+    """Returns the sigma-clipped mean of an array along an axis.
+
+    Values further than ``sigma`` times the standard deviation, estimated from
+    the median absolute deviation, from the median are rejected. This is the
+    non-streaming equivalent of the ``sigclip`` reducer of `.Stacker` and can
+    be used as the ``stack_function`` of `~basecam.camera.BaseCamera.expose`.
+
+    """
+
+    data = numpy.asarray(data, dtype=numpy.float32)
+
+    median = numpy.median(data, axis=axis, keepdims=True)
+    std = MAD_TO_STD * numpy.median(numpy.abs(data - median), axis=axis, keepdims=True)
+    std = numpy.maximum(std, 1.0)
+
+    keep = numpy.abs(data - median) <= sigma * std
+    count = keep.sum(axis=axis)
+
+    total = numpy.where(keep, data, 0).sum(axis=axis)
+    median = numpy.squeeze(median, axis=axis)
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        return numpy.where(count > 0, total / count, median).astype(numpy.float32)
+
+
+#: Functions used to reduce a stack, by name of the reducer.
+REDUCERS: Dict[str, Callable[..., numpy.ndarray]] = {
+    "mean": numpy.mean,
+    "sum": numpy.sum,
+    "median": numpy.median,
+    "sigclip": sigclip,
+}
+
+
+def get_reducer(stack_function: Union[str, Callable[..., Any]]) -> Optional[str]:
+    """Returns the name of the reducer for a stack function.
+
+    ``stack_function`` can be the name of a reducer or one of the functions in
+    `.REDUCERS`. Returns `None` if there is no equivalent reducer.
+
+    """
+
+    if isinstance(stack_function, str):
+        if stack_function not in REDUCERS:
+            raise ValueError(f"invalid stack function {stack_function!r}.")
+        return stack_function
+
+    for name, function in REDUCERS.items():
+        if stack_function is function:
+            return name
+
+    return None
+
+
+def _weighted_median(
+    items: List[numpy.ndarray],
+    weights: List[int],
+    chunk_rows: int = 256,
+) -> numpy.ndarray:
+    """Returns the per-pixel weighted median of a list of frames.
+
+    The frames are processed in chunks of rows to bound the size of the sort.
+
+    """
+
+    weight_array = numpy.array(weights, dtype=numpy.float64)
+    half = weight_array.sum() / 2.0
+
+    n_rows = items[0].shape[0]
+    result = numpy.empty(items[0].shape, dtype=numpy.float32)
+
+    for start in range(0, n_rows, chunk_rows):
+        chunk = numpy.stack([item[start : start + chunk_rows] for item in items])
+
+        order = numpy.argsort(chunk, axis=0)
+        values = numpy.take_along_axis(chunk, order, axis=0)
+        cumulative = numpy.cumsum(weight_array[order], axis=0)
+
+        index = numpy.argmax(cumulative >= half, axis=0)[None]
+        result[start : start + chunk_rows] = numpy.take_along_axis(values, index, 0)[0]
+
+    return result
+
+
+class Stacker(object):
+    """Combines frames into a stack as they are read, with bounded memory.
+
+    The ``sum`` and ``mean`` reducers keep a running ``uint32`` accumulator for
+    integer frames, or ``float32`` otherwise, so only one extra frame is kept
+    in memory regardless of the number of frames.
+
+    The ``median`` reducer uses the remedian: frames are kept in groups of
+    ``median_base`` and, when a group is full, it is replaced by its median,
+    which is added to the group of the next level. At most ``median_base``
+    frames are kept per level, so the memory grows with the logarithm of the
+    number of frames. The result is exact if there are no more than
+    ``median_base`` frames, and otherwise is the weighted median of the
+    remaining groups.
+
+    The ``sigclip`` reducer buffers the first ``n_init`` frames, from which the
+    per-pixel median and standard deviation (from the median absolute
+    deviation) are estimated. The standard deviation is not allowed to be
+    smaller than its median across the frame. Values further than ``sigma``
+    standard deviations are rejected and the others start a running mean and
+    variance (Welford's algorithm). Each new frame is then clipped against the
+    running mean and standard deviation.
+
+    Parameters
+    ----------
+    n_frames
+        The number of frames to stack.
+    reducer
+        One of ``mean``, ``sum``, ``median``, or ``sigclip``.
+    sigma
+        The rejection threshold of the ``sigclip`` reducer.
+    median_base
+        The size of the groups of the ``median`` reducer.
+    n_init
+        The number of frames used to initialise the ``sigclip`` reducer.
+
+    """
+
+    def __init__(
+        self,
+        n_frames: int,
+        reducer: str = "mean",
+        sigma: float = 3.0,
+        median_base: int = 5,
+        n_init: int = 5,
+    ):
+        if n_frames < 1:
+            raise ValueError("n_frames must be at least 1.")
+
+        if reducer not in REDUCERS:
+            raise ValueError(f"invalid reducer {reducer!r}.")
+
+        if median_base < 2:
+            raise ValueError("median_base must be at least 2.")
+
+        self.n_frames = n_frames
+        self.reducer = reducer
+        self.sigma = sigma
+        self.median_base = median_base
+        self.n_init = max(n_init, 1)
+
+        self.n_added = 0
+
+        self._accumulator: Optional[numpy.ndarray] = None
+
+        self._levels: List[List[numpy.ndarray]] = [[]]
+
+        self._buffer: List[numpy.ndarray] = []
+        self._mean: Optional[numpy.ndarray] = None
+        self._m2: Optional[numpy.ndarray] = None
+        self._count: Optional[numpy.ndarray] = None
+        self._std_floor = 1.0
+        self._n_rejected = 0
+
+    @property
+    def function(self) -> Callable[..., numpy.ndarray]:
+        """The function equivalent to the reducer, for the ``STACKFUN`` card."""
+
+        return REDUCERS[self.reducer]
+
+    @property
+    def n_rejected(self) -> int:
+        """The number of pixel values rejected by the ``sigclip`` reducer."""
+
+        return self._n_rejected
+
+    def add(self, frame: numpy.ndarray):
+        """Adds a frame to the stack. The frame is not kept and can be reused."""
+
+        if self.n_added >= self.n_frames:
+            raise ValueError("the stack is already complete.")
+
+        if self.reducer in ["sum", "mean"]:
+            self._add_sum(frame)
+        elif self.reducer == "median":
+            self._add_median(frame)
+        else:
+            self._add_sigclip(frame)
+
+        self.n_added += 1
+
+    def _add_sum(self, frame: numpy.ndarray):
+        """Adds a frame to the running sum."""
+
+        if self._accumulator is None:
+            if frame.dtype.kind in "ui" and frame.dtype.itemsize <= 2:
+                dtype = numpy.uint32 if frame.dtype.kind == "u" else numpy.int32
+            else:
+                dtype = numpy.float32
+            self._accumulator = numpy.zeros(frame.shape, dtype=dtype)
+
+        numpy.add(self._accumulator, frame, out=self._accumulator, casting="unsafe")
+
+    def _add_median(self, frame: numpy.ndarray):
+        """Adds a frame to the remedian."""
+
+        self._levels[0].append(frame.copy())
+
+        level = 0
+        while len(self._levels[level]) == self.median_base:
+            group = numpy.stack(self._levels[level])
+            median = numpy.median(group, axis=0).astype(numpy.float32)
+            del group
+
+            self._levels[level] = []
+            if len(self._levels) == level + 1:
+                self._levels.append([])
+
+            self._levels[level + 1].append(median)
+            level += 1
+
+    def _add_sigclip(self, frame: numpy.ndarray):
+        """Adds a frame to the sigma-clipped running mean."""
+
+        if self._mean is None:
+            self._buffer.append(frame.astype(numpy.float32))
+            if len(self._buffer) == self.n_init:
+                self._init_sigclip()
+            return
+
+        assert self._m2 is not None and self._count is not None
+
+        values = frame.astype(numpy.float32)
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            variance = numpy.where(self._count > 1, self._m2 / (self._count - 1), 0)
+
+        std = numpy.maximum(numpy.sqrt(variance), self._std_floor)
+        keep = numpy.abs(values - self._mean) <= self.sigma * std
+
+        self._n_rejected += int(keep.size - numpy.count_nonzero(keep))
+        self._update_welford(values, keep)
+
+    def _init_sigclip(self):
+        """Initialises the running statistics from the buffered frames."""
+
+        data = numpy.stack(self._buffer)
+        self._buffer = []
+
+        median = numpy.median(data, axis=0)
+        std = MAD_TO_STD * numpy.median(numpy.abs(data - median), axis=0)
+
+        # With few frames the per-pixel deviation is noisy, so it is not allowed
+        # to be smaller than the typical deviation of the frame.
+        self._std_floor = max(float(numpy.median(std)), 1.0)
+        std = numpy.maximum(std, self._std_floor)
+
+        self._mean = numpy.zeros(median.shape, dtype=numpy.float32)
+        self._m2 = numpy.zeros(median.shape, dtype=numpy.float32)
+        self._count = numpy.zeros(median.shape, dtype=numpy.uint32)
+
+        for values in data:
+            keep = numpy.abs(values - median) <= self.sigma * std
+            self._n_rejected += int(keep.size - numpy.count_nonzero(keep))
+            self._update_welford(values, keep)
+
+        # Pixels for which all the values were rejected use the median.
+        empty = self._count == 0
+        self._mean[empty] = median[empty]
+
+    def _update_welford(self, values: numpy.ndarray, keep: numpy.ndarray):
+        """Updates the running mean and variance with the kept values."""
+
+        assert self._mean is not None and self._m2 is not None
+        assert self._count is not None
+
+        self._count += keep
+
+        delta = numpy.where(keep, values - self._mean, 0)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            self._mean += numpy.where(keep, delta / self._count, 0)
+
+        self._m2 += delta * numpy.where(keep, values - self._mean, 0)
+
+    def result(self) -> numpy.ndarray:
+        """Returns the stacked frame.
+
+        ``sum`` stacks of integer frames are ``uint32`` (or ``int32``); all the
+        other stacks are ``float32``.
+
+        """
+
+        if self.n_added == 0:
+            raise ValueError("no frames have been added.")
+
+        if self.reducer == "sum":
+            assert self._accumulator is not None
+            return self._accumulator
+
+        if self.reducer == "mean":
+            assert self._accumulator is not None
+            return (self._accumulator / self.n_added).astype(numpy.float32)
+
+        if self.reducer == "median":
+            return self._median_result()
+
+        if self._mean is None:
+            self._init_sigclip()
+
+        assert self._mean is not None
+
+        return self._mean
+
+    def _median_result(self) -> numpy.ndarray:
+        """Returns the result of the remedian."""
+
+        levels = self._levels
+
+        if all(len(level) == 0 for level in levels[:-1]) and len(levels[-1]) == 1:
+            return levels[-1][0].astype(numpy.float32)
+
+        if len(levels) == 1:
+            return numpy.median(numpy.stack(levels[0]), axis=0).astype(numpy.float32)
+
+        items = []
+        weights = []
+        for level, group in enumerate(levels):
+            for item in group:
+                items.append(item)
+                weights.append(self.median_base**level)
+
+        return _weighted_median(items, weights)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: stats.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from typing import Optional
+
+import numpy
+
+
+__all__ = ["FrameStats", "get_frame_stats"]
+
+
+#: Scale factor between the median absolute deviation and the standard
+#: deviation of a normal distribution.
+MAD_TO_STD = 1.4826
+
+#: Maximum number of pixels to histogram at once.
+CHUNK_SIZE = 1048576
+
+
+@dataclass
+class FrameStats:
+    """Statistics of a frame.
+
+    Percentiles use the nearest-rank definition, so they are always pixel
+    values. ``background`` is the median of the frame and ``background_rms``
+    is estimated from the median absolute deviation, which is not biased by the
+    stars in the frame.
+
+    """
+
+    mean: float
+    median: float
+    p05: float
+    p95: float
+    minimum: float
+    maximum: float
+    n_saturated: int
+    background: float
+    background_rms: float
+
+
+def _get_histogram(data: numpy.ndarray) -> numpy.ndarray:
+    """Returns the number of pixels with each value of an unsigned integer frame.
+
+    The frame is read once, in chunks of rows, so that `numpy.bincount` does
+    not need to convert the whole frame to ``intp``.
+
+    """
+
+    n_values = numpy.iinfo(data.dtype).max + 1
+    histogram = numpy.zeros(n_values, dtype=numpy.int64)
+
+    n_rows = max(CHUNK_SIZE // max(data.shape[-1], 1), 1)
+    for start in range(0, data.shape[0], n_rows):
+        chunk = data[start : start + n_rows].ravel()
+        histogram += numpy.bincount(chunk, minlength=n_values)
+
+    return histogram
+
+
+def _get_percentile(cumulative: numpy.ndarray, q: float) -> int:
+    """Returns the nearest-rank percentile ``q`` from a cumulative histogram."""
+
+    rank = max(int(numpy.ceil(q / 100.0 * cumulative[-1])), 1)
+
+    return int(numpy.searchsorted(cumulative, rank))
+
+
+def _get_histogram_stats(
+    histogram: numpy.ndarray,
+    saturation: int,
+) -> FrameStats:
+    """Calculates the statistics of a frame from its histogram."""
+
+    values = numpy.arange(histogram.size, dtype=numpy.float64)
+    n_pixels = int(histogram.sum())
+
+    cumulative = numpy.cumsum(histogram)
+    median = _get_percentile(cumulative, 50)
+
+    # The absolute deviations are also histogrammed, so the median absolute
+    # deviation does not require another pass over the frame.
+    deviation = numpy.abs(values - median)
+    order = numpy.argsort(deviation, kind="stable")
+    deviation_cumulative = numpy.cumsum(histogram[order])
+    mad_rank = max(int(numpy.ceil(0.5 * n_pixels)), 1)
+    mad = deviation[order[numpy.searchsorted(deviation_cumulative, mad_rank)]]
+
+    nonzero = numpy.flatnonzero(histogram)
+
+    return FrameStats(
+        mean=round(float(numpy.dot(histogram, values)) / n_pixels, 3),
+        median=float(median),
+        p05=float(_get_percentile(cumulative, 5)),
+        p95=float(_get_percentile(cumulative, 95)),
+        minimum=float(nonzero[0]),
+        maximum=float(nonzero[-1]),
+        n_saturated=int(histogram[saturation:].sum()),
+        background=float(median),
+        background_rms=round(MAD_TO_STD * float(mad), 3),
+    )
+
+
+def get_frame_stats(
+    data: numpy.ndarray,
+    saturation: Optional[float] = None,
+) -> FrameStats:
+    """Calculates the statistics of a frame.
+
+    For unsigned integer frames, which is what the cameras return, the frame is
+    read only once to build its histogram, from which all the statistics are
+    derived. Other frames fall back to the numpy functions.
+
+    Parameters
+    ----------
+    data
+        The frame.
+    saturation
+        Pixels at or above this value are counted as saturated. Defaults to the
+        maximum value of the data type for integer frames.
+
+    Returns
+    -------
+    stats
+        A `.FrameStats` object.
+
+    """
+
+    if data.size == 0:
+        raise ValueError("cannot calculate the statistics of an empty frame.")
+
+    if data.dtype.kind == "u" and data.dtype.itemsize <= 2:
+        if saturation is None:
+            saturation = numpy.iinfo(data.dtype).max
+        histogram = _get_histogram(data)
+        return _get_histogram_stats(histogram, int(numpy.ceil(saturation)))
+
+    if saturation is None:
+        saturation = (
+            numpy.iinfo(data.dtype).max if data.dtype.kind in "iu" else numpy.inf
+        )
+
+    median, p05, p95 = numpy.percentile(data, [50, 5, 95], method="inverted_cdf")
+    mad = numpy.median(numpy.abs(data - median))
+
+    return FrameStats(
+        mean=round(float(data.mean()), 3),
+        median=float(median),
+        p05=float(p05),
+        p95=float(p95),
+        minimum=float(data.min()),
+        maximum=float(data.max()),
+        n_saturated=int(numpy.count_nonzero(data >= saturation)),
+        background=float(median),
+        background_rms=round(MAD_TO_STD * float(mad), 3),
+    )
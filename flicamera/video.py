@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: video.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from typing import TYPE_CHECKING, List, Optional, Union
+
+import numpy
+
+from flicamera.worker import Priority
+
+
+if TYPE_CHECKING:
+    from .camera import FLICamera
+
+
+__all__ = ["VideoFrame", "VideoStats", "VideoStream"]
+
+
+@dataclass
+class VideoFrame:
+    """A frame from a `.VideoStream`.
+
+    ``data`` is one of the buffers of the stream and is recycled when the next
+    frame is requested. Copy it if it needs to be kept.
+
+    """
+
+    index: int
+    timestamp: float
+    data: numpy.ndarray
+
+
+@dataclass
+class VideoStats:
+    """Statistics of a `.VideoStream`.
+
+    ``n_frames`` is the number of frames grabbed from the camera and
+    ``frame_rate`` the rate at which they were grabbed. Frames skipped because
+    of the decimation are not delivered but are not counted as dropped; frames
+    are dropped when there is no free buffer because the consumer is slower than
+    the camera.
+
+    """
+
+    n_frames: int = 0
+    n_delivered: int = 0
+    n_dropped: int = 0
+    elapsed: float = 0.0
+    frame_rate: float = 0.0
+
+
+class VideoStream(object):
+    """Streams frames from a camera in video mode.
+
+    Use it as an asynchronous context manager and iterate over it ::
+
+        async with camera.video(0.1, decimate=2) as stream:
+            async for frame in stream:
+                process(frame.data)
+
+        print(stream.stats)
+
+    Frames are grabbed by the camera `.DeviceWorker` into a pool of
+    ``n_buffers`` buffers. The camera keeps streaming while the consumer
+    processes a frame; if all the buffers are in use the next frame is dropped.
+    If the camera is in 8-bit mode but reads in 16 bits, the frames are
+    grabbed into a scratch buffer and converted as in the exposures.
+
+    Parameters
+    ----------
+    camera
+        The camera to stream from.
+    exptime
+        The exposure time of each frame, in seconds.
+    decimate
+        Only deliver one of every ``decimate`` frames.
+    n_buffers
+        The number of frame buffers.
+    max_frames
+        Stop the iteration after this number of frames has been delivered.
+
+    """
+
+    def __init__(
+        self,
+        camera: FLICamera,
+        exptime: float,
+        decimate: int = 1,
+        n_buffers: int = 3,
+        max_frames: Optional[int] = None,
+    ):
+        if decimate < 1:
+            raise ValueError("decimate must be at least 1.")
+
+        if n_buffers < 1:
+            raise ValueError("n_buffers must be at least 1.")
+
+        self.camera = camera
+        self.exptime = exptime
+        self.decimate = decimate
+        self.n_buffers = n_buffers
+        self.max_frames = max_frames
+
+        self.stats = VideoStats()
+
+        # None is queued when the grab loop ends, to wake up waiting consumers.
+        self._queue: asyncio.Queue[Union[VideoFrame, BaseException, None]]
+        self._queue = asyncio.Queue()
+        self._free: List[numpy.ndarray] = []
+        self._scratch: Optional[numpy.ndarray] = None
+        self._convert: bool = False
+        self._last: Optional[VideoFrame] = None
+
+        self._task: Optional[asyncio.Task] = None
+        self._start_time: float = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the camera is streaming."""
+
+        return self._task is not None and not self._task.done()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *excinfo):
+        await self.stop()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> VideoFrame:
+        # The buffer of the previous frame can be reused.
+        if self._last is not None:
+            self._free.append(self._last.data)
+            self._last = None
+
+        if self.max_frames is not None and self.stats.n_delivered >= self.max_frames:
+            raise StopAsyncIteration
+
+        if not self.running and self._queue.empty():
+            raise StopAsyncIteration
+
+        item = await self._queue.get()
+        if item is None:
+            # Leaves the sentinel for other consumers waiting on the queue.
+            self._queue.put_nowait(None)
+            raise StopAsyncIteration
+
+        if isinstance(item, BaseException):
+            raise item
+
+        self._last = item
+        self.stats.n_delivered += 1
+
+        return item
+
+    async def start(self):
+        """Starts the video mode and the grab loop."""
+
+        if self.running:
+            return
+
+        shape = self.camera._device.get_frame_shape()
+        dtype = self.camera._device.get_frame_dtype()
+
+        # Frames read in 16 bits in 8-bit mode are converted in software.
+        self._convert = self.camera.bit_depth == 8 and dtype != numpy.uint8
+        buffer_dtype = numpy.uint8 if self._convert else dtype
+
+        self._free = [
+            numpy.empty(shape, dtype=buffer_dtype) for _ in range(self.n_buffers)
+        ]
+        self._scratch = numpy.empty(shape, dtype=dtype)
+
+        await self.camera._call(
+            self.camera._setup_video,
+            self.exptime,
+            priority=Priority.EXPOSURE,
+        )
+
+        self.stats = VideoStats()
+        self._start_time = time.time()
+        self._queue = asyncio.Queue()
+
+        self._task = asyncio.create_task(self._grab())
+
+        self.camera.video_stream = self
+
+    async def stop(self):
+        """Stops the grab loop and the video mode."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+            self._update_stats()
+
+            try:
+                await self.camera._call(self.camera._device.stop_video)
+            finally:
+                self.camera.video_stream = None
+
+            self.camera.log(
+                f"Video stopped: {self.stats.n_frames} frames at "
+                f"{self.stats.frame_rate} fps, {self.stats.n_dropped} dropped."
+            )
+
+    def _update_stats(self):
+        """Updates the elapsed time and frame rate."""
+
+        elapsed = time.time() - self._start_time
+
+        self.stats.elapsed = round(elapsed, 3)
+        if elapsed > 0:
+            self.stats.frame_rate = round(self.stats.n_frames / elapsed, 2)
+
+    async def _grab(self):
+        """Grabs frames and queues those that must be delivered."""
+
+        assert self._scratch is not None
+
+        device = self.camera._device
+
+        try:
+            while True:
+                index = self.stats.n_frames
+                deliver = index % self.decimate == 0
+
+                buffer = self._free.pop() if deliver and self._free else None
+                if buffer is not None and not self._convert:
+                    target = buffer
+                else:
+                    target = self._scratch
+
+                try:
+                    await self.camera._call(
+                        device.grab_video_frame,
+                        target,
+                        priority=Priority.READOUT,
+                    )
+                except BaseException:
+                    if buffer is not None:
+                        self._free.append(buffer)
+                    raise
+
+                self.stats.n_frames += 1
+                self._update_stats()
+
+                if not deliver:
+                    continue
+
+                if buffer is None:
+                    self.stats.n_dropped += 1
+                    continue
+
+                if self._convert:
+                    numpy.copyto(buffer, self.camera._to_bit_depth(self._scratch))
+
+                self._queue.put_nowait(VideoFrame(index, time.time(), buffer))
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            self._queue.put_nowait(err)
+        finally:
+            self._queue.put_nowait(None)
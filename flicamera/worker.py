@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: worker.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import itertools
+import queue
+import threading
+
+from typing import Any, Callable, Optional, TypeVar
+
+
+__all__ = ["Priority", "DeviceWorker"]
+
+
+T = TypeVar("T")
+
+
+class Priority(enum.IntEnum):
+    """Priorities for calls to a device. Lower values run first."""
+
+    READOUT = 0
+    EXPOSURE = 1
+    CONTROL = 2
+    STATUS = 3
+
+
+# Used to stop the worker after all the pending calls have run.
+_STOP_PRIORITY = max(Priority) + 1
+
+
+def _set_result(future: asyncio.Future, result: Any):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exception: BaseException):
+    if not future.done():
+        future.set_exception(exception)
+
+
+class DeviceWorker(object):
+    """A thread that serialises all the calls to a device.
+
+    libfli calls block while the USB transfer completes. Running them in a
+    dedicated thread per device ensures that the event loop is never blocked and
+    that calls to the same device never overlap. Calls are queued with a
+    `.Priority` so that readout and exposure control run ahead of status
+    requests; calls with the same priority run in the order they were queued.
+
+    Parameters
+    ----------
+    name
+        A name for the worker thread, usually the name of the camera.
+
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._counter = itertools.count()
+
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is running."""
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Starts the worker thread."""
+
+        if self.running:
+            return
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"flicamera-{self.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    async def stop(self):
+        """Stops the worker after running the pending calls."""
+
+        if not self.running:
+            return
+
+        assert self._thread is not None
+
+        self._queue.put((_STOP_PRIORITY, next(self._counter), None, (), {}, None))
+        await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+
+        self._thread = None
+
+    async def call(
+        self,
+        func: Callable[..., T],
+        *args,
+        priority: Priority = Priority.CONTROL,
+        **kwargs,
+    ) -> T:
+        """Runs ``func(*args, **kwargs)`` in the worker thread and returns the result.
+
+        If the awaiting task is cancelled before the call starts, the call is
+        skipped. Once it has started it runs to completion.
+
+        """
+
+        if not self.running:
+            raise RuntimeError(f"worker {self.name!r} is not running.")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        self._queue.put(
+            (priority, next(self._counter), func, args, kwargs, (loop, future))
+        )
+
+        return await future
+
+    def _run(self):
+        """Runs the queued calls."""
+
+        while True:
+            _, _, func, args, kwargs, waiter = self._queue.get()
+            if func is None:
+                break
+
+            loop, future = waiter
+            if future.cancelled():
+                continue
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as err:
+                callback, value = _set_exception, err
+            else:
+                callback, value = _set_result, result
+
+            try:
+                loop.call_soon_threadsafe(callback, future, value)
+            except RuntimeError:
+                pass  # The loop has been closed.
@@ -21,6 +21,7 @@ from setuptools.command.bdist_wheel import bdist_wheel
 
 
 LIBFLI_PATH = "flicamera/cextern/libfli-1.999.1-180223"
+LIBFLIMOCK_PATH = "flicamera/cextern/libflimock"
 
 RTD = os.environ.get("READTHEDOCS", False)
 
@@ -122,6 +123,15 @@ ext_modules = [
         language="c",
         optional=False,
     ),
+    # A mock of libfli used in simulation mode. It does not depend on libusb.
+    Extension(
+        "flicamera.libflimock",
+        sources=[os.path.join(LIBFLIMOCK_PATH, "libflimock.c")],
+        libraries=["m", "pthread"],
+        extra_compile_args=["-O3", "-fPIC"],
+        language="c",
+        optional=True,
+    ),
 ]
 
 
@@ -6,12 +6,20 @@
 # @Filename: test_camera.py
 # @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
 
+import asyncio
+import errno
 import pathlib
+import threading
+import time
 
 import numpy
 import pytest
+from astropy.io import fits
 
 from flicamera import FLICameraSystem
+from flicamera.camera import DeviceHealth, FlushPolicy
+from flicamera.lib import FLIError, FLIWarning, LibFLI, LibFLIDevice
+from flicamera.mock import MockFLIDevice, MockLibFLI
 
 
 def test_camera_system(camera_system):
@@ -90,3 +98,266 @@ async def test_expose_snapshot(camera_system, monkeypatch):
 
     assert snap_path.exists()
     snap_path.unlink()
+
+
+def test_list_cameras_cached(camera_system, mocker):
+    camera_system.list_available_cameras()
+
+    get_device = mocker.spy(LibFLI, "get_device")
+    assert camera_system.list_available_cameras() == ["ML1234"]
+    get_device.assert_not_called()
+
+
+def test_list_cameras_cache_invalidated(camera_system, mocker):
+    camera_system.list_available_cameras()
+
+    camera_system.lib.libc.devices.add(
+        MockFLIDevice("FLI-4", status_params={"serial": "ML5678"})
+    )
+
+    get_device = mocker.spy(LibFLI, "get_device")
+    assert camera_system.list_available_cameras() == ["ML1234", "ML5678"]
+    assert get_device.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_expose_retry(camera_system, monkeypatch, mocker):
+    camera = camera_system.cameras[0]
+    monkeypatch.setitem(camera.camera_params, "exposure_retries", 1)
+
+    read_frame = LibFLIDevice.read_frame
+    n_calls = 0
+
+    def read_frame_fail_once(self):
+        nonlocal n_calls
+        n_calls += 1
+        if n_calls == 1:
+            raise FLIError("No such device (-19)", errno=errno.ENODEV)
+        return read_frame(self)
+
+    mocker.patch.object(LibFLIDevice, "read_frame", read_frame_fail_once)
+
+    exposure = await camera.expose(0.1)
+
+    assert exposure.data.shape == (512, 512)
+    assert camera.health == DeviceHealth.OK
+    assert camera.recovery_stats.n_recoveries == 1
+    assert camera.recovery_stats.n_exposure_retries == 1
+    assert camera.recovery_stats.last_recovery_time is not None
+
+
+@pytest.mark.asyncio
+async def test_recovery_restores_binning(camera_system):
+    camera = camera_system.cameras[0]
+
+    await camera.set_binning(2, 2)
+    assert await camera.recover()
+
+    assert await camera.get_binning() == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_recovery_fails(camera_system, monkeypatch):
+    camera = camera_system.cameras[0]
+    monkeypatch.setitem(camera.camera_params, "recovery_attempts", 2)
+    monkeypatch.setitem(camera.camera_params, "recovery_delay", 0.01)
+
+    camera_system.lib.libc.devices = []
+
+    with pytest.warns(FLIWarning, match="Camera disconnected"):
+        status = await camera.update_status()
+
+    assert status["health"] == "disconnected"
+    assert camera.health == DeviceHealth.DISCONNECTED
+    assert camera.recovery_stats.n_failed_recoveries == 1
+    assert len(camera_system.cameras) == 0
+
+
+@pytest.mark.asyncio
+async def test_expose_sequence(camera_system, tmp_path, mocker, monkeypatch):
+    camera = camera_system.cameras[0]
+    camera.image_namer.dirname = tmp_path
+
+    monkeypatch.setitem(camera.camera_params, "find_calibrations", False)
+
+    set_exposure_time = mocker.spy(LibFLIDevice, "set_exposure_time")
+    expose_frame = mocker.spy(LibFLIDevice, "expose_frame")
+
+    result = await camera.expose_sequence(0.05, 3)
+
+    assert set_exposure_time.call_count == 1
+    assert expose_frame.call_count == 3
+
+    assert len(result.filenames) == 3
+    assert all(pathlib.Path(filename).exists() for filename in result.filenames)
+    assert result.cadence is not None and result.cadence >= 0.05
+    assert result.dead_time is not None
+
+
+@pytest.mark.asyncio
+async def test_expose_sequence_interval(camera_system):
+    camera = camera_system.cameras[0]
+
+    result = await camera.expose_sequence(0.01, 3, interval=0.2, write=False)
+
+    assert len(result.exposures) == 3
+    assert result.exposures[0].data is not result.exposures[1].data
+    assert result.cadence is not None and result.cadence >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_expose_windows(camera_system):
+    camera = camera_system.cameras[0]
+
+    cutouts = await camera.expose_windows(0.01, [(0, 0, 32, 32), (64, 256, 96, 272)])
+
+    assert [cutout.shape for cutout in cutouts] == [(32, 32), (16, 32)]
+    assert cutouts[0].mean() > 0
+
+    assert camera._device.windows == []
+
+    exposure = await camera.expose(0.01, write=False)
+    assert exposure.data.shape == (512, 512)
+
+
+@pytest.mark.asyncio
+async def test_readout_mode(camera_system):
+    camera = camera_system.cameras[0]
+
+    # Set from the readout_mode camera parameter.
+    assert camera._device.readout_mode_name == "1 MHz"
+    assert (await camera.update_status() or {})["readout_mode"] == "1 MHz"
+
+    exposure = await camera.expose(0.01, write=False)
+    header = camera.fits_model[0].header_model.to_header(
+        exposure,
+        context=camera.fits_model.context,
+    )
+    assert header["READMODE"] == "1 MHz"
+
+    await camera.set_readout_mode(0)
+    assert camera._device.readout_mode_name == "8 MHz"
+
+
+@pytest.mark.asyncio
+async def test_flush_policy(camera_system):
+    camera = camera_system.cameras[0]
+    device = camera_system.lib.libc.devices[0]
+
+    camera.flush_policy = FlushPolicy(
+        background=False,
+        nflushes=2,
+        short_exptime=1.0,
+        short_nflushes=0,
+    )
+    await camera._call(camera._setup_flushing)
+    assert device.state["background_flush"] is False
+
+    await camera.expose(0.01, write=False)
+    assert device.state["nflushes"] == 0
+
+    await camera.expose(1.5, write=False)
+    assert device.state["nflushes"] == 2
+
+
+@pytest.mark.asyncio
+async def test_measure_exposure_latency(camera_system):
+    camera = camera_system.cameras[0]
+    device = camera_system.lib.libc.devices[0]
+
+    # 512 rows at 0.1 ms per row, 0.05 s per flush.
+    device.set_readout_params({"flush_row_time": 1e-4})
+
+    no_flush = await camera.measure_exposure_latency(FlushPolicy(), n_samples=2)
+    two_flushes = await camera.measure_exposure_latency(
+        FlushPolicy(nflushes=2),
+        n_samples=2,
+    )
+
+    assert len(two_flushes.samples) == 2
+    assert no_flush.mean < 0.05
+    assert two_flushes.minimum >= 0.1
+
+    # The camera policy is restored.
+    assert device.state["background_flush"] is True
+    assert device.state["exposure_status"] == "idle"
+
+
+@pytest.mark.asyncio
+async def test_bit_depth_8(camera_system, tmp_path):
+    camera = camera_system.cameras[0]
+
+    # The mock camera does not support 8-bit readout so the frames are converted.
+    await camera.set_bit_depth(8)
+    assert camera._device.bit_depth == 16
+
+    exposure = await camera.expose(0.01, write=False)
+    assert exposure.data.dtype == numpy.uint8
+
+    exposure.filename = str(tmp_path / "test-8bit.fits")
+    await exposure.write()
+
+    with fits.open(exposure.filename) as hdul:
+        assert hdul[1].data.dtype == numpy.uint8
+        assert hdul[1].header["BITDEPTH"] == 8
+
+
+@pytest.mark.asyncio
+async def test_check_cameras_concurrent(camera_system, mocker):
+    fli_open = MockLibFLI.FLIOpen
+    fli_get_serial = MockLibFLI.FLIGetSerialString
+    probe_device = LibFLIDevice.probe
+
+    lock = threading.Lock()
+    active = {"open": 0, "init": 0, "probe": 0}
+    max_active = {"open": 0, "init": 0, "probe": 0}
+
+    def track(name, func, *args, delay=0.1):
+        with lock:
+            active[name] += 1
+            max_active[name] = max(max_active[name], active[name])
+        try:
+            time.sleep(delay)
+            return func(*args)
+        finally:
+            with lock:
+                active[name] -= 1
+
+    mocker.patch.object(
+        MockLibFLI,
+        "FLIOpen",
+        lambda self, *args: track("open", fli_open, self, *args, delay=0.02),
+    )
+    mocker.patch.object(
+        MockLibFLI,
+        "FLIGetSerialString",
+        lambda self, *args: track("init", fli_get_serial, self, *args),
+    )
+    mocker.patch.object(
+        LibFLIDevice,
+        "probe",
+        lambda self: track("probe", probe_device, self),
+    )
+
+    for idx in range(4):
+        camera_system.lib.libc.devices.add(
+            MockFLIDevice(f"FLI-{10 + idx}", status_params={"serial": f"ML{idx}"})
+        )
+
+    await camera_system._check_cameras()
+
+    assert len(camera_system.cameras) == 5
+
+    new_cameras = camera_system.cameras[1:]
+    assert all(camera.connected for camera in new_cameras)
+    assert not any(camera._device.is_probed for camera in new_cameras)
+
+    await asyncio.gather(*[camera._probe_task for camera in new_cameras])
+    assert all(camera._device.is_probed for camera in new_cameras)
+
+    # libfli is not thread-safe when opening devices, so the opens never overlap,
+    # but the devices are initialised and probed concurrently.
+    assert max_active["open"] == 1
+    assert max_active["init"] > 1
+    assert max_active["probe"] > 1
+    assert new_cameras[0].get_status()["readout_mode"] == "8 MHz"
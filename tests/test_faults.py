@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: test_faults.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import errno
+import pathlib
+import time
+
+import pytest
+
+from sdsstools import read_yaml_file
+
+from flicamera.lib import FLI_CAMERA_STATUS_EXPOSING, FLIError, LibFLIDevice
+from flicamera.mock import FaultInjector, get_mock_camera_system
+
+
+CONFIG_FILE = pathlib.Path(__file__).parents[1] / "flicamera/etc/flicamera.yaml"
+
+
+@pytest.fixture
+def device(libfli, cameras):
+    """Returns the first camera and its mock device."""
+
+    camera = cameras[0]
+    mock_device = libfli.libc.devices.get(serial=camera.serial)
+
+    yield camera, mock_device
+
+
+def test_fault_injector_latency():
+    faults = FaultInjector(latency={"distribution": "constant", "value": 0.02})
+
+    start_time = time.perf_counter()
+    assert faults.before_call() == 0
+    assert time.perf_counter() - start_time >= 0.02
+
+    faults = FaultInjector(
+        seed=1,
+        latency={"distribution": "uniform", "low": 0.001, "high": 0.002},
+    )
+    assert 0.001 <= faults.get_latency() <= 0.002
+
+    with pytest.raises(ValueError):
+        FaultInjector(latency={"distribution": "bad"})
+
+
+def test_fault_injector_slow_rows():
+    faults = FaultInjector(seed=1, slow_row_probability=0.5, slow_row_delay=0.1)
+
+    delay = faults.get_rows_delay(100)
+
+    assert delay == pytest.approx(faults.counts["slow_rows"] * 0.1)
+    assert 20 < faults.counts["slow_rows"] < 80
+
+
+def test_disconnect(libfli, device):
+    camera, mock_device = device
+    mock_device.set_fault_params({"disconnect_probability": 1, "disconnect_time": 0.2})
+
+    with pytest.raises(FLIError) as err:
+        camera.get_exposure_time_left()
+
+    assert err.value.errno == errno.ENODEV
+    assert err.value.is_disconnect
+    assert mock_device.faults.counts["disconnects"] == 1
+
+    assert camera.name not in libfli.list_cameras()
+
+    mock_device.faults.disconnect_probability = 0
+    time.sleep(0.2)
+
+    assert camera.name in libfli.list_cameras()
+    assert camera.get_exposure_time_left() == 0
+
+
+def test_stuck_exposure(device):
+    camera, mock_device = device
+    mock_device.set_fault_params({"stuck_probability": 1, "stuck_time": 5})
+
+    camera.set_exposure_time(0.01)
+    camera.expose_frame()
+
+    assert camera.get_exposure_time_left() > 0
+    assert camera.get_device_status() == FLI_CAMERA_STATUS_EXPOSING
+
+    # Moves the start of the exposure back to when it would have been unstuck.
+    mock_device.state["exposure_start_time"] -= 5.01
+    assert camera.get_exposure_time_left() == 0
+
+
+def test_stuck_exposure_cancel(device):
+    camera, mock_device = device
+    mock_device.set_fault_params({"stuck_probability": 1, "stuck_time": None})
+
+    camera.set_exposure_time(0)
+    camera.expose_frame()
+
+    time.sleep(0.01)
+    assert camera.get_exposure_time_left() > 0
+
+    camera.cancel_exposure()
+    assert camera.get_exposure_time_left() == 0
+
+
+def test_partial_read(device):
+    camera, mock_device = device
+    mock_device.set_fault_params({"partial_read_probability": 1})
+
+    camera.set_exposure_time(0)
+    camera.expose_frame()
+
+    with pytest.raises(FLIError) as err:
+        camera.read_frame()
+
+    assert err.value.errno == errno.EIO
+    assert err.value.is_transient
+    assert mock_device.image is None
+
+
+async def test_camera_partial_read_retry(camera_system, monkeypatch):
+    camera = camera_system.cameras[0]
+    monkeypatch.setitem(camera.camera_params, "exposure_retries", 1)
+
+    # With this seed the first readout fails and the second one does not.
+    mock_device = camera_system.lib.libc.devices.get(serial=camera.uid)
+    mock_device.set_fault_params({"seed": 2, "partial_read_probability": 0.5})
+
+    exposure = await camera.expose(0.01)
+
+    assert exposure.data.shape == (512, 512)
+    assert mock_device.faults.counts["partial_reads"] == 1
+    assert camera.recovery_stats.n_exposure_retries == 1
+
+
+async def test_faults_profile(monkeypatch):
+    # get_mock_camera_system replaces read_frame for the fast read mode.
+    monkeypatch.setattr(LibFLIDevice, "read_frame", LibFLIDevice.read_frame)
+
+    profile = read_yaml_file(CONFIG_FILE)["simulation"]["profiles"]["faults"]
+
+    devices = {
+        "gfa0": {
+            **profile["devices"]["gfa0"],
+            "exposures": [],
+            "faults": {"stuck_probability": 0.5},
+        }
+    }
+
+    camera_system = await get_mock_camera_system(
+        devices,
+        camera_config={"gfa0": {"uid": "ML0112718", "observatory": "APO"}},
+        faults={**profile["faults"], "disconnect_probability": 0},
+    )
+
+    assert camera_system.lib
+    mock_device = camera_system.lib.libc.devices[0]
+
+    assert mock_device.faults is not None
+    assert mock_device.faults.stuck_probability == 0.5
+    assert mock_device.faults.latency["distribution"] == "lognormal"
+
+    for camera in camera_system.cameras:
+        await camera.disconnect()
+    await camera_system.disconnect()
+
+    LibFLIDevice._instances = {}
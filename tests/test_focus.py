@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_focus.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import numpy
+import pytest
+
+from flicamera.focus import FocusPoint, fit_focus, get_focus_point
+
+from .test_sources import make_frame
+
+
+BEST_FOCUS = 0.3
+
+
+def get_sigma(offset):
+    return float(numpy.hypot(1.2, 4 * (offset - BEST_FOCUS)))
+
+
+def test_get_focus_point():
+    point = get_focus_point(make_frame(sigma=2.0), 0.5, binning=2)
+
+    assert point.offset == 0.5
+    assert point.n_sources == 3
+    assert point.fwhm == pytest.approx(2 * 2.3548 * 2.0, rel=0.1)
+
+    empty = get_focus_point(make_frame(stars=[]), 0.5)
+    assert empty.n_sources == 0
+    assert numpy.isnan(empty.hfd)
+
+
+def test_fit_focus():
+    offsets = numpy.linspace(-0.5, 1.0, 7)
+    points = [FocusPoint(offset, 3, 0.0, 2 + (offset - 0.2) ** 2) for offset in offsets]
+
+    # An outlier and a frame without sources.
+    points[1].hfd = 20.0
+    points.append(FocusPoint(1.5, 0, numpy.nan, numpy.nan))
+
+    result = fit_focus(points, metric="hfd")
+
+    assert result.best_offset == pytest.approx(0.2, abs=1e-3)
+    assert result.best_value == pytest.approx(2.0, abs=1e-3)
+    assert result.n_rejected == 1
+
+    assert fit_focus(points[:2]).best_offset is None
+
+    # The minimum is outside the swept offsets.
+    result = fit_focus([point for point in points if point.offset > 0.3])
+    assert result.coefficients is not None
+    assert result.best_offset is None
+
+    with pytest.raises(ValueError):
+        fit_focus(points, metric="bad")
+
+
+async def test_camera_focus_sweep(camera_system, mocker):
+    camera = camera_system.cameras[0]
+    device = camera._device
+
+    area = device.area
+
+    focus = {"offset": 0.0}
+
+    async def set_focus(offset):
+        focus["offset"] = offset
+
+    def read_frame(out=None):
+        assert (device.hbin, device.vbin) == (2, 2)
+        return make_frame(sigma=get_sigma(focus["offset"]), shape=(256, 256))
+
+    mocker.patch.object(device, "read_frame", side_effect=read_frame)
+    write = mocker.patch("basecam.exposure.Exposure.write")
+
+    offsets = [-0.3, 0.0, 0.3, 0.6, 0.9]
+    result = await camera.focus_sweep(0.01, offsets, set_focus=set_focus)
+
+    assert [point.offset for point in result.points] == offsets
+    assert result.best_offset == pytest.approx(BEST_FOCUS, abs=0.1)
+
+    write.assert_not_called()
+
+    assert (device.hbin, device.vbin) == (1, 1)
+    assert device.area == area
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_hotplug.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from flicamera.hotplug import (
+    FLI_VENDOR_ID,
+    HotplugEvent,
+    HotplugEventSource,
+    get_usb_devices,
+)
+from flicamera.lib import FLIWarning
+from flicamera.mock import MockFLIDevice
+
+
+class FakeEventSource(HotplugEventSource):
+    """An event source that only emits the events we put in it."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = False
+
+    async def start(self):
+        self.started = True
+
+    async def stop(self):
+        self.started = False
+
+
+async def test_hotplug_add_camera(camera_system):
+    source = FakeEventSource()
+    await camera_system.start_hotplug_monitor(source=source, debounce=0.01)
+
+    assert source.started
+    assert camera_system.hotplug_monitor.running
+
+    camera_system.lib.libc.devices.add(
+        MockFLIDevice("FLI-4", status_params={"serial": "ML5678"})
+    )
+    source.put(HotplugEvent("add", FLI_VENDOR_ID, "1-1.2"))
+    await asyncio.sleep(0.1)
+
+    assert len(camera_system.cameras) == 2
+    assert camera_system.get_camera(uid="ML5678")
+
+    await camera_system.stop_hotplug_monitor()
+    assert not source.started
+
+
+async def test_hotplug_ignores_other_vendors(camera_system, mocker):
+    source = FakeEventSource()
+    await camera_system.start_hotplug_monitor(source=source, debounce=0.01)
+
+    check_cameras = mocker.spy(camera_system, "_check_cameras")
+
+    source.put(HotplugEvent("add", "046d", "1-1.3"))
+    await asyncio.sleep(0.1)
+
+    check_cameras.assert_not_called()
+
+    await camera_system.stop_hotplug_monitor()
+
+
+async def test_hotplug_remove_camera(camera_system):
+    source = FakeEventSource()
+    await camera_system.start_hotplug_monitor(source=source, debounce=0.01)
+
+    camera_system.lib.libc.devices = []
+    source.put(HotplugEvent("remove", FLI_VENDOR_ID, "1-1.2"))
+    await asyncio.sleep(0.1)
+
+    assert len(camera_system.cameras) == 0
+
+    await camera_system.stop_hotplug_monitor()
+
+
+async def test_hotplug_fallback(camera_system, mocker):
+    mocker.patch(
+        "flicamera.camera.HotplugMonitor",
+        side_effect=OSError("no inotify"),
+    )
+
+    with pytest.warns(FLIWarning, match="Using camera poller"):
+        await camera_system.start_hotplug_monitor()
+
+    assert camera_system.hotplug_monitor is None
+    assert camera_system._camera_poller.running
+
+    await camera_system.stop_camera_poller()
+
+
+def test_get_usb_devices(tmp_path):
+    (tmp_path / "1-1").mkdir()
+    (tmp_path / "1-1" / "idVendor").write_text("0F18\n")
+    (tmp_path / "1-1:1.0").mkdir()
+
+    assert get_usb_devices(str(tmp_path)) == {"1-1": FLI_VENDOR_ID}
+    assert get_usb_devices(str(tmp_path / "missing")) == {}
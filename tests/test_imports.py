@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_imports.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+import sys
+
+import pytest
+
+import flicamera
+
+
+#: Maximum cumulative time, in seconds, to import the command line interface.
+CLI_IMPORT_BUDGET = 1.5
+
+#: Modules that must not be imported by the command line interface.
+LAZY_MODULES = [
+    "flicamera.mock",
+    "flicamera.actor",
+    "flicamera.camera",
+    "photutils",
+    "astropy.modeling",
+    "astropy.table",
+    "scipy",
+]
+
+
+def run_import(module: str):
+    """Imports a module in a new interpreter and returns the time and modules."""
+
+    code = f"import json, sys, {module}; print(json.dumps(list(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # The last line of -X importtime is the cumulative time, in microseconds, of
+    # the top-level import of the module.
+    match = re.search(rf"\|\s+(\d+)\s+\|\s+{re.escape(module)}$", result.stderr, re.M)
+    assert match
+
+    return int(match.group(1)) / 1e6, json.loads(result.stdout)
+
+
+def test_cli_import_time():
+    import_time, modules = run_import("flicamera.__main__")
+
+    assert [module for module in LAZY_MODULES if module in modules] == []
+    assert import_time < CLI_IMPORT_BUDGET
+
+
+@pytest.mark.parametrize("module", ["flicamera.camera", "flicamera.focus"])
+def test_lazy_modules(module):
+    _, modules = run_import(module)
+
+    assert "flicamera.mock" not in modules
+    assert "photutils" not in modules
+
+
+def test_lazy_attributes():
+    from flicamera.camera import FLICameraSystem
+
+    assert flicamera.FLICameraSystem is FLICameraSystem
+    assert "LibFLI" in dir(flicamera)
+
+    with pytest.raises(AttributeError):
+        flicamera.BadAttribute
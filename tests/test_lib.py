@@ -8,6 +8,7 @@
 
 import time
 
+import numpy
 import pytest
 
 import flicamera.lib
@@ -119,3 +120,163 @@ def test_read_frame(cameras):
     (ul_x, ul_y, lr_x, lr_y) = camera.get_visible_area()
 
     assert image.shape == (lr_y - ul_y, lr_x - ul_x)
+
+
+def test_read_frame_readout_model(cameras):
+    camera = cameras[0]
+    device = camera.libc.devices[0]
+
+    (ul_x, ul_y, lr_x, lr_y) = camera.get_visible_area()
+    n_pixels = (lr_x - ul_x) * (lr_y - ul_y)
+
+    # Model a readout that takes 0.2 seconds for the full frame.
+    device.set_readout_params({"pixel_rate": n_pixels / 0.2, "row_overhead": 0.0})
+
+    camera.set_exposure_time(0.01)
+    camera.start_exposure()
+    time.sleep(0.05)
+
+    expected = device.image.copy()
+
+    t0 = time.perf_counter()
+    image = camera.read_frame()
+    elapsed = time.perf_counter() - t0
+
+    assert elapsed >= 0.2
+    assert (image == expected).all()
+
+
+def test_readout_time_binning(cameras):
+    device = cameras[0].libc.devices[0]
+
+    device.set_readout_params({"pixel_rate": 1e6, "row_overhead": 1e-4})
+    assert device.get_readout_time(512, 512) == pytest.approx(512 * (1e-4 + 512e-6))
+
+    cameras[0].set_binning(2, 2)
+    assert device.get_readout_time(256, 256) == pytest.approx(256 * (2e-4 + 256e-6))
+
+
+def test_read_windows(cameras):
+    camera = cameras[0]
+    device = camera.libc.devices[0]
+
+    (ul_x, ul_y, lr_x, lr_y) = camera.get_visible_area()
+    n_pixels = (lr_x - ul_x) * (lr_y - ul_y)
+    device.set_readout_params({"pixel_rate": n_pixels / 0.2, "row_overhead": 0.0})
+
+    windows = [(10, 20, 42, 52), (100, 40, 132, 72), (200, 300, 216, 316)]
+    camera.set_windows(windows)
+
+    # Two bands (rows 20-72 and 300-316) spanning columns 10 to 216.
+    assert camera.get_frame_shape() == (68, 206)
+    assert camera.get_readout_dimensions()[3] == 68
+
+    camera.set_exposure_time(0.01)
+    camera.start_exposure()
+    time.sleep(0.05)
+
+    expected = device.image.copy()
+
+    t0 = time.perf_counter()
+    frame = camera.read_frame()
+    elapsed = time.perf_counter() - t0
+
+    assert frame.shape == (68, 206)
+    assert elapsed < 0.2
+
+    cutouts = camera.extract_windows(frame)
+    assert [cutout.shape for cutout in cutouts] == [(32, 32), (32, 32), (16, 16)]
+    assert (cutouts[1] == expected[20:52, 90:122]).all()
+
+    camera.clear_windows()
+    assert camera.windows == []
+    assert camera.get_frame_shape() == (lr_y - ul_y, lr_x - ul_x)
+    assert device.vertical_table is None
+
+
+def test_set_windows_invalid(cameras):
+    with pytest.raises(ValueError):
+        cameras[0].set_windows([])
+
+    with pytest.raises(ValueError):
+        cameras[0].set_windows([(0, 0, 10000, 10)])
+
+
+def test_readout_modes(cameras, mocker):
+    camera = cameras[0]
+
+    assert camera.readout_modes == ["8 MHz", "1 MHz"]
+    assert camera.readout_mode_name == "8 MHz"
+
+    camera.set_readout_mode("1 MHz")
+    assert camera.readout_mode == 1
+    assert camera.get_readout_mode() == 1
+
+    with pytest.raises(ValueError):
+        camera.set_readout_mode("4 MHz")
+
+    # The modes are cached by serial.
+    get_mode_string = mocker.spy(camera.libc, "FLIGetCameraModeString")
+    assert camera.get_readout_modes() == ["8 MHz", "1 MHz"]
+    get_mode_string.assert_not_called()
+
+
+def test_read_frame_8bit(cameras):
+    camera = cameras[0]
+    device = camera.libc.devices[0]
+
+    with pytest.raises(flicamera.lib.FLIError):
+        camera.set_bit_depth(8)
+    assert camera.bit_depth == 16
+
+    device.state["supports_8bit"] = True
+    camera.set_bit_depth(8)
+
+    camera.set_exposure_time(0.01)
+    camera.start_exposure()
+    time.sleep(0.05)
+
+    expected = device.image.copy()
+    image = camera.read_frame()
+
+    assert image.dtype == numpy.uint8
+    assert (image == expected >> 8).all()
+
+    with pytest.raises(ValueError):
+        camera.read_frame(out=numpy.empty(image.shape, dtype=numpy.uint16))
+
+
+def test_device_registry(libfli, config):
+    serial = config["cameras"]["FLI-3"]["serial"]
+
+    camera = libfli.get_camera(serial)
+
+    assert libfli.devices.get(serial=serial) is camera
+    assert libfli.devices.get(name=camera.name) is camera
+    assert libfli.devices.get(handle=camera.handle) is camera
+
+    mock_device = libfli.libc.devices.get(name="FLI-3")
+    assert mock_device is not None
+    assert libfli.libc._get_device(camera.dev) is mock_device
+
+
+def test_get_camera_cached(libfli, config, mocker):
+    serial = config["cameras"]["FLI-3"]["serial"]
+
+    camera = libfli.get_camera(serial)
+
+    open_spy = mocker.spy(flicamera.lib.LibFLIDevice, "open")
+    assert libfli.get_camera(serial) is camera
+    open_spy.assert_not_called()
+
+
+def test_registry_prune(libfli, config):
+    serial = config["cameras"]["FLI-3"]["serial"]
+
+    camera = libfli.get_camera(serial)
+    libfli.prune([])
+
+    assert len(libfli.devices) == 0
+    assert libfli.devices.get(serial=serial) is None
+
+    assert libfli.get_camera(serial) is camera
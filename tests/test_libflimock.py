@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_libflimock.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import errno
+import pathlib
+import shutil
+import subprocess
+import threading
+import time
+
+import numpy
+import pytest
+
+from flicamera import FLICameraSystem
+from flicamera.lib import FLIError, LibFLI, LibFLIDevice
+from flicamera.mock import add_libflimock_device, get_libflimock_path
+
+
+SOURCE = pathlib.Path(__file__).parents[1] / "flicamera/cextern/libflimock"
+
+
+@pytest.fixture(scope="session")
+def libflimock_path(tmp_path_factory):
+    """Returns the path to libflimock, compiling it if it was not built."""
+
+    path = get_libflimock_path()
+    if path is not None:
+        return path
+
+    compiler = shutil.which("cc") or shutil.which("gcc")
+    if compiler is None:
+        pytest.skip("libflimock was not built and there is no C compiler.")
+
+    path = str(tmp_path_factory.mktemp("libflimock") / "libflimock.so")
+    subprocess.run(
+        [compiler, "-O3", "-fPIC", "-shared", "-o", path]
+        + [str(SOURCE / "libflimock.c"), "-lm", "-lpthread"],
+        check=True,
+    )
+
+    return path
+
+
+@pytest.fixture
+def libflimock(libflimock_path):
+    lib = LibFLI(libflimock_path)
+    lib.libc.FLIMockReset()
+
+    add_libflimock_device(lib, "FLI-1", "ML0001", shape=(300, 400))
+    add_libflimock_device(lib, "FLI-2", "ML0002", pixel_rate=1e6)
+
+    yield lib
+
+    LibFLIDevice._instances = {}
+    lib.libc.FLIMockReset()
+
+
+def test_libflimock_list(libflimock):
+    assert libflimock.list_cameras() == ["FLI-1", "FLI-2"]
+
+    device = libflimock.get_camera("ML0001")
+    assert device.model == "MicroLine ML50100"
+    assert device.get_visible_area() == (0, 0, 400, 300)
+    assert device.readout_modes == ["8 MHz", "1 MHz"]
+
+    assert libflimock.get_camera("BADSERIAL") is None
+
+
+def test_libflimock_read_frame(libflimock):
+    device = libflimock.get_camera("ML0001")
+
+    device.set_binning(2, 2)
+    device.set_exposure_time(0.05)
+    device.expose_frame()
+
+    assert device.get_exposure_time_left() > 0
+    with pytest.raises(FLIError):
+        device.read_frame()
+
+    time.sleep(0.06)
+    frame = device.read_frame()
+
+    assert frame.shape == (150, 200)
+    assert frame.dtype == numpy.uint16
+    assert numpy.median(frame) == pytest.approx(1000, abs=5)
+
+    # There is a star every 128 pixels, starting at 64.
+    assert frame[32, 32] > 3000
+
+
+def test_libflimock_readout_time(libflimock):
+    device = libflimock.get_camera("ML0002")
+
+    device.set_exposure_time(0)
+    device.expose_frame()
+
+    start_time = time.perf_counter()
+    frame = device.read_frame()
+
+    # 512x512 pixels at 1 Mpix/s.
+    assert time.perf_counter() - start_time >= 0.26
+    assert frame.shape == (512, 512)
+
+
+def test_libflimock_windows(libflimock):
+    device = libflimock.get_camera("ML0002")
+
+    device.set_windows([(0, 10, 100, 50), (0, 200, 100, 230)])
+    device.set_exposure_time(0)
+    device.expose_frame()
+
+    frame = device.read_frame()
+    windows = device.extract_windows(frame)
+
+    assert [window.shape for window in windows] == [(40, 100), (30, 100)]
+
+
+def test_libflimock_errors(libflimock):
+    device = libflimock.get_camera("ML0001")
+
+    with pytest.raises(FLIError) as err:
+        device.set_bit_depth(8)
+    assert err.value.errno == errno.EINVAL
+
+    with pytest.raises(ValueError):
+        device.set_readout_mode("bad")
+
+    device.set_readout_mode("1 MHz")
+    assert device.get_readout_mode() == 1
+
+
+def test_libflimock_remove_while_reading(libflimock):
+    device = libflimock.get_camera("ML0002")
+
+    device.set_exposure_time(0)
+    device.expose_frame()
+
+    errors = []
+
+    def read_frame():
+        try:
+            device.read_frame()
+        except FLIError as err:
+            errors.append(err)
+
+    thread = threading.Thread(target=read_frame)
+    thread.start()
+
+    # The device is removed mid-readout but not freed while it is being read.
+    time.sleep(0.1)
+    libflimock.libc.FLIMockRemoveDevice(b"FLI-2")
+    thread.join()
+
+    assert all(err.errno == errno.ENXIO for err in errors)
+
+    with pytest.raises(FLIError) as err:
+        device.get_exposure_time_left()
+    assert err.value.errno == errno.ENXIO
+
+
+async def test_libflimock_camera_system(libflimock, tmp_path):
+    camera_system = FLICameraSystem(simulation_mode=True)
+    camera_system.lib = libflimock
+
+    camera = await camera_system.add_camera(uid="ML0001", observatory="APO")
+    exposure = await camera.expose(0.01, filename=str(tmp_path / "mock.fits"))
+
+    assert exposure.data.shape == (300, 400)
+
+    await camera.disconnect()
+    await camera_system.disconnect()
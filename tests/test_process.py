@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_process.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import errno
+import os
+import pickle
+from functools import partial
+
+import numpy
+import pytest
+
+from flicamera.lib import FLIError, FLIWarning, LibFLIDevice
+from flicamera.mock import get_mock_camera_system, get_mock_lib
+from flicamera.process import ProcessDevice
+
+
+DEVICES = {"FLI-1": {"uid": "ML1234", "params": {"serial": "ML1234"}}}
+
+
+@pytest.fixture
+async def camera_system(tmp_path):
+    camera_system = await get_mock_camera_system(
+        DEVICES,
+        camera_config={
+            "FLI-1": {
+                "uid": "ML1234",
+                "observatory": "APO",
+                "write_snapshot": False,
+            }
+        },
+        process_isolation=True,
+    )
+
+    yield camera_system
+
+    for camera in camera_system.cameras:
+        await camera.disconnect()
+
+    await camera_system.disconnect()
+
+    LibFLIDevice._instances = {}
+
+
+def test_fli_error_pickle():
+    error = pickle.loads(pickle.dumps(FLIError("no device", errno.ENODEV)))
+
+    assert str(error) == "no device"
+    assert error.is_disconnect
+
+
+def test_process_device():
+    device = ProcessDevice("ML1234", partial(get_mock_lib, DEVICES), timeout=30)
+    device.open()
+
+    assert device.running
+    assert device._process is not None and device._process.pid != os.getpid()
+    assert device.name == "FLI-1"
+    assert device.area == (0, 0, 512, 512)
+
+    device.set_binning(2, 2)
+    assert device.get_frame_shape() == (256, 256)
+
+    device.disconnect()
+    assert not device.running
+
+
+def test_process_device_not_found():
+    device = ProcessDevice("ML9999", partial(get_mock_lib, DEVICES), timeout=30)
+
+    with pytest.raises(FLIError) as err:
+        device.open()
+
+    assert err.value.is_disconnect
+    assert not device.running
+
+
+async def test_process_camera_expose(camera_system):
+    assert len(camera_system.cameras) == 1
+
+    camera = camera_system.cameras[0]
+    assert isinstance(camera._device, ProcessDevice)
+
+    exposure = await camera.expose(0.01, write=False)
+
+    assert isinstance(exposure.data, numpy.ndarray)
+    assert exposure.data.shape == (512, 512)
+    assert exposure.data.mean() > 0
+
+
+async def test_process_camera_crash(camera_system):
+    camera = camera_system.cameras[0]
+
+    # A dead device process is reported as a disconnect and restarted.
+    camera._device._process.kill()
+    camera._device._process.join()
+
+    with pytest.warns(FLIWarning, match="Camera disconnected"):
+        await camera.update_status()
+
+    status = await camera.update_status()
+
+    assert status and status["health"] == "ok"
+    assert camera.recovery_stats.n_recoveries == 1
+    assert camera._device.running
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_publisher.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import os
+
+import numpy
+import pytest
+
+from basecam.events import CameraEvent
+
+from flicamera.publisher import FramePublisher, FrameSubscriber
+
+
+@pytest.fixture
+def publisher():
+    publisher = FramePublisher(f"flicamera-test-{os.getpid()}", 100 * 100 * 2, 2)
+
+    yield publisher
+
+    publisher.close()
+
+
+def test_publish_frame(publisher):
+    data = numpy.arange(100 * 100, dtype=numpy.uint16).reshape(100, 100)
+    slot, sequence = publisher.publish(data, {"EXPTIME": 1.0, "IMAGETYP": "object"})
+
+    assert (slot, sequence) == (0, 1)
+
+    subscriber = FrameSubscriber(publisher.name)
+    frame = subscriber.latest()
+
+    assert frame is not None
+    assert frame.sequence == 1
+    assert frame.header == {"EXPTIME": 1.0, "IMAGETYP": "object"}
+    assert frame.data.dtype == numpy.uint16
+    numpy.testing.assert_array_equal(frame.data, data)
+
+    del frame
+    subscriber.close()
+
+
+def test_publish_ring_wraps(publisher):
+    subscriber = FrameSubscriber(publisher.name)
+    assert subscriber.latest() is None
+
+    first = None
+    for value in range(3):
+        publisher.publish(numpy.full((10, 20), value, dtype=numpy.uint16))
+        if value == 0:
+            first = subscriber.latest()
+
+    assert first is not None
+    assert not subscriber.is_valid(first)
+
+    frame = subscriber.read(0)
+    assert frame is not None
+    assert frame.sequence == 3
+    assert frame.data.shape == (10, 20)
+    assert numpy.all(frame.data == 2)
+
+    del first, frame
+    subscriber.close()
+
+
+def test_publish_too_large(publisher):
+    with pytest.raises(ValueError):
+        publisher.publish(numpy.zeros((200, 200), dtype=numpy.uint16))
+
+
+@pytest.mark.asyncio
+async def test_camera_publish_frame(camera_system, mocker):
+    camera = camera_system.cameras[0]
+    camera.camera_params["publish_frames"] = True
+
+    notify = mocker.spy(camera, "notify")
+
+    exposure = await camera.expose(0.1)
+
+    assert camera.frame_publisher is not None
+    notify.assert_any_call(
+        CameraEvent.EXPOSURE_READ,
+        {"frame_ring": camera.frame_publisher.name, "slot": 0, "sequence": 1},
+    )
+
+    subscriber = FrameSubscriber(camera.frame_publisher.name)
+    frame = subscriber.latest()
+
+    assert frame is not None
+    assert frame.header["CAMNAME"] == "FLI-3"
+    numpy.testing.assert_array_equal(frame.data, exposure.data)
+
+    del frame
+    subscriber.close()
+
+    await camera.disconnect()
+    assert camera.frame_publisher is None
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: test_replay.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import time
+
+import numpy
+import pytest
+from astropy.io import fits
+
+from flicamera.mock import FrameCache
+
+
+@pytest.fixture
+def frames(tmp_path):
+    """Writes compressed frames, each filled with its index times 100."""
+
+    files = []
+    for ii in range(5):
+        data = numpy.full((512, 512), ii * 100, dtype=numpy.uint16)
+        hdu = fits.CompImageHDU(data, compression_type="GZIP_2")
+
+        filename = tmp_path / f"frame-{ii:02d}.fits.gz"
+        fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(filename)
+        files.append(str(filename))
+
+    return files
+
+
+def wait_prefetch(cache: FrameCache, n_frames: int, timeout: float = 5):
+    start_time = time.time()
+    while len(cache._frames) < n_frames and time.time() - start_time < timeout:
+        time.sleep(0.01)
+
+
+def test_frame_cache(frames):
+    cache = FrameCache(frames, prefetch=2)
+
+    assert cache.get(0)[0, 0] == 0
+    assert cache.n_misses == 1
+
+    wait_prefetch(cache, 3)
+    assert sorted(cache._frames) == [0, 1, 2]
+
+    assert cache.get(1)[0, 0] == 100
+    assert cache.n_hits == 1
+
+    # Frames are replayed cyclically and old frames are evicted.
+    cache.get(4)
+    wait_prefetch(cache, 3)
+    assert sorted(cache._frames) == [0, 1, 4]
+
+    cache.close()
+    assert cache._thread is None
+
+
+def test_frame_cache_no_prefetch(frames):
+    cache = FrameCache(frames, prefetch=0)
+
+    assert cache.get(2)[0, 0] == 200
+    assert cache._thread is None
+
+
+def test_frame_cache_dir(frames, tmp_path):
+    cache = FrameCache(frames, prefetch=0, cache_dir=tmp_path / "cache")
+    cache.warm()
+
+    assert len(list((tmp_path / "cache").glob("*.npy"))) == 5
+
+    frame = cache.get(3)
+    assert isinstance(frame, numpy.memmap)
+    assert frame.dtype == numpy.uint16
+    assert frame[10, 10] == 300
+
+
+def test_frame_cache_errors(frames, tmp_path):
+    with pytest.raises(ValueError):
+        FrameCache([])
+
+    with pytest.raises(ValueError):
+        FrameCache(frames).warm()
+
+    bad_file = tmp_path / "bad.fits"
+    fits.PrimaryHDU().writeto(bad_file)
+
+    cache = FrameCache([str(bad_file)] + frames, prefetch=1)
+    with pytest.raises(ValueError):
+        cache.get(0)
+
+    assert cache.get(1)[0, 0] == 0
+    cache.close()
+
+
+async def test_camera_replay(camera_system, frames, tmp_path):
+    camera = camera_system.cameras[0]
+    device = camera_system.lib.libc.devices[0]
+
+    device.set_exposure_params(
+        {
+            "files": str(tmp_path / "frame-*.fits.gz"),
+            "prefetch": 2,
+        }
+    )
+    assert device.replay is not None
+
+    for ii in range(6):
+        exposure = await camera.expose(0.01)
+        assert exposure.data[0, 0] == (ii % 5) * 100
+
+    assert device.replay.n_hits > 0
+
+    device.set_exposure_params([])
+    assert device.replay is None
+
+    with pytest.raises(ValueError):
+        device.set_exposure_params(str(tmp_path / "missing-*.fits"))
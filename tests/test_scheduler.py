@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_scheduler.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+import numpy
+import pytest
+
+from flicamera.scheduler import DEFAULT_BUS, ReadoutScheduler, get_usb_bus
+
+
+def test_get_usb_bus(tmp_path):
+    assert get_usb_bus("/dev/bus/usb/003/005") == "3"
+    assert get_usb_bus("FLI-3", sysfs_paths=[str(tmp_path)]) is None
+
+    interface = tmp_path / "devices/pci0000:00/0000:00:14.0/usb2/2-1/2-1:1.0"
+    interface.mkdir(parents=True)
+
+    (tmp_path / "usbmisc/fliusb0").mkdir(parents=True)
+    os.symlink(interface, tmp_path / "usbmisc/fliusb0/device")
+
+    assert get_usb_bus("/dev/fliusb0", sysfs_paths=[str(tmp_path / "usbmisc")]) == "2"
+
+
+def test_get_limit():
+    scheduler = ReadoutScheduler({"default": 2, 3: 1})
+
+    assert scheduler.get_limit("3") == 1
+    assert scheduler.get_limit("1") == 2
+
+    assert ReadoutScheduler().get_limit("1") is None
+
+    with pytest.raises(ValueError):
+        ReadoutScheduler(0).get_limit("1")
+
+
+@pytest.mark.parametrize("max_concurrent,expected", [(1, 1), (None, 3)])
+async def test_readout_concurrency(max_concurrent, expected):
+    scheduler = ReadoutScheduler(max_concurrent)
+
+    active = 0
+    max_active = 0
+
+    async def read():
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.05)
+        active -= 1
+        return numpy.zeros((100, 100), dtype=numpy.uint16)
+
+    await asyncio.gather(*[scheduler.readout("1", read) for _ in range(3)])
+
+    assert max_active == expected
+
+    stats = scheduler.get_stats()["1"]
+    assert stats.n_readouts == 3
+    assert stats.n_bytes == 3 * 100 * 100 * 2
+    assert stats.last_burst_readouts == 3
+    assert stats.bandwidth > 0
+
+    if max_concurrent == 1:
+        assert stats.last_burst_time >= 0.15
+
+
+async def test_camera_readout_scheduler(camera_system):
+    camera = camera_system.cameras[0]
+    assert camera.usb_bus == DEFAULT_BUS
+
+    await camera.expose(0.01, write=False)
+
+    stats = camera_system.readout_scheduler.get_stats()[DEFAULT_BUS]
+    assert stats.n_readouts == 1
+    assert stats.n_bytes == 512 * 512 * 2
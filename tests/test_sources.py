@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_sources.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import numpy
+import pytest
+from astropy.io import fits
+
+from flicamera.sources import (
+    estimate_background,
+    extract_sources,
+    extract_sources_tiled,
+)
+
+
+STARS = [(100.3, 200.7, 20000.0), (400.5, 300.2, 5000.0), (250.0, 250.0, 50000.0)]
+
+
+def make_frame(stars=STARS, sigma=2.0, shape=(512, 512)):
+    rng = numpy.random.default_rng(1)
+
+    yy, xx = numpy.mgrid[: shape[0], : shape[1]]
+    data = rng.normal(1000, 15, shape) + 0.1 * xx
+
+    for x, y, flux in stars:
+        r2 = (xx - x) ** 2 + (yy - y) ** 2
+        data += flux / (2 * numpy.pi * sigma**2) * numpy.exp(-r2 / (2 * sigma**2))
+
+    return data.astype(numpy.uint16)
+
+
+def test_estimate_background():
+    background, rms = estimate_background(make_frame(stars=[]), box_size=64)
+
+    assert background.shape == (512, 512)
+    assert background[0, 0] == pytest.approx(1003, abs=2)
+    assert background[0, -1] == pytest.approx(1048, abs=2)
+    assert rms == pytest.approx(15, rel=0.1)
+
+
+def test_extract_sources():
+    sources = extract_sources(make_frame())
+
+    assert len(sources) == 3
+
+    # Sorted by flux.
+    for source, (x, y, flux) in zip(sources, sorted(STARS, key=lambda s: -s[2])):
+        assert source["x"] == pytest.approx(x, abs=0.2)
+        assert source["y"] == pytest.approx(y, abs=0.2)
+        assert source["flux"] == pytest.approx(flux, rel=0.05)
+        assert source["fwhm"] == pytest.approx(2.3548 * 2.0, rel=0.1)
+
+    assert len(extract_sources(make_frame(), max_sources=1)) == 1
+    assert len(extract_sources(make_frame(stars=[]))) == 0
+
+
+async def test_camera_sources(camera_system, tmp_path, mocker):
+    camera = camera_system.cameras[0]
+    camera.camera_params["extract_sources"] = True
+
+    notify = mocker.spy(camera, "notify")
+    mocker.patch.object(camera._device, "read_frame", return_value=make_frame())
+
+    exposure = await camera.expose(0.01, write=False)
+
+    assert len(exposure.sources) == 3
+
+    payloads = [call.args[1] for call in notify.call_args_list if len(call.args) > 1]
+    sources = [payload["sources"] for payload in payloads if "sources" in payload]
+    assert sources[0]["n_sources"] == 3
+    assert sources[0]["x"][0] == pytest.approx(250.0, abs=0.1)
+
+    exposure.filename = str(tmp_path / "test-sources.fits")
+    await exposure.write()
+
+    with fits.open(exposure.filename) as hdul:
+        assert hdul["SOURCES"].data["x"][0] == pytest.approx(250.0, abs=0.1)
+
+
+def test_extract_sources_tiled():
+    stars = [(x + 0.3, y + 0.6, 8000.0) for x in range(40, 500, 60) for y in (60, 250)]
+    data = make_frame(stars=stars, sigma=1.5)
+
+    sources = extract_sources_tiled(data, tile_size=256, overlap=16, n_threads=4)
+    expected = extract_sources(data)
+
+    # Stars in the overlap of two tiles are only counted once.
+    assert len(sources) == len(stars)
+    numpy.testing.assert_allclose(
+        numpy.sort(sources["x"]),
+        numpy.sort(expected["x"]),
+        atol=0.05,
+    )
+
+
+async def test_camera_centroids(camera_system, tmp_path, mocker):
+    camera = camera_system.cameras[0]
+    camera.camera_params["extract_centroids"] = True
+
+    notify = mocker.spy(camera, "notify")
+    mocker.patch.object(camera._device, "read_frame", return_value=make_frame())
+
+    filename = tmp_path / "fvc-0001.fits"
+    exposure = await camera.expose(0.01, filename=str(filename), write=False)
+
+    assert len(exposure.centroids) == 3
+
+    payloads = [call.args[1] for call in notify.call_args_list if len(call.args) > 1]
+    centroids = [payload["centroids"] for payload in payloads if "centroids" in payload]
+    assert centroids[0]["n_centroids"] == 3
+    assert centroids[0]["filename"] == str(tmp_path / "fvc-0001-centroids.fits")
+
+    catalogue = fits.getdata(tmp_path / "fvc-0001-centroids.fits", "CENTROIDS")
+    assert catalogue["x"][0] == pytest.approx(250.0, abs=0.1)
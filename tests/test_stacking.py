@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_stacking.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import numpy
+import pytest
+from astropy.io import fits
+
+from basecam import CameraEvent
+
+from flicamera.stacking import Stacker, get_reducer, sigclip
+
+
+def make_frames(n_frames, shape=(64, 64)):
+    rng = numpy.random.default_rng(2)
+    return rng.normal(1000, 20, (n_frames, *shape)).astype(numpy.uint16)
+
+
+@pytest.mark.parametrize(
+    "reducer,function",
+    [("sum", numpy.sum), ("mean", numpy.mean), ("median", numpy.median)],
+)
+def test_stacker(reducer, function):
+    frames = make_frames(5)
+
+    stacker = Stacker(5, reducer)
+    for frame in frames:
+        stacker.add(frame)
+
+    result = stacker.result()
+
+    assert stacker.function is function
+    numpy.testing.assert_allclose(result, function(frames, axis=0), rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        stacker.add(frames[0])
+
+
+def test_stacker_sum_dtype():
+    frames = numpy.full((3, 8, 8), 60000, dtype=numpy.uint16)
+
+    stacker = Stacker(3, "sum")
+    for frame in frames:
+        stacker.add(frame)
+
+    assert stacker.result().dtype == numpy.uint32
+    assert stacker.result()[0, 0] == 180000
+
+
+def test_stacker_remedian():
+    frames = make_frames(30)
+
+    stacker = Stacker(30, "median", median_base=3)
+    for frame in frames:
+        stacker.add(frame)
+
+    # No more than median_base frames are kept per level.
+    assert all(len(level) < 3 for level in stacker._levels)
+
+    result = stacker.result()
+    exact = numpy.median(frames, axis=0)
+
+    assert numpy.median(numpy.abs(result - exact)) < 5
+
+
+def test_stacker_sigclip():
+    frames = make_frames(10)
+
+    # Cosmic rays in a frame used to initialise the stack and in a later one.
+    frames[2, 5, 5] = 60000
+    frames[7, 10, 20] = 60000
+
+    stacker = Stacker(10, "sigclip", n_init=5)
+    for frame in frames:
+        stacker.add(frame)
+
+    result = stacker.result()
+
+    assert stacker.n_rejected >= 2
+    assert result[5, 5] == pytest.approx(1000, abs=30)
+    assert result[10, 20] == pytest.approx(1000, abs=30)
+
+    clipped = sigclip(frames)
+    assert numpy.median(numpy.abs(result - clipped)) < 5
+
+
+def test_get_reducer():
+    assert get_reducer("sigclip") == "sigclip"
+    assert get_reducer(numpy.mean) == "mean"
+    assert get_reducer(numpy.max) is None
+
+    with pytest.raises(ValueError):
+        get_reducer("bad")
+
+
+@pytest.mark.parametrize("stack_function", ["mean", "sum", "median"])
+async def test_camera_stack(camera_system, tmp_path, mocker, stack_function):
+    camera = camera_system.cameras[0]
+
+    expose = mocker.spy(camera._device, "expose_frame")
+    expose_stack = mocker.spy(camera, "_expose_stack")
+    notify = mocker.spy(camera_system.notifier, "notify")
+
+    filename = tmp_path / "stack.fits"
+    exposure = await camera.expose(
+        0.01,
+        stack=3,
+        stack_function=stack_function,
+        filename=str(filename),
+        write=True,
+    )
+
+    assert expose.call_count == 3
+    assert expose_stack.call_count == 1
+    assert exposure.stack == 3
+
+    header = fits.getheader(filename, 1)
+    assert header["STACK"] == 3
+    assert header["STACKFUN"] == stack_function
+    assert header["EXPTIMEN"] == pytest.approx(0.03)
+
+    integrating = [
+        call.args[1]
+        for call in notify.call_args_list
+        if call.args[0] == CameraEvent.EXPOSURE_INTEGRATING
+    ]
+    assert [payload["n_stack"] for payload in integrating] == [3, 3, 3]
+    assert [payload["current_stack"] for payload in integrating] == [1, 2, 3]
+
+
+@pytest.mark.parametrize("stack_function", [numpy.max, numpy.median, numpy.mean])
+async def test_camera_stack_basecam(camera_system, mocker, stack_function):
+    camera = camera_system.cameras[0]
+
+    expose_stack = mocker.spy(camera, "_expose_stack")
+
+    # Callables, even with a reducer, are stacked by basecam.
+    exposure = await camera.expose(0.01, stack=2, stack_function=stack_function)
+
+    assert expose_stack.call_count == 0
+    assert exposure.stack == 2
+    assert exposure.stack_function is stack_function
+    assert exposure.data is not None
+
+
+async def test_camera_stack_single(camera_system):
+    camera = camera_system.cameras[0]
+
+    exposure = await camera.expose(0.01, stack=1, stack_function="median")
+
+    assert exposure.stack == 1
+    assert exposure.stack_function is numpy.median
+    assert exposure.data is not None
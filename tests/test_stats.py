@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_stats.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import numpy
+import pytest
+from astropy.io import fits
+
+from basecam.events import CameraEvent
+
+from flicamera import stats as stats_module
+from flicamera.stats import get_frame_stats
+
+
+@pytest.mark.parametrize("dtype", [numpy.uint16, numpy.uint8, numpy.float32])
+def test_frame_stats(dtype, monkeypatch):
+    # Forces several chunks.
+    monkeypatch.setattr(stats_module, "CHUNK_SIZE", 1000)
+
+    rng = numpy.random.default_rng(42)
+    data = rng.normal(100, 20, (300, 200)).astype(dtype)
+    data[10, 10:15] = 255 if dtype == numpy.uint8 else 65535
+
+    stats = get_frame_stats(data, saturation=250)
+
+    assert stats.mean == pytest.approx(data.mean(dtype=numpy.float64), abs=1e-3)
+    assert stats.minimum == data.min()
+    assert stats.maximum == data.max()
+    assert stats.n_saturated == 5
+
+    expected = numpy.percentile(data, [50, 5, 95], method="inverted_cdf")
+    assert (stats.median, stats.p05, stats.p95) == tuple(expected)
+
+    assert stats.background == stats.median
+    assert stats.background_rms == pytest.approx(20, rel=0.1)
+
+
+def test_frame_stats_saturation_default():
+    data = numpy.full((10, 10), 65535, dtype=numpy.uint16)
+
+    assert get_frame_stats(data).n_saturated == 100
+
+
+async def test_camera_frame_stats(camera_system, tmp_path, mocker):
+    camera = camera_system.cameras[0]
+    notify = mocker.spy(camera, "notify")
+
+    exposure = await camera.expose(0.01, write=False)
+
+    stats = exposure.frame_stats
+    assert stats.median == numpy.percentile(exposure.data, 50, method="inverted_cdf")
+
+    events = [call.args for call in notify.call_args_list]
+    assert (
+        CameraEvent.EXPOSURE_POST_PROCESS_DONE,
+        {"frame_stats": stats.__dict__},
+    ) in events
+
+    exposure.filename = str(tmp_path / "test-stats.fits")
+    await exposure.write()
+
+    header = fits.getheader(exposure.filename, 1)
+    assert header["DATAMED"] == stats.median
+    assert header["BKGRMS"] == stats.background_rms
+    assert header["NSATUR"] == stats.n_saturated
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_video.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy
+import pytest
+
+from flicamera.lib import FLIError
+
+
+def test_grab_video_frame(cameras):
+    camera = cameras[0]
+
+    with pytest.raises(FLIError):
+        camera.grab_video_frame()
+
+    camera.set_exposure_time(0.01)
+    camera.start_video()
+    assert camera.video_mode
+
+    frame = camera.grab_video_frame()
+    assert frame.shape == camera.get_frame_shape()
+    assert frame.mean() > 0
+
+    camera.stop_video()
+    assert not camera.video_mode
+
+
+@pytest.mark.asyncio
+async def test_video_stream(camera_system):
+    camera = camera_system.cameras[0]
+
+    async with camera.video(0.01, max_frames=5) as stream:
+        assert camera.video_stream is stream
+
+        frames = []
+        async for frame in stream:
+            assert isinstance(frame.data, numpy.ndarray)
+            frames.append(frame.index)
+
+    assert frames == [0, 1, 2, 3, 4]
+    assert stream.stats.n_delivered == 5
+    assert stream.stats.frame_rate > 0
+
+    assert camera.video_stream is None
+    assert not camera._device.video_mode
+
+
+@pytest.mark.asyncio
+async def test_video_stream_decimate(camera_system):
+    camera = camera_system.cameras[0]
+
+    async with camera.video(0.01, decimate=3, max_frames=3) as stream:
+        frames = [frame.index async for frame in stream]
+
+    assert frames == [0, 3, 6]
+
+
+@pytest.mark.asyncio
+async def test_video_stream_drops(camera_system):
+    camera = camera_system.cameras[0]
+
+    async with camera.video(0.01, n_buffers=1, max_frames=2) as stream:
+        async for _ in stream:
+            # The only buffer is in use so the camera frames are dropped.
+            await asyncio.sleep(0.1)
+
+    assert stream.stats.n_delivered == 2
+    assert stream.stats.n_dropped > 0
+
+
+async def test_video_stream_bit_depth_8(camera_system):
+    camera = camera_system.cameras[0]
+
+    # The mock camera does not support 8-bit readout so the frames are converted.
+    await camera.set_bit_depth(8)
+    assert camera._device.bit_depth == 16
+
+    async with camera.video(0.01, max_frames=2) as stream:
+        async for frame in stream:
+            assert frame.data.dtype == numpy.uint8
+            assert frame.data.shape == camera._device.get_frame_shape()
+            assert frame.data.max() > 0
+
+
+async def test_video_stream_stop_wakes_consumer(camera_system):
+    camera = camera_system.cameras[0]
+
+    stream = camera.video(1.0)
+    await stream.start()
+
+    async def consume():
+        return [frame.index async for frame in stream]
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0.05)
+
+    await stream.stop()
+
+    assert await asyncio.wait_for(consumer, timeout=5) == []
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_worker.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from flicamera.worker import DeviceWorker, Priority
+
+
+pytestmark = [pytest.mark.asyncio]
+
+
+@pytest.fixture
+async def worker():
+    worker = DeviceWorker("test")
+    worker.start()
+
+    yield worker
+
+    await worker.stop()
+
+
+async def test_worker_call(worker):
+    assert await worker.call(sum, [1, 2, 3]) == 6
+
+
+async def test_worker_thread(worker):
+    thread_name = await worker.call(lambda: threading.current_thread().name)
+    assert thread_name == "flicamera-test"
+
+
+async def test_worker_exception(worker):
+    def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        await worker.call(fail)
+
+
+async def test_worker_priority(worker):
+    order = []
+
+    # Block the worker so that the following calls are queued.
+    blocker = asyncio.create_task(worker.call(time.sleep, 0.1))
+    await asyncio.sleep(0.01)
+
+    await asyncio.gather(
+        worker.call(order.append, "status", priority=Priority.STATUS),
+        worker.call(order.append, "control", priority=Priority.CONTROL),
+        worker.call(order.append, "readout", priority=Priority.READOUT),
+    )
+
+    await blocker
+
+    assert order == ["readout", "control", "status"]
+
+
+async def test_worker_does_not_block_loop(worker):
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    await worker.call(time.sleep, 0.2)
+    ticker.cancel()
+
+    assert ticks > 5
+
+
+async def test_worker_not_running():
+    worker = DeviceWorker("stopped")
+
+    with pytest.raises(RuntimeError):
+        await worker.call(sum, [1])